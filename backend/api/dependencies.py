@@ -1,30 +1,15 @@
 # backend/api/dependencies.py
 from fastapi import Depends, HTTPException, Request
-from firebase_admin import auth, credentials, initialize_app
-import firebase_admin
 from typing import Dict, Any
-from pymongo import MongoClient
-import os
+from ..auth.token_cache import verify_firebase_token
+from ..crewai.orchestrator.runtime import get_orchestrator as get_active_orchestrator
 
-# Initialize Firebase Admin SDK
-cred = credentials.Certificate(os.getenv("FIREBASE_ADMIN_SDK_PATH"))
-try:
-    firebase_app = initialize_app(cred)
-except ValueError:
-    # App already initialized
-    firebase_app = firebase_admin.get_app()
-
-# MongoDB connection
-mongodb_client = MongoClient(os.getenv("MONGODB_URI"))
-
-def get_mongodb_client():
-    """Dependency to get MongoDB client"""
-    return mongodb_client
+# Firebase Admin is initialized lazily (see auth/firebase.py) rather than on import
 
 async def verify_token(token: str) -> str:
     """Verify Firebase ID token and return user ID"""
     try:
-        decoded_token = auth.verify_id_token(token)
+        decoded_token = await verify_firebase_token(token)
         return decoded_token["uid"]
     except Exception as e:
         raise HTTPException(
@@ -45,10 +30,20 @@ async def get_current_user(request: Request) -> Dict[str, Any]:
     token = authorization.split("Bearer ")[1]
     
     try:
-        decoded_token = auth.verify_id_token(token)
+        decoded_token = await verify_firebase_token(token)
         return decoded_token
     except Exception as e:
         raise HTTPException(
             status_code=401,
             detail=f"Invalid authentication token: {str(e)}"
         )
+
+def get_orchestrator():
+    """Dependency returning the task orchestrator the app bound at startup"""
+    orchestrator = get_active_orchestrator()
+    if orchestrator is None:
+        raise HTTPException(
+            status_code=503,
+            detail="Task orchestrator is not available"
+        )
+    return orchestrator
@@ -1,10 +1,10 @@
 # backend/api/routes/agent_routes.py
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from pydantic import BaseModel
-from firebase_admin import auth
 from ..dependencies import get_orchestrator, get_current_user
 from ...crewai.orchestrator.task_manager import TaskOrchestrator
+from ...crewai.orchestrator.job_queue import QueueFullError
 
 router = APIRouter()
 
@@ -18,6 +18,7 @@ class TaskRequest(BaseModel):
 class TaskResponse(BaseModel):
     task_id: str
     status: str
+    queue_position: Optional[int] = None
 
 class TaskStatusResponse(BaseModel):
     task_id: str
@@ -41,10 +42,15 @@ async def create_task(
         "user_email": current_user["email"]
     }
     
-    # Start task execution asynchronously
-    task_id = await orchestrator.execute_async_task(task_input)
-    
-    return {"task_id": task_id, "status": "in_progress"}
+    # Queue task execution; reject with 429 when the worker pool is saturated
+    try:
+        return await orchestrator.execute_async_task(task_input)
+    except QueueFullError as e:
+        raise HTTPException(
+            status_code=429,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)}
+        )
 
 @router.get("/tasks/{task_id}/status", response_model=TaskStatusResponse)
 async def get_task_status(
@@ -58,26 +64,9 @@ async def get_task_status(
     if status["status"] == "unknown":
         raise HTTPException(status_code=404, detail=f"Task with ID {task_id} not found")
     
-    # If task is completed, get the full result
-    result = None
-    if status["status"] == "completed":
-        memories = await orchestrator.cat_client.memory.recall_memories(
-            query="",
-            filters={
-                "type": "task_result",
-                "task_id": task_id
-            },
-            limit=1
-        )
-        if memories:
-            try:
-                result = eval(memories[0]["content"])  # Convert string representation back to dict
-            except:
-                result = {"content": memories[0]["content"]}
-    
     return {
         "task_id": task_id,
         "status": status["status"],
         "details": status.get("details", ""),
-        "result": result
-    }
\ No newline at end of file
+        "result": status.get("result")
+    }
@@ -2,9 +2,11 @@
 from fastapi import APIRouter, Depends, HTTPException
 from typing import Dict, Any, List, Optional
 from pydantic import BaseModel
-from ..dependencies import get_current_user, get_mongodb_client
-from pymongo import MongoClient
-from bson import ObjectId
+from datetime import datetime
+from ..dependencies import get_current_user
+from ...db.repositories.user_repository import UserRepository
+from ...db.repositories.learning_style_repository import LearningStyleRepository
+from ...db.repositories.curriculum_repository import CurriculumRepository
 
 router = APIRouter()
 
@@ -27,6 +29,21 @@ class CurriculumCreate(BaseModel):
     modules: List[Dict[str, Any]]
     recommendations: List[str] = []
 
+class LearningStyleBatchItem(LearningStyle):
+    user_id: str
+
+class CurriculumBatchItem(CurriculumCreate):
+    user_id: str
+
+class LearningStyleBatch(BaseModel):
+    items: List[LearningStyleBatchItem]
+
+class CurriculumBatch(BaseModel):
+    items: List[CurriculumBatchItem]
+
+# Upper bound on items per batch request, keeping one insert_many well under the 16MB message limit
+BATCH_LIMIT = 500
+
 # Helper to convert MongoDB ObjectId to string in responses
 def serialize_mongodb_doc(doc: Dict[str, Any]) -> Dict[str, Any]:
     if doc and "_id" in doc:
@@ -34,35 +51,57 @@ def serialize_mongodb_doc(doc: Dict[str, Any]) -> Dict[str, Any]:
         del doc["_id"]
     return doc
 
+def check_batch_size(items: List[Any]):
+    if not items:
+        raise HTTPException(status_code=400, detail="Batch is empty")
+    if len(items) > BATCH_LIMIT:
+        raise HTTPException(status_code=400, detail=f"At most {BATCH_LIMIT} items per batch")
+
+async def authorize_batch_items(items: List[Any], current_user: Dict[str, Any]) -> Dict[int, str]:
+    """
+    Return an error for each item written for someone other than the caller.
+    Admins (the stored role get_admin_user checks) may write for anyone, e.g. class imports;
+    the role is only looked up when a batch actually holds other users' items.
+    """
+    foreign = [index for index, item in enumerate(items) if item.user_id != current_user["uid"]]
+    if foreign:
+        caller = await UserRepository.get_user_by_firebase_uid(current_user["uid"])
+        if caller is not None and caller.role == "admin":
+            return {}
+    return {index: "Not authorized to update this profile" for index in foreign}
+
+def batch_results(docs: Dict[int, Dict[str, Any]], errors: Dict[int, str], size: int) -> Dict[str, Any]:
+    """Per-item outcome in input order: the new document id, or the reason it was not written"""
+    results = []
+    for index in range(size):
+        if index in errors:
+            results.append({"index": index, "error": errors[index]})
+        else:
+            results.append({"index": index, "id": str(docs[index]["_id"])})
+    return {
+        "inserted": size - len(errors),
+        "failed": len(errors),
+        "results": results
+    }
+
 @router.get("/users/{user_id}", response_model=Dict[str, Any])
 async def get_user_profile(
     user_id: str,
-    current_user: Dict[str, Any] = Depends(get_current_user),
-    mongodb: MongoClient = Depends(get_mongodb_client)
+    current_user: Dict[str, Any] = Depends(get_current_user)
 ):
     """Get a user's profile from MongoDB"""
     # Ensure user can only access their own profile
     if user_id != current_user["uid"]:
         raise HTTPException(status_code=403, detail="Not authorized to access this profile")
     
-    users_collection = mongodb.get_database("geaux_academy").get_collection("users")
-    
-    # Find user by Firebase UID
-    user = users_collection.find_one({"firebase_uid": user_id})
-    
-    if not user:
-        # Create user profile if it doesn't exist
-        new_user = {
-            "firebase_uid": user_id,
-            "email": current_user["email"],
-            "name": current_user.get("displayName", ""),
-            "role": "student",
-            "created_at": datetime.utcnow(),
-            "preferences": {}
-        }
-        
-        result = users_collection.insert_one(new_user)
-        user = users_collection.find_one({"_id": result.inserted_id})
+    # Find user by Firebase UID, creating the profile if it doesn't exist (one round trip)
+    user = await UserRepository.get_or_create_profile(user_id, {
+        "email": current_user["email"],
+        "name": current_user.get("displayName", ""),
+        "role": "student",
+        "created_at": datetime.utcnow(),
+        "preferences": {}
+    })
     
     return serialize_mongodb_doc(user)
 
@@ -70,49 +109,39 @@ async def get_user_profile(
 async def update_user_profile(
     user_id: str,
     profile_data: UserProfile,
-    current_user: Dict[str, Any] = Depends(get_current_user),
-    mongodb: MongoClient = Depends(get_mongodb_client)
+    current_user: Dict[str, Any] = Depends(get_current_user)
 ):
     """Update a user's profile in MongoDB"""
     # Ensure user can only update their own profile
     if user_id != current_user["uid"]:
         raise HTTPException(status_code=403, detail="Not authorized to update this profile")
     
-    users_collection = mongodb.get_database("geaux_academy").get_collection("users")
-    
     # Update user profile
-    users_collection.update_one(
-        {"firebase_uid": user_id},
-        {"$set": {
+    updated_user = await UserRepository.update_profile(
+        user_id,
+        {
             "name": profile_data.name,
             "email": profile_data.email,
             "role": profile_data.role,
             "preferences": profile_data.preferences,
             "updated_at": datetime.utcnow()
-        }},
+        },
         upsert=True
     )
     
-    # Get updated user
-    updated_user = users_collection.find_one({"firebase_uid": user_id})
-    
     return serialize_mongodb_doc(updated_user)
 
 @router.post("/users/{user_id}/learning-style", response_model=Dict[str, Any])
 async def save_learning_style(
     user_id: str,
     learning_style: LearningStyle,
-    current_user: Dict[str, Any] = Depends(get_current_user),
-    mongodb: MongoClient = Depends(get_mongodb_client)
+    current_user: Dict[str, Any] = Depends(get_current_user)
 ):
     """Save a user's learning style assessment results"""
     # Ensure user can only update their own learning style
     if user_id != current_user["uid"]:
         raise HTTPException(status_code=403, detail="Not authorized to update this profile")
     
-    users_collection = mongodb.get_database("geaux_academy").get_collection("users")
-    learning_styles_collection = mongodb.get_database("geaux_academy").get_collection("learning_styles")
-    
     # Create learning style document
     style_doc = {
         "user_id": user_id,
@@ -122,41 +151,32 @@ async def save_learning_style(
         "created_at": datetime.utcnow()
     }
     
-    result = learning_styles_collection.insert_one(style_doc)
+    style_doc = await LearningStyleRepository.create_learning_style(style_doc)
     
     # Update user profile with learning style reference
-    users_collection.update_one(
-        {"firebase_uid": user_id},
-        {"$set": {
+    await UserRepository.update_profile(
+        user_id,
+        {
             "learning_style": learning_style.style,
-            "learning_style_id": result.inserted_id,
+            "learning_style_id": style_doc["_id"],
             "updated_at": datetime.utcnow()
-        }}
+        }
     )
     
-    style_doc["id"] = str(result.inserted_id)
-    del style_doc["_id"]
-    
-    return style_doc
+    return serialize_mongodb_doc(style_doc)
 
 @router.get("/users/{user_id}/learning-style", response_model=Dict[str, Any])
 async def get_learning_style(
     user_id: str,
-    current_user: Dict[str, Any] = Depends(get_current_user),
-    mongodb: MongoClient = Depends(get_mongodb_client)
+    current_user: Dict[str, Any] = Depends(get_current_user)
 ):
     """Get a user's learning style"""
     # Ensure user can only access their own learning style
     if user_id != current_user["uid"]:
         raise HTTPException(status_code=403, detail="Not authorized to access this data")
     
-    learning_styles_collection = mongodb.get_database("geaux_academy").get_collection("learning_styles")
-    
     # Get latest learning style
-    learning_style = learning_styles_collection.find_one(
-        {"user_id": user_id},
-        sort=[("timestamp", -1)]
-    )
+    learning_style = await LearningStyleRepository.get_latest_learning_style(user_id)
     
     if not learning_style:
         raise HTTPException(status_code=404, detail="Learning style not found")
@@ -167,16 +187,13 @@ async def get_learning_style(
 async def save_curriculum(
     user_id: str,
     curriculum: CurriculumCreate,
-    current_user: Dict[str, Any] = Depends(get_current_user),
-    mongodb: MongoClient = Depends(get_mongodb_client)
+    current_user: Dict[str, Any] = Depends(get_current_user)
 ):
     """Save a generated curriculum"""
     # Ensure user can only save to their own account
     if user_id != current_user["uid"]:
         raise HTTPException(status_code=403, detail="Not authorized")
     
-    curriculum_collection = mongodb.get_database("geaux_academy").get_collection("curriculums")
-    
     # Create curriculum document
     curriculum_doc = {
         "user_id": user_id,
@@ -190,9 +207,79 @@ async def save_curriculum(
         "updated_at": datetime.utcnow()
     }
     
-    result = curriculum_collection.insert_one(curriculum_doc)
+    curriculum_doc = await CurriculumRepository.create_curriculum(curriculum_doc)
     
-    curriculum_doc["id"] = str(result.inserted_id)
-    del curriculum_doc["_id"]
+    return serialize_mongodb_doc(curriculum_doc)
+
+
+@router.post("/learning-styles/batch", response_model=Dict[str, Any])
+async def save_learning_styles(
+    batch: LearningStyleBatch,
+    current_user: Dict[str, Any] = Depends(get_current_user)
+):
+    """Save many learning style results with one insert_many and one bulk profile update"""
+    check_batch_size(batch.items)
+    errors = await authorize_batch_items(batch.items, current_user)
+    
+    now = datetime.utcnow()
+    docs = {
+        index: {
+            "user_id": item.user_id,
+            "style": item.style,
+            "results": item.results,
+            "timestamp": now,
+            "created_at": now
+        }
+        for index, item in enumerate(batch.items)
+        if index not in errors
+    }
+    indexes = list(docs)
+    insert_errors = await LearningStyleRepository.create_learning_styles([docs[i] for i in indexes])
+    errors.update({indexes[position]: message for position, message in insert_errors.items()})
+    
+    # The last stored result for each user becomes their profile's learning style
+    latest_by_user = {docs[i]["user_id"]: i for i in indexes if i not in errors}
+    profile_errors = await UserRepository.update_profiles({
+        user_id: {
+            "learning_style": docs[index]["style"],
+            "learning_style_id": docs[index]["_id"],
+            "updated_at": now
+        }
+        for user_id, index in latest_by_user.items()
+    })
+    
+    response = batch_results(docs, errors, len(batch.items))
+    for user_id, message in profile_errors.items():
+        response["results"][latest_by_user[user_id]]["profile_error"] = message
+    return response
+
+@router.post("/curriculums/batch", response_model=Dict[str, Any])
+async def save_curriculums(
+    batch: CurriculumBatch,
+    current_user: Dict[str, Any] = Depends(get_current_user)
+):
+    """Save many generated curriculums with one insert_many"""
+    check_batch_size(batch.items)
+    errors = await authorize_batch_items(batch.items, current_user)
+    
+    now = datetime.utcnow()
+    docs = {
+        index: {
+            "user_id": item.user_id,
+            "title": item.title,
+            "subject": item.subject,
+            "grade_level": item.grade_level,
+            "learning_style": item.learning_style,
+            "modules": item.modules,
+            "recommendations": item.recommendations,
+            "created_at": now,
+            "updated_at": now
+        }
+        for index, item in enumerate(batch.items)
+        if index not in errors
+    }
+    indexes = list(docs)
+    insert_errors = await CurriculumRepository.create_curriculums([docs[i] for i in indexes])
+    errors.update({indexes[position]: message for position, message in insert_errors.items()})
     
-    return curriculum_doc
+    return batch_results(docs, errors, len(batch.items))
@@ -1,71 +1,291 @@
 # backend/api/websockets.py
 from fastapi import WebSocket, WebSocketDisconnect, Depends, APIRouter, HTTPException
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Callable, Deque, Iterable, Optional, Set, Tuple
 import json
 import asyncio
-from datetime import datetime, timedelta
-from ..dependencies import get_orchestrator, verify_token
-from ...crewai.orchestrator.task_manager import TaskOrchestrator
+import time
+from collections import OrderedDict, deque
+from .dependencies import get_orchestrator, verify_token
+from ..crewai.orchestrator.task_manager import TaskOrchestrator
+from ..crewai.orchestrator.status_bus import TERMINAL_STATUSES
+from ..metrics import metrics
 
 router = APIRouter()
 
 class RateLimiter:
+    """
+    Per-user token bucket: bursts of up to max_requests, refilled at max_requests per window.
+    Checks are O(1); users idle for a whole window have a full bucket and are evicted.
+    """
     def __init__(self, max_requests: int = 60, window_seconds: int = 60):
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self.requests: Dict[str, List[datetime]] = {}
+        self.refill_rate = max_requests / window_seconds
+        # user_id -> [tokens, last_refill], ordered by last activity
+        self.buckets: "OrderedDict[str, List[float]]" = OrderedDict()
+        self.allowed_count = 0
+        self.throttled_count = 0
 
     def is_allowed(self, user_id: str) -> bool:
-        now = datetime.now()
-        if user_id not in self.requests:
-            self.requests[user_id] = []
+        now = time.monotonic()
+        self._evict_idle(now)
 
-        # Remove old timestamps
-        self.requests[user_id] = [
-            ts for ts in self.requests[user_id]
-            if ts > now - timedelta(seconds=self.window_seconds)
-        ]
+        bucket = self.buckets.get(user_id)
+        if bucket is None:
+            bucket = self.buckets[user_id] = [float(self.max_requests), now]
+        else:
+            bucket[0] = min(self.max_requests, bucket[0] + (now - bucket[1]) * self.refill_rate)
+            bucket[1] = now
+            self.buckets.move_to_end(user_id)
 
         # Check if under limit
-        if len(self.requests[user_id]) < self.max_requests:
-            self.requests[user_id].append(now)
+        if bucket[0] >= 1:
+            bucket[0] -= 1
+            self.allowed_count += 1
             return True
+        self.throttled_count += 1
         return False
 
+    def stats(self) -> Dict[str, int]:
+        return {
+            "tracked_users": len(self.buckets),
+            "allowed": self.allowed_count,
+            "throttled": self.throttled_count
+        }
+
+    def _evict_idle(self, now: float):
+        # A bucket untouched for a full window has refilled completely, so dropping it loses nothing
+        cutoff = now - self.window_seconds
+        while self.buckets:
+            user_id, bucket = next(iter(self.buckets.items()))
+            if bucket[1] > cutoff:
+                break
+            del self.buckets[user_id]
+
+class SocketSender:
+    """
+    Delivers pre-serialised messages to one WebSocket from a bounded queue.
+    When the queue is full, a pending task_update superseded by a newer update for the
+    same task is discarded. If there is none, the consumer has fallen too far behind and
+    the connection is dropped, so messages such as task_result are never lost silently.
+    """
+    def __init__(
+        self,
+        websocket: WebSocket,
+        user_id: str,
+        on_failure: Callable[[WebSocket, str], None],
+        max_queue_size: int = 32,
+        send_timeout: float = 5.0
+    ):
+        self.websocket = websocket
+        self.user_id = user_id
+        self.send_timeout = send_timeout
+        self.max_queue_size = max_queue_size
+        # (text, task_id) pairs; task_id is only set on task_update messages, the only kind that can be superseded
+        self.pending: Deque[Tuple[str, Optional[str]]] = deque()
+        self.dropped_count = 0
+        self._ready = asyncio.Event()
+        self._on_failure = on_failure
+        self._task = asyncio.create_task(self._run())
+
+    def offer(self, text: str, update_for: Optional[str] = None):
+        """Queue a message; pass update_for=task_id for a task_update that later ones supersede"""
+        if len(self.pending) >= self.max_queue_size and not self._evict_superseded(update_for):
+            self._on_failure(self.websocket, self.user_id)
+            return
+        self.pending.append((text, update_for))
+        self._ready.set()
+
+    def close(self):
+        if self._task is not asyncio.current_task():
+            self._task.cancel()
+
+    def _evict_superseded(self, update_for: Optional[str]) -> bool:
+        # Position of the newest update per task, counting the message being offered
+        newest: Dict[str, int] = {}
+        for index, (_, task_id) in enumerate(self.pending):
+            if task_id is not None:
+                newest[task_id] = index
+        if update_for is not None:
+            newest[update_for] = len(self.pending)
+        for index, (_, task_id) in enumerate(self.pending):
+            if task_id is not None and newest[task_id] != index:
+                del self.pending[index]
+                self.dropped_count += 1
+                return True
+        return False
+
+    async def _run(self):
+        while True:
+            if not self.pending:
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+            text, _ = self.pending.popleft()
+            # asyncio.wait rather than wait_for: on 3.11 wait_for can swallow our own cancellation
+            send = asyncio.ensure_future(self.websocket.send_text(text))
+            try:
+                done, _ = await asyncio.wait({send}, timeout=self.send_timeout)
+            except asyncio.CancelledError:
+                send.cancel()
+                raise
+            if not done or send.exception() is not None:
+                # Timed out or the socket is gone; stop delivering to it
+                send.cancel()
+                self._on_failure(self.websocket, self.user_id)
+                return
+
+def _update_for(message: Dict[str, Any]) -> Optional[str]:
+    """The task_id of a task_update, which newer updates for that task supersede; None for other messages"""
+    return message.get("task_id") if message.get("type") == "task_update" else None
+
+def _counts_against_budget(message: Dict[str, Any]) -> bool:
+    """Only progress updates are rate limited; results, errors and final statuses are always delivered"""
+    return message.get("type") == "task_update" and message.get("status", {}).get("status") not in TERMINAL_STATUSES
+
 class ConnectionManager:
-    def __init__(self):
+    def __init__(self, max_queue_size: int = 32, send_timeout: float = 5.0):
         self.active_connections: Dict[str, List[WebSocket]] = {}
-        self.rate_limiter = RateLimiter()
+        self.senders: Dict[WebSocket, SocketSender] = {}
+        self.max_queue_size = max_queue_size
+        self.send_timeout = send_timeout
+        # Separate budgets so a chatty client cannot starve its own status pushes
+        self.inbound_limiter = RateLimiter()
+        self.outbound_limiter = RateLimiter(max_requests=300, window_seconds=60)
+        # Called with each dropped socket, so slow consumers also give up their subscriptions
+        self.drop_listeners: List[Callable[[WebSocket], None]] = []
     
     async def connect(self, websocket: WebSocket, user_id: str):
         await websocket.accept()
         if user_id not in self.active_connections:
             self.active_connections[user_id] = []
         self.active_connections[user_id].append(websocket)
+        self.senders[websocket] = SocketSender(
+            websocket,
+            user_id,
+            self._drop_connection,
+            max_queue_size=self.max_queue_size,
+            send_timeout=self.send_timeout
+        )
     
     async def disconnect(self, websocket: WebSocket, user_id: str):
-        if user_id in self.active_connections:
-            self.active_connections[user_id].remove(websocket)
-            if not self.active_connections[user_id]:
+        self._drop_connection(websocket, user_id)
+    
+    def _drop_connection(self, websocket: WebSocket, user_id: str):
+        sender = self.senders.pop(websocket, None)
+        if sender:
+            sender.close()
+        connections = self.active_connections.get(user_id)
+        if connections and websocket in connections:
+            connections.remove(websocket)
+            if not connections:
                 del self.active_connections[user_id]
+        for listener in self.drop_listeners:
+            listener(websocket)
     
     async def send_status_update(self, user_id: str, message: Dict[str, Any]):
-        if not self.rate_limiter.is_allowed(user_id):
-            return  # Skip sending if rate limit exceeded
+        if _counts_against_budget(message) and not self.outbound_limiter.is_allowed(user_id):
+            return  # Skip progress updates past the budget; counted in outbound_limiter.stats()
 
         if user_id in self.active_connections:
-            dead_connections = []
-            for connection in self.active_connections[user_id]:
-                try:
-                    await connection.send_text(json.dumps(message))
-                except Exception:
-                    dead_connections.append(connection)
-            
-            # Clean up dead connections
-            for dead in dead_connections:
-                await self.disconnect(dead, user_id)
+            # Serialise once; each socket's sender delivers it concurrently with the others
+            text = json.dumps(message)
+            update_for = _update_for(message)
+            # Copy: a sender that overflows drops its connection from this list
+            for connection in list(self.active_connections[user_id]):
+                sender = self.senders.get(connection)
+                if sender is not None:
+                    sender.offer(text, update_for)
+    
+    async def broadcast(self, connections: Iterable[WebSocket], message: Dict[str, Any]):
+        """Send one message to specific connections, possibly belonging to different users"""
+        text = None
+        budgeted = _counts_against_budget(message)
+        allowed_users: Dict[str, bool] = {}
+        for connection in connections:
+            sender = self.senders.get(connection)
+            if sender is None:
+                continue
+            if budgeted and sender.user_id not in allowed_users:
+                allowed_users[sender.user_id] = self.outbound_limiter.is_allowed(sender.user_id)
+            if budgeted and not allowed_users[sender.user_id]:
+                continue
+            if text is None:
+                text = json.dumps(message)
+            sender.offer(text, _update_for(message))
+
+class TaskSubscriptions:
+    """Runs at most one status watcher per task and fans its updates out to every subscribed connection"""
+    def __init__(self, connection_manager: ConnectionManager):
+        self.manager = connection_manager
+        self.subscribers: Dict[str, Set[WebSocket]] = {}
+        self.watchers: Dict[str, asyncio.Task] = {}
+        self.tasks_by_connection: Dict[WebSocket, Set[str]] = {}
+        connection_manager.drop_listeners.append(self.unsubscribe_all)
+    
+    def subscribe(self, orchestrator: TaskOrchestrator, task_id: str, websocket: WebSocket) -> bool:
+        """Subscribe a connection to a task; returns True if a new watcher had to be started"""
+        self.subscribers.setdefault(task_id, set()).add(websocket)
+        self.tasks_by_connection.setdefault(websocket, set()).add(task_id)
+        if task_id in self.watchers:
+            return False
+        self.watchers[task_id] = asyncio.create_task(
+            self._watch(orchestrator, task_id)
+        )
+        return True
+    
+    def unsubscribe(self, task_id: str, websocket: WebSocket):
+        """Remove a connection from a task, cancelling the watcher if nobody is left"""
+        connections = self.subscribers.get(task_id)
+        if connections is not None:
+            connections.discard(websocket)
+            if not connections:
+                del self.subscribers[task_id]
+                watcher = self.watchers.pop(task_id, None)
+                if watcher is not None:
+                    watcher.cancel()
+        tasks = self.tasks_by_connection.get(websocket)
+        if tasks is not None:
+            tasks.discard(task_id)
+            if not tasks:
+                del self.tasks_by_connection[websocket]
+    
+    def unsubscribe_all(self, websocket: WebSocket):
+        """Drop every subscription held by a connection"""
+        for task_id in list(self.tasks_by_connection.get(websocket, ())):
+            self.unsubscribe(task_id, websocket)
+    
+    async def publish(self, task_id: str, message: Dict[str, Any]):
+        """Send a message to every connection subscribed to the task"""
+        await self.manager.broadcast(list(self.subscribers.get(task_id, ())), message)
+    
+    async def _watch(self, orchestrator: TaskOrchestrator, task_id: str):
+        try:
+            await monitor_task_status(orchestrator, task_id, self)
+        finally:
+            # The task reached a final state; its subscriptions are finished
+            if self.watchers.get(task_id) is asyncio.current_task():
+                del self.watchers[task_id]
+                for websocket in self.subscribers.pop(task_id, ()):
+                    tasks = self.tasks_by_connection.get(websocket)
+                    if tasks is not None:
+                        tasks.discard(task_id)
+                        if not tasks:
+                            del self.tasks_by_connection[websocket]
 
 manager = ConnectionManager()
+subscriptions = TaskSubscriptions(manager)
+
+metrics.register_gauge(
+    "websocket_connections",
+    "Open task-status WebSocket connections",
+    lambda: len(manager.senders)
+)
+metrics.register_gauge(
+    "websocket_watched_tasks",
+    "Tasks with at least one WebSocket subscriber",
+    lambda: len(subscriptions.watchers)
+)
 
 @router.websocket("/ws/tasks/{token}")
 async def websocket_endpoint(
@@ -88,7 +308,7 @@ async def websocket_endpoint(
                 data = await websocket.receive_text()
                 message = json.loads(data)
                 
-                if not manager.rate_limiter.is_allowed(user_id):
+                if not manager.inbound_limiter.is_allowed(user_id):
                     await websocket.send_text(json.dumps({
                         "type": "error",
                         "error": "Rate limit exceeded. Please wait before sending more messages."
@@ -98,10 +318,8 @@ async def websocket_endpoint(
                 if message.get("type") == "subscribe_task":
                     task_id = message.get("task_id")
                     if task_id:
-                        # Start a background task to monitor the task status
-                        asyncio.create_task(
-                            monitor_task_status(orchestrator, task_id, user_id)
-                        )
+                        # Share the task's watcher with any other subscribed connections
+                        subscriptions.subscribe(orchestrator, task_id, websocket)
                         
                         # Send immediate acknowledgment
                         await websocket.send_text(json.dumps({
@@ -116,56 +334,47 @@ async def websocket_endpoint(
                     "error": "Invalid message format"
                 }))
     except WebSocketDisconnect:
+        subscriptions.unsubscribe_all(websocket)
         await manager.disconnect(websocket, user_id)
     except Exception as e:
         await websocket.send_text(json.dumps({
             "type": "error",
             "error": f"An error occurred: {str(e)}"
         }))
+        subscriptions.unsubscribe_all(websocket)
         await manager.disconnect(websocket, user_id)
 
-async def monitor_task_status(orchestrator: TaskOrchestrator, task_id: str, user_id: str):
-    """Monitor a task's status and send updates via WebSocket"""
+async def monitor_task_status(
+    orchestrator: TaskOrchestrator,
+    task_id: str,
+    task_subscriptions: Optional[TaskSubscriptions] = None
+):
+    """Forward a task's status transitions to the connections subscribed to it"""
+    task_subscriptions = task_subscriptions or subscriptions
+    # Subscribe before reading the current status so no transition is missed in between
+    updates = orchestrator.status_bus.subscribe(task_id)
     prev_status = None
-    error_count = 0
-    max_errors = 3
     
-    while True:
-        try:
-            # Get current task status
-            status = await orchestrator.get_task_status(task_id)
-            
-            # Reset error count on successful status check
-            error_count = 0
-            
+    try:
+        status = await orchestrator.get_task_status(task_id)
+        
+        while True:
             # If status changed, send update
             if prev_status != status["status"]:
                 prev_status = status["status"]
-                await manager.send_status_update(user_id, {
+                await task_subscriptions.publish(task_id, {
                     "type": "task_update",
                     "task_id": task_id,
-                    "status": status
+                    "status": {k: v for k, v in status.items() if k != "result"}
                 })
             
             # If task is completed or failed, stop monitoring
-            if status["status"] in ["completed", "failed"]:
+            if status["status"] in TERMINAL_STATUSES:
                 # Send final update with result for completed tasks
                 if status["status"] == "completed":
-                    memories = await orchestrator.cat_client.memory.recall_memories(
-                        query="",
-                        filters={
-                            "type": "task_result",
-                            "task_id": task_id
-                        },
-                        limit=1
-                    )
-                    if memories:
-                        try:
-                            result = eval(memories[0]["content"])
-                        except:
-                            result = {"content": memories[0]["content"]}
-                        
-                        await manager.send_status_update(user_id, {
+                    result = status.get("result")
+                    if result is not None:
+                        await task_subscriptions.publish(task_id, {
                             "type": "task_result",
                             "task_id": task_id,
                             "result": result
@@ -173,30 +382,24 @@ async def monitor_task_status(orchestrator: TaskOrchestrator, task_id: str, user
                 
                 break
             
-            # Wait before checking again
-            await asyncio.sleep(2)
-        except Exception as e:
-            error_count += 1
-            print(f"Error monitoring task: {str(e)}")
-            
-            # Send error notification to client
-            await manager.send_status_update(user_id, {
-                "type": "error",
-                "task_id": task_id,
-                "error": f"Error monitoring task: {str(e)}"
-            })
-            
-            # Stop monitoring if too many errors occur
-            if error_count >= max_errors:
-                await manager.send_status_update(user_id, {
-                    "type": "task_update",
-                    "task_id": task_id,
-                    "status": {
-                        "status": "failed",
-                        "details": "Monitoring stopped due to repeated errors"
-                    }
-                })
-                break
-            
-            # Wait longer before retrying after an error
-            await asyncio.sleep(5)
\ No newline at end of file
+            # Wait for the orchestrator to publish the next transition
+            status = await updates.get()
+    except Exception as e:
+        print(f"Error monitoring task: {str(e)}")
+        
+        # Send error notification to client
+        await task_subscriptions.publish(task_id, {
+            "type": "error",
+            "task_id": task_id,
+            "error": f"Error monitoring task: {str(e)}"
+        })
+        await task_subscriptions.publish(task_id, {
+            "type": "task_update",
+            "task_id": task_id,
+            "status": {
+                "status": "failed",
+                "details": "Monitoring stopped due to an error"
+            }
+        })
+    finally:
+        orchestrator.status_bus.unsubscribe(task_id, updates)
@@ -0,0 +1,38 @@
+from typing import Any, Dict, Optional
+import asyncio
+import os
+import threading
+
+# firebase_admin and its google-auth/grpc dependencies take a few hundred ms to
+# import, and loading the service-account certificate reads and parses a key.
+# Both are deferred until the first token is verified, or until warm_up_firebase
+# runs from the application's lifespan.
+_firebase_app = None
+_lock = threading.Lock()
+
+def credentials_path() -> Optional[str]:
+    # The two entry points historically read different variables; accept either
+    return os.getenv("FIREBASE_ADMIN_SDK_PATH") or os.getenv("FIREBASE_ADMIN_CREDENTIALS_PATH")
+
+def get_firebase_app():
+    """Return the process-wide Firebase Admin app, initializing it on first use."""
+    global _firebase_app
+    if _firebase_app is None:
+        with _lock:
+            if _firebase_app is None:
+                import firebase_admin
+                from firebase_admin import credentials
+                try:
+                    _firebase_app = firebase_admin.get_app()
+                except ValueError:
+                    _firebase_app = firebase_admin.initialize_app(credentials.Certificate(credentials_path()))
+    return _firebase_app
+
+def verify_id_token(token: str) -> Dict[str, Any]:
+    """Blocking Firebase ID token verification against the lazily initialized app."""
+    from firebase_admin import auth
+    return auth.verify_id_token(token, app=get_firebase_app())
+
+async def warm_up_firebase() -> None:
+    """Initialize Firebase off the event loop so the first authenticated request does not pay for it."""
+    await asyncio.to_thread(get_firebase_app)
@@ -1,25 +1,41 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-import firebase_admin
-from firebase_admin import auth, credentials
-import os
-from ..db.repositories.user_repository import UserRepository
+import time
+from ..db.repositories.user_repository import (
+    UserRepository,
+    USER_CACHE_TTL_SECONDS,
+    user_cache
+)
 from ..models.user import UserModel
+from .token_cache import verify_firebase_token
 
-# Initialize Firebase Admin SDK
-cred = credentials.Certificate(os.environ.get("FIREBASE_ADMIN_CREDENTIALS_PATH"))
-firebase_app = firebase_admin.initialize_app(cred)
+# Firebase Admin is initialized lazily by .firebase on the first verification
 
 security = HTTPBearer()
 
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> UserModel:
-    """Validate Firebase JWT and return the associated user."""
+    """
+    Validate Firebase JWT and return the associated user.
+    A verified user with no profile yet gets one; concurrent first requests for the same
+    Firebase UID all receive the single stored user instead of failing on a duplicate.
+    Tokens without a Firebase UID are rejected with 401.
+    """
     token = credentials.credentials
     
     try:
-        # Verify the token with Firebase
-        decoded_token = auth.verify_id_token(token)
-        firebase_uid = decoded_token['uid']
+        # Verify the token with Firebase (cached until the token expires)
+        decoded_token = await verify_firebase_token(token)
+        firebase_uid = decoded_token.get('uid')
+        if not firebase_uid:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Authentication token has no Firebase UID",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        
+        user = user_cache.get(firebase_uid)
+        if user:
+            return user
         
         # Get user from MongoDB
         user = await UserRepository.get_user_by_firebase_uid(firebase_uid)
@@ -39,9 +55,12 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
             }
             
             user = await UserRepository.create_user(user_data)
-            
+        
+        user_cache.set(firebase_uid, user, time.time() + USER_CACHE_TTL_SECONDS)
         return user
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -0,0 +1,62 @@
+from typing import Any, Dict, Optional
+from collections import OrderedDict
+import asyncio
+import hashlib
+import time
+from .firebase import verify_id_token
+
+# Stop trusting a cached token slightly before Firebase would reject it
+EXPIRY_LEEWAY_SECONDS = 5
+
+class TTLCache:
+    """Bounded LRU cache whose entries each expire at their own wall-clock deadline."""
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        value, expires_at = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any, expires_at: float) -> None:
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+token_cache = TTLCache()
+
+async def verify_firebase_token(token: str) -> Dict[str, Any]:
+    """
+    Verify a Firebase ID token and return its decoded claims.
+    Results are cached by token hash until the token's `exp`; verification runs off the event loop.
+    """
+    key = hashlib.sha256(token.encode()).hexdigest()
+    claims = token_cache.get(key)
+    if claims is None:
+        # RSA verification and certificate fetches are blocking
+        claims = await asyncio.to_thread(verify_id_token, token)
+        token_cache.set(key, claims, claims["exp"] - EXPIRY_LEEWAY_SECONDS)
+    return dict(claims)
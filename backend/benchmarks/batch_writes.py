@@ -0,0 +1,72 @@
+"""
+Throughput benchmark for learning-style writes: single-item path vs batch path.
+
+The single-item path is what POST /users/{user_id}/learning-style does per
+result (insert_one, then update_one on the profile). The batch path is what
+POST /learning-styles/batch does for a whole class (one insert_many, one
+unordered bulk_write of profile updates). Curriculum writes follow the same
+pattern minus the profile update.
+
+Usage (needs a reachable MongoDB; uses a throwaway database):
+    MONGODB_URI=mongodb://localhost:27017 python -m backend.benchmarks.batch_writes
+"""
+import asyncio
+import os
+import time
+from datetime import datetime
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
+
+CLASS_SIZE = int(os.getenv("BENCH_CLASS_SIZE", "30"))
+CLASSES = int(os.getenv("BENCH_CLASSES", "50"))
+
+def style_doc(uid):
+    now = datetime.utcnow()
+    return {"user_id": uid, "style": "visual", "results": {"visual": 0.8}, "timestamp": now, "created_at": now}
+
+async def single_item(db, uids):
+    for uid in uids:
+        doc = style_doc(uid)
+        result = await db.learning_styles.insert_one(doc)
+        await db.users.update_one(
+            {"firebase_uid": uid},
+            {"$set": {"learning_style": "visual", "learning_style_id": result.inserted_id}}
+        )
+
+async def batch(db, uids):
+    docs = [style_doc(uid) for uid in uids]
+    await db.learning_styles.insert_many(docs, ordered=False)
+    await db.users.bulk_write(
+        [
+            UpdateOne({"firebase_uid": doc["user_id"]}, {"$set": {"learning_style": "visual", "learning_style_id": doc["_id"]}})
+            for doc in docs
+        ],
+        ordered=False
+    )
+
+async def measure(name, operation, db):
+    await db.learning_styles.delete_many({})
+    start = time.perf_counter()
+    for class_index in range(CLASSES):
+        await operation(db, [f"student-{class_index}-{i}" for i in range(CLASS_SIZE)])
+    elapsed = time.perf_counter() - start
+    items = CLASSES * CLASS_SIZE
+    print(f"{name:<14} {items / elapsed:>10.0f} items/s {elapsed / CLASSES * 1000:>9.2f} ms/class")
+
+async def main():
+    client = AsyncIOMotorClient(os.environ["MONGODB_URI"])
+    db = client["geaux_academy_benchmark"]
+    await db.users.insert_many([
+        {"firebase_uid": f"student-{c}-{i}"} for c in range(CLASSES) for i in range(CLASS_SIZE)
+    ])
+    await db.users.create_index("firebase_uid", unique=True)
+
+    await measure("single-item", single_item, db)
+    await measure("batch", batch, db)
+
+    await client.drop_database("geaux_academy_benchmark")
+    client.close()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,53 @@
+"""
+Per-input clone cost of kickoff_for_each: Crew.copy() vs Crew.fork().
+
+kickoff_for_each and kickoff_for_each_async make one crew per input. copy()
+round-trips every agent and task through model_dump and pydantic validation,
+builds new Telemetry/RPM/cache objects and agent executors, and re-runs the
+memory validators; fork() shares the template's definitions and only resets
+per-run state. The crew mirrors the education crew's shape (three agents,
+three tasks with context). No LLM requests are made.
+
+Usage:
+    python -m backend.benchmarks.crew_clone
+    BENCH_INPUTS=1000 BENCH_MEMORY=1 python -m backend.benchmarks.crew_clone
+"""
+import os
+import time
+
+os.environ.setdefault("OTEL_SDK_DISABLED", "true")
+
+from crewai import Agent, Crew, Task
+from langchain_openai import ChatOpenAI
+
+INPUTS = int(os.getenv("BENCH_INPUTS", "1000"))
+MEMORY = os.getenv("BENCH_MEMORY") == "1"
+
+def build_crew() -> Crew:
+    llm = ChatOpenAI(model="gpt-4o-mini", api_key="benchmark-makes-no-requests")
+    agents = [
+        Agent(role=f"{{topic}} {role}", goal=f"{role} work on {{topic}}.", backstory=f"An experienced {role}.", llm=llm)
+        for role in ("Researcher", "Curriculum Designer", "Assessor")
+    ]
+    research = Task(description="Research {topic}.", expected_output="Notes on {topic}.", agent=agents[0])
+    curriculum = Task(description="Plan lessons on {topic}.", expected_output="A lesson plan.", agent=agents[1], context=[research])
+    assessment = Task(description="Write a quiz on {topic}.", expected_output="A quiz.", agent=agents[2], context=[research, curriculum])
+    return Crew(agents=agents, tasks=[research, curriculum, assessment], memory=MEMORY)
+
+def measure(name: str, clone) -> float:
+    start = time.perf_counter()
+    for _ in range(INPUTS):
+        clone()
+    per_input = (time.perf_counter() - start) / INPUTS
+    print(f"{name:<8} {per_input * 1e6:>10.1f} us/input {per_input * INPUTS:>8.2f} s per {INPUTS} inputs")
+    return per_input
+
+def main():
+    crew = build_crew()
+    print(f"{INPUTS} inputs, memory={'on' if MEMORY else 'off'}")
+    copy_cost = measure("copy()", crew.copy)
+    fork_cost = measure("fork()", crew.fork)
+    print(f"fork() is {copy_cost / fork_cost:.0f}x cheaper per input")
+
+if __name__ == "__main__":
+    main()
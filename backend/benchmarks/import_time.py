@@ -0,0 +1,55 @@
+"""
+Cold import time of the auth modules every route depends on.
+
+Each module is imported in a fresh interpreter so nothing is cached between
+runs; the median wall time is reported along with whether firebase_admin got
+pulled in. Modules whose dependencies are not installed are reported as such.
+
+Usage:
+    python -m backend.benchmarks.import_time
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+RUNS = int(os.getenv("BENCH_RUNS", "7"))
+MODULES = [
+    "backend.auth.token_cache",
+    "backend.auth.jwt_handler",
+    "backend.db.connection"
+]
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+print((time.perf_counter() - start) * 1000, "firebase_admin" in sys.modules)
+"""
+
+def measure(module: str):
+    samples = []
+    loads_firebase = False
+    for _ in range(RUNS):
+        result = subprocess.run(
+            [sys.executable, "-c", PROBE.format(module=module)],
+            capture_output=True,
+            text=True
+        )
+        if result.returncode != 0:
+            return None, result.stderr.strip().splitlines()[-1]
+        elapsed, loaded = result.stdout.split()
+        samples.append(float(elapsed))
+        loads_firebase = loaded == "True"
+    return statistics.median(samples), loads_firebase
+
+def main():
+    for module in MODULES:
+        elapsed, detail = measure(module)
+        if elapsed is None:
+            print(f"{module:<28} unavailable ({detail})")
+        else:
+            print(f"{module:<28} {elapsed:>8.1f} ms  firebase_admin imported: {detail}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Per-request overhead of the request logging middleware.
+
+Runs the same trivial route through three apps: no logging middleware, the
+previous log_requests (three synchronous f-string logger.info calls including
+a full header dump), and the current structured, queue-backed RequestLoggingMiddleware
+from backend/chat_api.py. Log output goes to /dev/null so only the in-request cost
+is measured.
+
+Usage:
+    python -m backend.benchmarks.request_logging
+"""
+import asyncio
+import logging
+import os
+import time
+
+from fastapi import FastAPI, Request
+
+from .. import chat_api
+
+REQUESTS = int(os.getenv("BENCH_REQUESTS", "5000"))
+
+legacy_logger = logging.getLogger("benchmark.legacy")
+
+async def legacy_log_requests(request: Request, call_next):
+    legacy_logger.info(f"Incoming request: {request.method} {request.url}")
+    legacy_logger.info(f"Client host: {request.client.host if request.client else 'Unknown'}")
+    legacy_logger.info(f"Headers: {request.headers}")
+
+    response = await call_next(request)
+
+    legacy_logger.info(f"Response status: {response.status_code}")
+    return response
+
+def build_app(http_middleware=None, asgi_middleware=None) -> FastAPI:
+    app = FastAPI()
+    if http_middleware is not None:
+        app.middleware("http")(http_middleware)
+    if asgi_middleware is not None:
+        app.add_middleware(asgi_middleware)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"id": item_id}
+
+    return app
+
+async def measure(name: str, app: FastAPI) -> float:
+    """Drive the ASGI app directly so client/transport overhead does not drown the middleware cost"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/items/1",
+        "raw_path": b"/items/1",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [
+            (b"host", b"localhost"),
+            (b"user-agent", b"benchmark"),
+            (b"authorization", b"Bearer " + b"x" * 900)
+        ],
+        "client": ("127.0.0.1", 50000),
+        "server": ("localhost", 80)
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    for _ in range(200):
+        await app(dict(scope), receive, send)
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        await app(dict(scope), receive, send)
+    per_request = (time.perf_counter() - start) / REQUESTS * 1e6
+    print(f"{name:<36} {per_request:>9.1f} us/request")
+    return per_request
+
+def main():
+    # Keep client and framework INFO logs out of the measurement
+    logging.getLogger().setLevel(logging.WARNING)
+    devnull = logging.FileHandler(os.devnull)
+    legacy_logger.addHandler(devnull)
+    legacy_logger.setLevel(logging.INFO)
+    legacy_logger.propagate = False
+    chat_api.request_log_listener.handlers = (devnull,)
+
+    baseline = asyncio.run(measure("no logging middleware", build_app()))
+    legacy = asyncio.run(measure("legacy log_requests", build_app(legacy_log_requests)))
+    chat_api.request_log_listener.start()
+    try:
+        structured = asyncio.run(measure(
+            "structured RequestLoggingMiddleware",
+            build_app(asgi_middleware=chat_api.RequestLoggingMiddleware)
+        ))
+    finally:
+        chat_api.request_log_listener.stop()
+
+    print(f"\nlogging overhead: legacy {legacy - baseline:.1f} us, structured {structured - baseline:.1f} us")
+
+if __name__ == "__main__":
+    main()
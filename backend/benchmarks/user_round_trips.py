@@ -0,0 +1,98 @@
+"""
+Round-trip benchmark for the user profile endpoints.
+
+Compares the previous read-after-write pattern (write, then find_one) with the
+calls UserRepository now makes, counting the commands each one sends to MongoDB
+and timing them. Lazy creation is measured for missing and existing profiles.
+
+Usage (needs a reachable MongoDB; uses a throwaway database):
+    MONGODB_URI=mongodb://localhost:27017 python -m backend.benchmarks.user_round_trips
+"""
+import asyncio
+import os
+import time
+from datetime import datetime
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import monitoring, ReturnDocument
+
+ITERATIONS = int(os.getenv("BENCH_ITERATIONS", "500"))
+
+class CommandCounter(monitoring.CommandListener):
+    def __init__(self):
+        self.count = 0
+
+    def started(self, event):
+        if event.command_name in ("find", "insert", "update", "findAndModify"):
+            self.count += 1
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+async def lazy_create_before(users, uid):
+    user = await users.find_one({"firebase_uid": uid})
+    if not user:
+        result = await users.insert_one({"firebase_uid": uid, "role": "student", "created_at": datetime.utcnow()})
+        user = await users.find_one({"_id": result.inserted_id})
+    return user
+
+async def lazy_create_after(users, uid):
+    # Mirrors UserRepository.get_or_create_profile: read first, upsert only when missing
+    user = await users.find_one({"firebase_uid": uid})
+    if user is not None:
+        return user
+    return await users.find_one_and_update(
+        {"firebase_uid": uid},
+        {"$setOnInsert": {"role": "student", "created_at": datetime.utcnow()}},
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+
+async def update_before(users, uid):
+    await users.update_one({"firebase_uid": uid}, {"$set": {"updated_at": datetime.utcnow()}}, upsert=True)
+    return await users.find_one({"firebase_uid": uid})
+
+async def update_after(users, uid):
+    return await users.find_one_and_update(
+        {"firebase_uid": uid},
+        {"$set": {"updated_at": datetime.utcnow()}},
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+
+async def measure(name, operation, users, counter, prefix, existing=False):
+    # existing=True reuses the profiles the previous run with this prefix left behind
+    if not existing:
+        await users.delete_many({})
+    counter.count = 0
+    start = time.perf_counter()
+    for i in range(ITERATIONS):
+        await operation(users, f"{prefix}-{i}")
+    elapsed = time.perf_counter() - start
+    print(
+        f"{name:<28} {counter.count / ITERATIONS:>5.2f} round trips/op "
+        f"{elapsed / ITERATIONS * 1000:>8.3f} ms/op"
+    )
+
+async def main():
+    counter = CommandCounter()
+    client = AsyncIOMotorClient(os.environ["MONGODB_URI"], event_listeners=[counter])
+    db = client["geaux_academy_benchmark"]
+    users = db.users
+
+    # The first run creates every profile; the second finds them all
+    await measure("lazy create (before)", lazy_create_before, users, counter, "new")
+    await measure("lazy read (before)", lazy_create_before, users, counter, "new", existing=True)
+    await measure("lazy create (after)", lazy_create_after, users, counter, "new")
+    await measure("lazy read (after)", lazy_create_after, users, counter, "new", existing=True)
+    await measure("update profile (before)", update_before, users, counter, "upd")
+    await measure("update profile (after)", update_after, users, counter, "upd")
+
+    await client.drop_database("geaux_academy_benchmark")
+    client.close()
+
+if __name__ == "__main__":
+    asyncio.run(main())
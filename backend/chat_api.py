@@ -0,0 +1,493 @@
+from fastapi import FastAPI, HTTPException, Request, Depends, Query
+from fastapi.responses import StreamingResponse
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.trustedhost import TrustedHostMiddleware
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from pydantic import BaseModel
+from typing import List, Dict, Any, Optional
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from openai import AsyncAzureOpenAI
+import openai
+import httpx
+import hashlib
+import json
+import os
+import time
+import queue
+import random
+import logging
+import logging.handlers
+from .metrics import instrument_app
+from .db.student_store import StudentStore, create_student_store, DEFAULT_DB_PATH, MAX_PAGE_SIZE
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Clients and stores are created here, once per worker, instead of when the module is imported
+    request_log_listener.start()
+    app.state.http_client = create_http_client()
+    app.state.openai_client = create_openai_client(app.state.http_client) if AZURE_OPENAI_API_KEY else None
+    app.state.student_store = await open_student_store()
+    try:
+        yield
+    finally:
+        await close_student_store(app.state.student_store)
+        await app.state.http_client.aclose()
+        request_log_listener.stop()
+
+app = FastAPI(lifespan=lifespan)
+
+# Configure CORS with specific origins
+ALLOWED_ORIGINS = [
+    "http://localhost:5173",     # Vite dev server
+    "http://localhost:3000",     # Alternative dev port
+    "https://cheshire.geaux.app" # Production URL
+]
+
+# Configure CORS
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=ALLOWED_ORIGINS,
+    allow_credentials=True,
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_headers=["*"],
+    expose_headers=["*"],
+    max_age=3600,
+)
+
+# Add security middleware with specific hosts
+app.add_middleware(
+    TrustedHostMiddleware, 
+    allowed_hosts=[
+        "localhost",
+        "cheshire.geaux.app"
+    ]
+)
+
+security = HTTPBearer()
+
+# Request logging: one structured record per request, formatted and written by a
+# background listener thread so the request path only enqueues a dict
+REQUEST_LOG_SAMPLE_RATE = float(os.getenv("REQUEST_LOG_SAMPLE_RATE", "1.0"))
+REQUEST_LOG_HEADERS = os.getenv("REQUEST_LOG_HEADERS", "false").lower() == "true"
+REDACTED_HEADERS = {"authorization", "cookie", "set-cookie", "x-api-key", "proxy-authorization"}
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves formatting to the listener thread"""
+    def prepare(self, record):
+        return record
+
+class JsonRecordFormatter(logging.Formatter):
+    def format(self, record):
+        if isinstance(record.msg, dict):
+            return json.dumps({"ts": record.created, "level": record.levelname, **record.msg}, default=str)
+        return super().format(record)
+
+request_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+request_logger = logging.getLogger(f"{__name__}.requests")
+request_logger.setLevel(logging.INFO)
+request_logger.propagate = False
+request_logger.addHandler(DeferredQueueHandler(request_log_queue))
+_request_log_output = logging.StreamHandler()
+_request_log_output.setFormatter(JsonRecordFormatter())
+request_log_listener = logging.handlers.QueueListener(request_log_queue, _request_log_output)
+
+def redact_headers(raw_headers) -> Dict[str, str]:
+    headers = {}
+    for name, value in raw_headers:
+        name = name.decode("latin-1")
+        headers[name] = "[REDACTED]" if name.lower() in REDACTED_HEADERS else value.decode("latin-1")
+    return headers
+
+class RequestLoggingMiddleware:
+    """
+    Pure ASGI middleware (no BaseHTTPMiddleware request/response wrapping) that logs
+    method, route template, status, duration and response size once per request.
+    """
+    def __init__(self, app, sample_rate: float = REQUEST_LOG_SAMPLE_RATE, log_headers: bool = REQUEST_LOG_HEADERS):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.log_headers = log_headers
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        start = time.perf_counter()
+        status = 500
+        response_bytes = 0
+        
+        async def send_and_measure(message):
+            nonlocal status, response_bytes
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                response_bytes += len(message.get("body", b""))
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_and_measure)
+        finally:
+            # Errors are always logged; successful requests are sampled
+            if status >= 400 or random.random() < self.sample_rate:
+                route = scope.get("route")
+                client = scope.get("client")
+                record = {
+                    "method": scope["method"],
+                    "route": getattr(route, "path", scope["path"]),
+                    "status": status,
+                    "duration_ms": round((time.perf_counter() - start) * 1000, 3),
+                    "response_bytes": response_bytes,
+                    "client": client[0] if client else None
+                }
+                if self.log_headers:
+                    record["headers"] = redact_headers(scope["headers"])
+                request_logger.info(record)
+
+app.add_middleware(RequestLoggingMiddleware)
+instrument_app(app)
+
+# Azure OpenAI Configuration
+AZURE_OPENAI_ENDPOINT = os.getenv("VITE_AZURE_ENDPOINT", "https://ai-geauxacademy8942ai219453410909.openai.azure.com/")
+AZURE_OPENAI_API_KEY = os.getenv("VITE_OPENAI_API_KEY")
+# stream_options (usage on streamed completions) needs 2024-09-01-preview or later
+AZURE_OPENAI_API_VERSION = "2024-10-21"
+AZURE_OPENAI_DEPLOYMENT = os.getenv("VITE_AZURE_DEPLOYMENT_NAME", "gpt-35-turbo")
+CHAT_MAX_TOKENS = 150
+CHAT_TEMPERATURE = 0.7
+
+def create_http_client() -> httpx.AsyncClient:
+    """One pooled HTTP client shared by every chat request"""
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        timeout=httpx.Timeout(60.0, connect=5.0)
+    )
+
+def create_openai_client(http_client: httpx.AsyncClient) -> AsyncAzureOpenAI:
+    return AsyncAzureOpenAI(
+        azure_endpoint=AZURE_OPENAI_ENDPOINT,
+        api_key=AZURE_OPENAI_API_KEY,
+        api_version=AZURE_OPENAI_API_VERSION,
+        http_client=http_client
+    )
+
+def get_openai_client() -> AsyncAzureOpenAI:
+    """Return the client the lifespan created"""
+    if not AZURE_OPENAI_API_KEY:
+        raise HTTPException(
+            status_code=500,
+            detail="OpenAI API key not configured"
+        )
+    return app.state.openai_client
+
+class ChatLatencyMetrics:
+    """Running time-to-first-token and total latency figures for /chat"""
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.ttft_count = 0
+        self.ttft_total = 0.0
+        self.ttft_max = 0.0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+
+    def record(self, ttft: Optional[float], latency: float):
+        self.requests += 1
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+        if ttft is not None:
+            self.ttft_count += 1
+            self.ttft_total += ttft
+            self.ttft_max = max(self.ttft_max, ttft)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "avg_time_to_first_token_seconds": self.ttft_total / self.ttft_count if self.ttft_count else 0.0,
+            "max_time_to_first_token_seconds": self.ttft_max,
+            "avg_latency_seconds": self.latency_total / self.requests if self.requests else 0.0,
+            "max_latency_seconds": self.latency_max
+        }
+
+chat_metrics = ChatLatencyMetrics()
+
+class ResponseCache(ABC):
+    """Interface for /chat response caches; implementations must be safe to call from the event loop"""
+    @abstractmethod
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached response, or None on a miss"""
+
+    @abstractmethod
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a response dict with `response` and `usage`"""
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """Return entry, hit, miss and tokens-saved figures"""
+
+class InMemoryResponseCache(ResponseCache):
+    """LRU cache of chat responses with a TTL and an entry bound"""
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 3600):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.tokens_saved = 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None or entry[1] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        self.tokens_saved += (entry[0].get("usage") or {}).get("total_tokens", 0)
+        return entry[0]
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        self._entries[key] = (value, time.monotonic() + self.ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "tokens_saved": self.tokens_saved
+        }
+
+def chat_cache_key(messages: List[Dict[str, str]]) -> str:
+    """
+    Canonical hash of everything that determines a completion.
+    The bearer token is not verified here, so it is deliberately left out: identical
+    conversations share an entry, and system prompts are part of `messages`.
+    """
+    payload = json.dumps(
+        {
+            "deployment": AZURE_OPENAI_DEPLOYMENT,
+            "messages": messages,
+            "temperature": CHAT_TEMPERATURE,
+            "max_tokens": CHAT_MAX_TOKENS
+        },
+        sort_keys=True,
+        separators=(",", ":")
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+chat_cache: ResponseCache = InMemoryResponseCache(
+    max_entries=int(os.getenv("CHAT_CACHE_MAX_ENTRIES", "1024")),
+    ttl_seconds=float(os.getenv("CHAT_CACHE_TTL_SECONDS", "3600"))
+)
+
+class ChatMessage(BaseModel):
+    messages: List[Dict[str, str]]
+    stream: bool = False
+    # Opt in for deterministic prompts (onboarding, assessments) whose answers can be reused
+    cache: bool = False
+
+async def stream_chat_completion(messages: List[Dict[str, str]], cache_key: Optional[str] = None):
+    """Yield a chat completion as server-sent events, one event per content delta"""
+    start = time.perf_counter()
+    ttft = None
+    try:
+        stream = await get_openai_client().chat.completions.create(
+            model=AZURE_OPENAI_DEPLOYMENT,
+            messages=messages,
+            max_tokens=CHAT_MAX_TOKENS,
+            temperature=CHAT_TEMPERATURE,
+            n=1,
+            stream=True,
+            # The last chunk then carries token usage for the whole completion
+            stream_options={"include_usage": True}
+        )
+        content = []
+        usage = None
+        async for chunk in stream:
+            if chunk.usage:
+                usage = chunk.usage.model_dump()
+            # Azure sends content-filter chunks with no choices
+            if not chunk.choices or not chunk.choices[0].delta.content:
+                continue
+            if ttft is None:
+                ttft = time.perf_counter() - start
+            content.append(chunk.choices[0].delta.content)
+            yield f"data: {json.dumps({'delta': chunk.choices[0].delta.content})}\n\n"
+        yield "data: [DONE]\n\n"
+        if cache_key:
+            chat_cache.set(cache_key, {"response": "".join(content), "usage": usage})
+    except openai.OpenAIError as e:
+        chat_metrics.errors += 1
+        logger.error(f"OpenAI API error: {str(e)}")
+        yield f"data: {json.dumps({'error': 'Service temporarily unavailable'})}\n\n"
+    finally:
+        chat_metrics.record(ttft, time.perf_counter() - start)
+
+@app.post("/chat")
+async def get_chat_response(chat: ChatMessage, credentials: HTTPAuthorizationCredentials = Depends(security)):
+    cache_key = chat_cache_key(chat.messages) if chat.cache else None
+    if cache_key:
+        cached = chat_cache.get(cache_key)
+        if cached is not None:
+            if chat.stream:
+                return StreamingResponse(
+                    iter([
+                        f"data: {json.dumps({'delta': cached['response']})}\n\n",
+                        "data: [DONE]\n\n"
+                    ]),
+                    media_type="text/event-stream",
+                    headers={"Cache-Control": "no-cache", "X-Chat-Cache": "hit"}
+                )
+            return {**cached, "cached": True}
+
+    if chat.stream:
+        get_openai_client()  # Fail fast with a 500 before the stream starts
+        return StreamingResponse(
+            stream_chat_completion(chat.messages, cache_key),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+        )
+
+    start = time.perf_counter()
+    try:
+        response = await get_openai_client().chat.completions.create(
+            model=AZURE_OPENAI_DEPLOYMENT,
+            messages=chat.messages,
+            max_tokens=CHAT_MAX_TOKENS,
+            temperature=CHAT_TEMPERATURE,
+            n=1
+        )
+        latency = time.perf_counter() - start
+        # Without streaming the first token arrives with the full completion
+        chat_metrics.record(latency, latency)
+        
+        result = {
+            "response": response.choices[0].message.content,
+            "usage": response.usage.model_dump() if response.usage else None
+        }
+        if cache_key:
+            chat_cache.set(cache_key, result)
+        return result
+    except HTTPException:
+        raise
+    except openai.OpenAIError as e:
+        chat_metrics.errors += 1
+        logger.error(f"OpenAI API error: {str(e)}")
+        raise HTTPException(
+            status_code=503,
+            detail="Service temporarily unavailable"
+        )
+    except Exception as e:
+        chat_metrics.errors += 1
+        logger.error(f"Error in chat completion: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"An error occurred while processing your request: {str(e)}"
+        )
+
+@app.get("/chat/metrics")
+async def get_chat_metrics(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    return {**chat_metrics.snapshot(), "cache": chat_cache.stats()}
+
+@app.get("/health")
+async def health_check():
+    return {"status": "healthy"}
+
+class StudentCreate(BaseModel):
+    name: str
+
+class StudentUpdate(BaseModel):
+    name: str
+
+class Student(StudentCreate):
+    id: int
+
+class StudentBatchCreate(BaseModel):
+    students: List[StudentCreate]
+
+class StudentPage(BaseModel):
+    items: List[Student]
+    next_after: Optional[int] = None
+
+# Students live in a store shared by all workers; IDs are assigned by the store
+STUDENT_STORE_BACKEND = os.getenv("STUDENT_STORE_BACKEND", "sqlite")
+STUDENT_BATCH_LIMIT = 500
+
+async def open_student_store() -> StudentStore:
+    if STUDENT_STORE_BACKEND == "mongo":
+        from .db.connection import MongoDB, get_database
+        await MongoDB.connect_to_database()
+        return create_student_store("mongo", database=get_database())
+    return create_student_store("sqlite", db_path=os.getenv("STUDENT_DB_PATH", DEFAULT_DB_PATH))
+
+async def close_student_store(store: StudentStore) -> None:
+    store.close()
+    if STUDENT_STORE_BACKEND == "mongo":
+        from .db.connection import MongoDB
+        await MongoDB.close_database_connection()
+
+def get_student_store(request: Request) -> StudentStore:
+    """Return the store the lifespan opened"""
+    return request.app.state.student_store
+
+@app.post("/students", response_model=Student)
+async def create_student(student: StudentCreate, student_store: StudentStore = Depends(get_student_store)):
+    return await student_store.create(student.name)
+
+@app.post("/students/batch", response_model=List[Student])
+async def create_students(batch: StudentBatchCreate, student_store: StudentStore = Depends(get_student_store)):
+    if len(batch.students) > STUDENT_BATCH_LIMIT:
+        raise HTTPException(status_code=400, detail=f"At most {STUDENT_BATCH_LIMIT} students per batch")
+    return await student_store.create_many([student.name for student in batch.students])
+
+@app.get("/students/batch", response_model=List[Student])
+async def get_students(ids: List[int] = Query(...), student_store: StudentStore = Depends(get_student_store)):
+    if len(ids) > STUDENT_BATCH_LIMIT:
+        raise HTTPException(status_code=400, detail=f"At most {STUDENT_BATCH_LIMIT} IDs per batch")
+    return await student_store.get_many(ids)
+
+@app.get("/students", response_model=StudentPage)
+async def list_students(
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[int] = None,
+    student_store: StudentStore = Depends(get_student_store)
+):
+    items = await student_store.list(limit=limit, after_id=after)
+    return {"items": items, "next_after": items[-1]["id"] if len(items) == limit else None}
+
+@app.get("/students/{student_id}", response_model=Student)
+async def get_student(student_id: int, student_store: StudentStore = Depends(get_student_store)):
+    student = await student_store.get(student_id)
+    if not student:
+        raise HTTPException(status_code=404, detail="Student not found")
+    return student
+
+@app.put("/students/{student_id}", response_model=Student)
+async def update_student(
+    student_id: int,
+    student_update: StudentUpdate,
+    student_store: StudentStore = Depends(get_student_store)
+):
+    student = await student_store.update(student_id, student_update.name)
+    if not student:
+        raise HTTPException(status_code=404, detail="Student not found")
+    return student
+
+@app.delete("/students/{student_id}")
+async def delete_student(student_id: int, student_store: StudentStore = Depends(get_student_store)):
+    if not await student_store.delete(student_id):
+        raise HTTPException(status_code=404, detail="Student not found")
+    return {"detail": "Student deleted successfully"}
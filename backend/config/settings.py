@@ -7,9 +7,16 @@ class Settings(BaseSettings):
     app_version: str = "1.0.0"
     mongodb_uri: str = Field(..., env="MONGODB_URI")
     mongodb_name: str = Field("geaux_academy", env="MONGODB_NAME")
+    mongodb_max_pool_size: int = Field(100, env="MONGODB_MAX_POOL_SIZE")
+    mongodb_min_pool_size: int = Field(10, env="MONGODB_MIN_POOL_SIZE")
+    mongodb_max_idle_time_ms: int = Field(60000, env="MONGODB_MAX_IDLE_TIME_MS")
+    mongodb_wait_queue_timeout_ms: int = Field(2000, env="MONGODB_WAIT_QUEUE_TIMEOUT_MS")
+    mongodb_server_selection_timeout_ms: int = Field(5000, env="MONGODB_SERVER_SELECTION_TIMEOUT_MS")
+    mongodb_ensure_indexes: bool = Field(True, env="MONGODB_ENSURE_INDEXES")
     cors_origins: List[str] = ["http://localhost:3000", "https://geauxacademy.com"]
     firebase_project_id: str = Field(..., env="FIREBASE_PROJECT_ID")
     firebase_web_api_key: str = Field(..., env="FIREBASE_WEB_API_KEY")
+    cheshire_cat_url: str = Field("http://localhost:1865", env="CHESHIRE_CAT_URL")
     
     class Config:
         env_file = ".env"
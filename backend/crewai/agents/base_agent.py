@@ -1,24 +1,38 @@
 # backend/crewai/agents/base_agent.py
 from cheshire_cat_sdk import CheshireCat
 from typing import Dict, Any, List, Optional
+from .memory_writer import MemoryWriter
 
 class BaseAgent:
-    def __init__(self, agent_id: str, name: str, role: str, cat_client: CheshireCat):
+    def __init__(
+        self,
+        agent_id: str,
+        name: str,
+        role: str,
+        cat_client: CheshireCat,
+        memory_writer: Optional[MemoryWriter] = None
+    ):
         self.agent_id = agent_id
         self.name = name
         self.role = role
         self.cat_client = cat_client  # Cheshire Cat client for memory operations
+        self.memory_writer = memory_writer  # Background writer; memories are stored inline without one
     
-    async def store_memory(self, content: str, metadata: Dict[str, Any]) -> str:
-        """Store a memory in Cheshire Cat"""
+    async def store_memory(self, content: str, metadata: Dict[str, Any]) -> Optional[str]:
+        """Store a memory in Cheshire Cat, returning its ID unless the write was handed to the memory writer"""
+        metadata = {
+            "agent_id": self.agent_id,
+            "agent_name": self.name,
+            "agent_role": self.role,
+            **metadata
+        }
+        if self.memory_writer is not None:
+            self.memory_writer.write(content, metadata)
+            return None
+        
         memory_id = await self.cat_client.memory.add_memory(
             content=content,
-            metadata={
-                "agent_id": self.agent_id,
-                "agent_name": self.name,
-                "agent_role": self.role,
-                **metadata
-            }
+            metadata=metadata
         )
         return memory_id
     
@@ -0,0 +1,63 @@
+# backend/crewai/agents/memory_writer.py
+from typing import Dict, Any, List, Optional
+import asyncio
+import logging
+from cheshire_cat_sdk import CheshireCat
+
+logger = logging.getLogger(__name__)
+
+class MemoryWriter:
+    """Writes memories to Cheshire Cat in the background, off the request's critical path"""
+
+    def __init__(self, cat_client: CheshireCat, concurrency: int = 4, max_pending: int = 1000):
+        self.cat_client = cat_client
+        self.concurrency = concurrency
+        self.max_pending = max_pending
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+
+    def write(self, content: str, metadata: Dict[str, Any]) -> None:
+        """Schedule a memory write without waiting for it"""
+        self._ensure_workers()
+        try:
+            self._queue.put_nowait((content, metadata))
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logger.warning("Memory write queue is full; dropping %s memory", metadata.get("type", "untyped"))
+
+    async def flush(self) -> None:
+        """Wait until every scheduled write has been attempted"""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def stop(self) -> None:
+        """Flush pending writes and stop the workers"""
+        await self.flush()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+
+    def _ensure_workers(self) -> None:
+        if self._workers:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_pending)
+        self._workers = [
+            asyncio.create_task(self._worker()) for _ in range(self.concurrency)
+        ]
+
+    async def _worker(self) -> None:
+        while True:
+            content, metadata = await self._queue.get()
+            try:
+                await self.cat_client.memory.add_memory(content=content, metadata=metadata)
+                self.written += 1
+            except Exception:
+                self.failed += 1
+                logger.exception("Failed to write %s memory", metadata.get("type", "untyped"))
+            finally:
+                self._queue.task_done()
@@ -5,17 +5,28 @@ from .base_agent import BaseAgent
 class TeacherAgent(BaseAgent):
     """Agent responsible for creating personalized educational content"""
     
-    async def process_task(self, task_input: Dict[str, Any], context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        # 1. Build prompt from task input and context
+    async def recall_curriculum_memories(self, task_input: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Recall previous curricula relevant to the task (independent of the research output)"""
         learning_style = task_input.get("learning_style", "visual")
         subject = task_input.get("subject", "general")
         grade_level = task_input.get("grade_level", "elementary")
         
-        # 2. Recall relevant memories for curriculum design
-        related_memories = await self.recall_memories(
+        return await self.recall_memories(
             query=f"curriculum for {subject} at {grade_level} level for {learning_style} learners",
             limit=3
         )
+    
+    async def process_task(self, task_input: Dict[str, Any], context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        # 1. Build prompt from task input and context
+        learning_style = task_input.get("learning_style", "visual")
+        subject = task_input.get("subject", "general")
+        grade_level = task_input.get("grade_level", "elementary")
+        
+        # 2. Recall relevant memories for curriculum design, unless the caller already did
+        if context and "related_memories" in context:
+            related_memories = context["related_memories"]
+        else:
+            related_memories = await self.recall_curriculum_memories(task_input)
         
         # 3. Generate curriculum content using LLM
         # This would use the CrewAI task handling
@@ -0,0 +1,82 @@
+# backend/crewai/orchestrator/flow.py
+from typing import Dict, Any, List, Callable, Awaitable, Iterable
+import asyncio
+
+class FlowStage:
+    """A named step of a task flow and the stages whose outputs it needs"""
+
+    def __init__(
+        self,
+        name: str,
+        run: Callable[[Dict[str, Any]], Awaitable[Any]],
+        depends_on: Iterable[str] = ()
+    ):
+        self.name = name
+        self.run = run
+        self.depends_on = tuple(depends_on)
+
+class TaskFlow:
+    """
+    A DAG of stages. Each stage starts as soon as the stages it depends on have finished,
+    so independent stages run concurrently.
+    """
+
+    def __init__(self, stages: List[FlowStage]):
+        self.stages = stages
+        self._order = self._topological_order(stages)
+
+    async def run(self, task_input: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run every stage and return their outputs keyed by stage name.
+        Stages receive a dict holding the flow input under "input" plus their dependencies' outputs.
+        """
+        results: Dict[str, Any] = {"input": task_input}
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def run_stage(stage: FlowStage) -> Any:
+            if stage.depends_on:
+                await asyncio.gather(*(tasks[name] for name in stage.depends_on))
+            output = await stage.run(results)
+            results[stage.name] = output
+            return output
+
+        for stage in self._order:
+            tasks[stage.name] = asyncio.create_task(run_stage(stage))
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+        return results
+
+    @staticmethod
+    def _topological_order(stages: List[FlowStage]) -> List[FlowStage]:
+        by_name = {stage.name: stage for stage in stages}
+        if len(by_name) != len(stages):
+            raise ValueError("Flow stage names must be unique")
+        for stage in stages:
+            for dependency in stage.depends_on:
+                if dependency not in by_name:
+                    raise ValueError(f"Stage '{stage.name}' depends on unknown stage '{dependency}'")
+
+        order: List[FlowStage] = []
+        visiting, done = set(), set()
+
+        def visit(stage: FlowStage) -> None:
+            if stage.name in done:
+                return
+            if stage.name in visiting:
+                raise ValueError(f"Flow has a dependency cycle through '{stage.name}'")
+            visiting.add(stage.name)
+            for dependency in stage.depends_on:
+                visit(by_name[dependency])
+            visiting.discard(stage.name)
+            done.add(stage.name)
+            order.append(stage)
+
+        for stage in stages:
+            visit(stage)
+        return order
@@ -0,0 +1,123 @@
+# backend/crewai/orchestrator/job_queue.py
+from typing import Dict, Any, List, Optional, Callable, Awaitable
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+class QueueFullError(Exception):
+    """Raised when a job cannot be admitted because the queue or the user's cap is full"""
+
+    def __init__(self, message: str, retry_after: int = 5):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+class _Job:
+    __slots__ = ("job_id", "user_id", "run", "enqueued_at")
+
+    def __init__(self, job_id: str, user_id: str, run: Callable[[], Awaitable[None]]):
+        self.job_id = job_id
+        self.user_id = user_id
+        self.run = run
+        self.enqueued_at = time.monotonic()
+
+class TaskJobQueue:
+    """
+    Bounded admission queue drained by a fixed number of workers.
+    Each user may have at most `per_user_limit` jobs queued or running at once.
+    """
+
+    def __init__(self, worker_count: int = 4, max_queue_size: int = 100, per_user_limit: int = 3):
+        self.worker_count = worker_count
+        self.max_queue_size = max_queue_size
+        self.per_user_limit = per_user_limit
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._in_flight: Dict[str, int] = {}
+        self._running = 0
+        # Metrics
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def submit(self, job_id: str, user_id: str, run: Callable[[], Awaitable[None]]) -> int:
+        """
+        Admit a job and return its 1-based position in the queue.
+        Raises QueueFullError instead of queueing when the queue or the user's cap is full.
+        """
+        self._ensure_workers()
+
+        if self._in_flight.get(user_id, 0) >= self.per_user_limit:
+            self.rejected += 1
+            raise QueueFullError(
+                f"User already has {self.per_user_limit} tasks queued or running"
+            )
+        if self._queue.full():
+            self.rejected += 1
+            raise QueueFullError("Task queue is full")
+
+        self._queue.put_nowait(_Job(job_id, user_id, run))
+        self._in_flight[user_id] = self._in_flight.get(user_id, 0) + 1
+        self.submitted += 1
+        return self._queue.qsize()
+
+    async def stop(self) -> None:
+        """Cancel the workers; jobs still queued are dropped"""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of queue depth, throughput and wait-time metrics"""
+        started = self.completed + self.failed + self._running
+        return {
+            "workers": self.worker_count,
+            "queue_depth": self._queue.qsize() if self._queue else 0,
+            "max_queue_size": self.max_queue_size,
+            "running": self._running,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "avg_wait_seconds": self._wait_total / started if started else 0.0,
+            "max_wait_seconds": self._wait_max
+        }
+
+    def _ensure_workers(self) -> None:
+        if self._workers:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._workers = [
+            asyncio.create_task(self._worker()) for _ in range(self.worker_count)
+        ]
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            wait = time.monotonic() - job.enqueued_at
+            self._wait_total += wait
+            self._wait_max = max(self._wait_max, wait)
+            self._running += 1
+            try:
+                await job.run()
+                self.completed += 1
+            except Exception:
+                self.failed += 1
+                logger.exception("Job %s failed", job.job_id)
+            finally:
+                self._running -= 1
+                self._release(job.user_id)
+                self._queue.task_done()
+
+    def _release(self, user_id: str) -> None:
+        remaining = self._in_flight.get(user_id, 0) - 1
+        if remaining > 0:
+            self._in_flight[user_id] = remaining
+        else:
+            self._in_flight.pop(user_id, None)
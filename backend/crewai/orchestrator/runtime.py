@@ -0,0 +1,52 @@
+# backend/crewai/orchestrator/runtime.py
+from typing import Optional, TYPE_CHECKING
+from ...config.settings import get_settings
+from ...metrics import metrics
+
+if TYPE_CHECKING:
+    from .task_manager import TaskOrchestrator
+
+# The orchestrator serving this process; the app binds it at startup and shuts it down
+# from its lifespan so worker pools and pending memory writes are not abandoned
+_orchestrator: Optional["TaskOrchestrator"] = None
+
+def create_orchestrator() -> "TaskOrchestrator":
+    """Build the orchestrator the app serves, talking to the configured Cheshire Cat"""
+    # Imported here so binding the runtime does not pull in the agents and their SDK
+    from cheshire_cat_sdk import CheshireCat
+    from .task_manager import TaskOrchestrator
+    return TaskOrchestrator(CheshireCat(get_settings().cheshire_cat_url))
+
+def set_orchestrator(orchestrator: Optional["TaskOrchestrator"]) -> None:
+    """Make an orchestrator the one served to routes, or clear it with None"""
+    global _orchestrator
+    _orchestrator = orchestrator
+
+def get_orchestrator() -> Optional["TaskOrchestrator"]:
+    """The active orchestrator, or None if the app has not bound one"""
+    return _orchestrator
+
+def _job_queue_stat(name: str) -> float:
+    """Read a job queue figure from the active orchestrator; 0 while none is bound"""
+    if _orchestrator is None:
+        return 0
+    return _orchestrator.job_queue.stats()[name]
+
+# Registered once per process; the gauges follow whichever orchestrator is bound
+metrics.register_gauge(
+    "orchestrator_queue_depth",
+    "Agent tasks waiting for a worker",
+    lambda: _job_queue_stat("queue_depth")
+)
+metrics.register_gauge(
+    "orchestrator_jobs_running",
+    "Agent tasks currently being executed",
+    lambda: _job_queue_stat("running")
+)
+
+async def shutdown_orchestrator() -> None:
+    """Shut down the active orchestrator, if any, and unbind it"""
+    global _orchestrator
+    orchestrator, _orchestrator = _orchestrator, None
+    if orchestrator is not None:
+        await orchestrator.shutdown()
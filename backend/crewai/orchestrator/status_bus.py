@@ -0,0 +1,40 @@
+# backend/crewai/orchestrator/status_bus.py
+from typing import Dict, Any, Set
+import asyncio
+
+TERMINAL_STATUSES = ("completed", "failed")
+
+class TaskStatusBus:
+    """In-process publish/subscribe channel for task status transitions"""
+
+    def __init__(self):
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+
+    def subscribe(self, task_id: str) -> asyncio.Queue:
+        """Register interest in a task and return the queue its updates are delivered to"""
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers.setdefault(task_id, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, task_id: str, queue: asyncio.Queue) -> None:
+        """Stop delivering updates for a task to the given queue"""
+        queues = self._subscribers.get(task_id)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[task_id]
+
+    def publish(self, task_id: str, status: Dict[str, Any]) -> int:
+        """
+        Deliver a status transition to every subscriber of the task.
+        Returns the number of subscribers that received it.
+        """
+        queues = self._subscribers.get(task_id, ())
+        for queue in queues:
+            queue.put_nowait(status)
+        return len(queues)
+
+    def subscriber_count(self, task_id: str) -> int:
+        """Number of active subscribers for a task"""
+        return len(self._subscribers.get(task_id, ()))
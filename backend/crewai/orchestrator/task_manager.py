@@ -1,40 +1,70 @@
 # backend/crewai/orchestrator/task_manager.py
-from typing import Dict, Any, List
-import asyncio
+from typing import Dict, Any, List, Optional
+import uuid
 from ..agents.teacher_agent import TeacherAgent
 from ..agents.researcher_agent import ResearcherAgent
 from ..agents.supervisor_agent import SupervisorAgent
+from .status_bus import TaskStatusBus
+from .task_store import TaskStateStore, InMemoryTaskStore
+from .job_queue import TaskJobQueue, QueueFullError
+from .flow import TaskFlow, FlowStage
+from ..agents.memory_writer import MemoryWriter
 from cheshire_cat_sdk import CheshireCat
 
 class TaskOrchestrator:
     """Orchestrates tasks between multiple agents"""
     
-    def __init__(self, cat_client: CheshireCat):
+    def __init__(
+        self,
+        cat_client: CheshireCat,
+        status_bus: Optional[TaskStatusBus] = None,
+        task_store: Optional[TaskStateStore] = None,
+        job_queue: Optional[TaskJobQueue] = None,
+        memory_writer: Optional[MemoryWriter] = None
+    ):
         self.cat_client = cat_client
+        # Status transitions are pushed to subscribers instead of being polled
+        self.status_bus = status_bus or TaskStatusBus()
+        # Latest status of each task lives here rather than in semantic memory
+        self.task_store = task_store or InMemoryTaskStore()
+        # Fixed worker pool so bursts of requests queue up instead of all running at once
+        self.job_queue = job_queue or TaskJobQueue()
+        # Memory writes happen in the background instead of on the critical path
+        self.memory_writer = memory_writer or MemoryWriter(cat_client)
         # Initialize agents
         self.teacher = TeacherAgent(
             agent_id="teacher-001", 
             name="Teacher",
             role="curriculum_creation",
-            cat_client=cat_client
+            cat_client=cat_client,
+            memory_writer=self.memory_writer
         )
         self.researcher = ResearcherAgent(
             agent_id="researcher-001",
             name="Researcher",
             role="content_research",
-            cat_client=cat_client
+            cat_client=cat_client,
+            memory_writer=self.memory_writer
         )
         self.supervisor = SupervisorAgent(
             agent_id="supervisor-001",
             name="Supervisor",
             role="quality_control",
-            cat_client=cat_client
+            cat_client=cat_client,
+            memory_writer=self.memory_writer
         )
+        # Stages run as soon as the stages they depend on have finished
+        self.flow = TaskFlow([
+            FlowStage("research", self._research),
+            FlowStage("teacher_memories", self._recall_teacher_memories),
+            FlowStage("teacher", self._teach, depends_on=("research", "teacher_memories")),
+            FlowStage("supervisor", self._supervise, depends_on=("research", "teacher"))
+        ])
     
     async def execute_task_flow(self, task_input: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a full task flow using multiple agents"""
         # 1. Store the original task request in memory
-        task_id = await self.cat_client.memory.add_memory(
+        self.memory_writer.write(
             content=str(task_input),
             metadata={
                 "type": "task_request",
@@ -42,23 +72,12 @@ class TaskOrchestrator:
             }
         )
         
-        # 2. Start with research to gather information
-        research_output = await self.researcher.process_task(task_input)
+        # 2. Run the agent stages, overlapping those with independent inputs
+        outputs = await self.flow.run(task_input)
+        final_output = outputs["supervisor"]
         
-        # 3. Teacher creates educational content based on research
-        teacher_input = {**task_input, "research": research_output["content"]}
-        teacher_output = await self.teacher.process_task(teacher_input)
-        
-        # 4. Supervisor reviews and finalizes the output
-        supervisor_input = {
-            **task_input,
-            "research_output": research_output["content"],
-            "teacher_output": teacher_output["content"]
-        }
-        final_output = await self.supervisor.process_task(supervisor_input)
-        
-        # 5. Store the final output in memory
-        await self.cat_client.memory.add_memory(
+        # 3. Store the final output in memory
+        self.memory_writer.write(
             content=str(final_output),
             metadata={
                 "type": "task_result",
@@ -69,73 +88,106 @@ class TaskOrchestrator:
         
         return final_output
     
-    async def execute_async_task(self, task_input: Dict[str, Any]) -> str:
+    async def _research(self, outputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Researcher gathers information about the subject"""
+        return await self.researcher.process_task(outputs["input"])
+    
+    async def _recall_teacher_memories(self, outputs: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Teacher's memory recall only needs the request, so it runs alongside research"""
+        return await self.teacher.recall_curriculum_memories(outputs["input"])
+    
+    async def _teach(self, outputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Teacher creates educational content based on research"""
+        teacher_input = {**outputs["input"], "research": outputs["research"]["content"]}
+        return await self.teacher.process_task(
+            teacher_input,
+            context={"related_memories": outputs["teacher_memories"]}
+        )
+    
+    async def _supervise(self, outputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Supervisor reviews and finalizes the output"""
+        supervisor_input = {
+            **outputs["input"],
+            "research_output": outputs["research"]["content"],
+            "teacher_output": outputs["teacher"]["content"]
+        }
+        return await self.supervisor.process_task(supervisor_input)
+    
+    async def execute_async_task(self, task_input: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Starts a task asynchronously and returns a task ID
+        Queues a task for execution and returns its ID and queue position
         This allows for long-running tasks without blocking
+        Raises QueueFullError when the task cannot be admitted
         """
         task_id = task_input.get("task_id") or str(uuid.uuid4())
         
-        # Store task status as "in progress"
-        await self.cat_client.memory.add_memory(
-            content="Task started",
-            metadata={
-                "type": "task_status",
-                "task_id": task_id,
-                "status": "in_progress"
-            }
-        )
+        # Store task status as "queued" before a worker can pick it up
+        record = await self.task_store.set_status(task_id, "queued", "Waiting for a worker")
+        
+        # Admit the task to the worker pool; it runs once a worker is free
+        try:
+            position = self.job_queue.submit(
+                task_id,
+                task_input.get("user_id", "anonymous"),
+                lambda: self._execute_and_update(task_id, task_input)
+            )
+        except QueueFullError:
+            await self.task_store.delete(task_id)
+            raise
         
-        # Start task execution in background
-        asyncio.create_task(self._execute_and_update(task_id, task_input))
+        # Subscribers only hear about admitted tasks; nothing awaits between submit and
+        # publish, so a worker cannot report "in_progress" ahead of this
+        self.status_bus.publish(task_id, self._format_status(record))
         
-        return task_id
+        return {"task_id": task_id, "status": "queued", "queue_position": position}
+    
+    async def shutdown(self) -> None:
+        """
+        Stop the worker pool, then write out pending memories.
+        Queued tasks are dropped and running ones cancelled.
+        """
+        await self.job_queue.stop()
+        await self.memory_writer.stop()
     
     async def _execute_and_update(self, task_id: str, task_input: Dict[str, Any]) -> None:
         """Internal method to execute a task and update its status"""
+        await self._update_status(task_id, "in_progress", "Task started")
         try:
             result = await self.execute_task_flow(task_input)
             # Update task status to "completed"
-            await self.cat_client.memory.add_memory(
-                content=str(result),
-                metadata={
-                    "type": "task_status",
-                    "task_id": task_id,
-                    "status": "completed"
-                }
-            )
+            await self._update_status(task_id, "completed", str(result), result=result)
         except Exception as e:
             # Update task status to "failed"
-            await self.cat_client.memory.add_memory(
-                content=str(e),
-                metadata={
-                    "type": "task_status",
-                    "task_id": task_id,
-                    "status": "failed",
-                    "error": str(e)
-                }
-            )
+            await self._update_status(task_id, "failed", str(e))
+    
+    async def _update_status(
+        self,
+        task_id: str,
+        status: str,
+        details: str,
+        result: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Record a status transition and push it to every subscriber of the task"""
+        record = await self.task_store.set_status(task_id, status, details, result)
+        self.status_bus.publish(task_id, self._format_status(record))
     
     async def get_task_status(self, task_id: str) -> Dict[str, Any]:
         """Get the current status of a task"""
-        memories = await self.cat_client.memory.recall_memories(
-            query="",  # Empty query to use only filters
-            filters={
-                "type": "task_status",
-                "task_id": task_id
-            },
-            limit=1,
-            sort_by="created_at",
-            sort_order="desc"
-        )
+        record = await self.task_store.get(task_id)
         
-        if not memories:
+        if record is None:
             return {"status": "unknown", "task_id": task_id}
         
-        latest_status = memories[0]
-        return {
-            "status": latest_status["metadata"]["status"],
-            "task_id": task_id,
-            "last_updated": latest_status["created_at"],
-            "details": latest_status.get("content", "")
-        }
\ No newline at end of file
+        return self._format_status(record)
+    
+    @staticmethod
+    def _format_status(record: Dict[str, Any]) -> Dict[str, Any]:
+        status = {
+            "status": record["status"],
+            "task_id": record["task_id"],
+            "last_updated": record["last_updated"],
+            "details": record["details"]
+        }
+        if record.get("result") is not None:
+            status["result"] = record["result"]
+        return status
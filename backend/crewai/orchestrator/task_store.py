@@ -0,0 +1,200 @@
+# backend/crewai/orchestrator/task_store.py
+from abc import ABC, abstractmethod
+from typing import Dict, Any, Optional
+from collections import OrderedDict
+from datetime import datetime
+import asyncio
+import json
+import sqlite3
+import time
+
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+
+class TaskStateStore(ABC):
+    """
+    Interface for task-state backends.
+    Keeps only the latest status of each task, keyed by task_id, and expires entries after a TTL.
+    """
+
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+
+    @abstractmethod
+    async def set_status(
+        self,
+        task_id: str,
+        status: str,
+        details: str = "",
+        result: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Replace the stored state of a task and return the new record"""
+
+    @abstractmethod
+    async def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Return the latest state of a task, or None if unknown or expired"""
+
+    @abstractmethod
+    async def delete(self, task_id: str) -> None:
+        """Forget a task"""
+
+    @abstractmethod
+    async def purge_expired(self) -> int:
+        """Drop expired entries and return how many were removed"""
+
+    def _build_record(
+        self,
+        task_id: str,
+        status: str,
+        details: str,
+        result: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        return {
+            "task_id": task_id,
+            "status": status,
+            "details": details,
+            "result": result,
+            "last_updated": datetime.utcnow().isoformat(),
+            "expires_at": time.time() + self.ttl_seconds
+        }
+
+class InMemoryTaskStore(TaskStateStore):
+    """Task-state store held in process memory"""
+
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        super().__init__(ttl_seconds)
+        # Ordered by last write; with a fixed TTL that is also expiry order
+        self._records: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    async def set_status(self, task_id, status, details="", result=None):
+        record = self._build_record(task_id, status, details, result)
+        self._records[task_id] = record
+        self._records.move_to_end(task_id)
+        self._purge(time.time())
+        return dict(record)
+
+    async def get(self, task_id):
+        record = self._records.get(task_id)
+        if record is None:
+            return None
+        if record["expires_at"] <= time.time():
+            del self._records[task_id]
+            return None
+        return dict(record)
+
+    async def delete(self, task_id):
+        self._records.pop(task_id, None)
+
+    async def purge_expired(self):
+        return self._purge(time.time())
+
+    def _purge(self, now: float) -> int:
+        removed = 0
+        while self._records:
+            task_id, record = next(iter(self._records.items()))
+            if record["expires_at"] > now:
+                break
+            del self._records[task_id]
+            removed += 1
+        return removed
+
+class SQLiteTaskStore(TaskStateStore):
+    """Task-state store persisted to a SQLite database, one row per task"""
+
+    def __init__(self, db_path: str = "task_state.db", ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        super().__init__(ttl_seconds)
+        self.db_path = db_path
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = asyncio.Lock()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS task_state (
+                task_id TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                details TEXT,
+                result TEXT,
+                last_updated TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_task_state_expires_at ON task_state (expires_at)"
+        )
+        self._conn.commit()
+
+    async def set_status(self, task_id, status, details="", result=None):
+        record = self._build_record(task_id, status, details, result)
+        await self._run(
+            """
+            INSERT INTO task_state (task_id, status, details, result, last_updated, expires_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(task_id) DO UPDATE SET
+                status = excluded.status,
+                details = excluded.details,
+                result = excluded.result,
+                last_updated = excluded.last_updated,
+                expires_at = excluded.expires_at
+            """,
+            (
+                task_id,
+                status,
+                details,
+                json.dumps(result, default=str) if result is not None else None,
+                record["last_updated"],
+                record["expires_at"]
+            )
+        )
+        return record
+
+    async def get(self, task_id):
+        rows = await self._run(
+            """
+            SELECT task_id, status, details, result, last_updated, expires_at
+            FROM task_state WHERE task_id = ? AND expires_at > ?
+            """,
+            (task_id, time.time())
+        )
+        if not rows:
+            return None
+        task_id, status, details, result, last_updated, expires_at = rows[0]
+        return {
+            "task_id": task_id,
+            "status": status,
+            "details": details,
+            "result": json.loads(result) if result is not None else None,
+            "last_updated": last_updated,
+            "expires_at": expires_at
+        }
+
+    async def delete(self, task_id):
+        await self._run("DELETE FROM task_state WHERE task_id = ?", (task_id,))
+
+    async def purge_expired(self):
+        return await self._run(
+            "DELETE FROM task_state WHERE expires_at <= ?",
+            (time.time(),),
+            rowcount=True
+        )
+
+    def close(self) -> None:
+        self._conn.close()
+
+    async def _run(self, sql: str, params: tuple, rowcount: bool = False):
+        """Run a statement off the event loop, serialised on the shared connection"""
+        async with self._lock:
+            return await asyncio.to_thread(self._execute, sql, params, rowcount)
+
+    def _execute(self, sql: str, params: tuple, rowcount: bool):
+        cursor = self._conn.execute(sql, params)
+        rows = cursor.fetchall()
+        self._conn.commit()
+        return cursor.rowcount if rowcount else rows
+
+def create_task_store(backend: str = "memory", **kwargs) -> TaskStateStore:
+    """Build a task-state store by backend name ("memory" or "sqlite")"""
+    if backend == "memory":
+        return InMemoryTaskStore(**kwargs)
+    if backend == "sqlite":
+        return SQLiteTaskStore(**kwargs)
+    raise ValueError(f"Unknown task store backend: {backend}")
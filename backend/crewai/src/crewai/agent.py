@@ -1,6 +1,8 @@
+import asyncio
 import os
+from copy import copy as shallow_copy
 from inspect import signature
-from typing import Any, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from langchain.agents.agent import RunnableAgent
 from langchain.agents.tools import BaseTool
@@ -16,6 +18,7 @@ from crewai.memory.contextual.contextual_memory import ContextualMemory
 from crewai.tools.agent_tools import AgentTools
 from crewai.utilities import Converter, Prompts
 from crewai.utilities.constants import TRAINED_AGENTS_DATA_FILE, TRAINING_DATA_FILE
+from crewai.utilities.exceptions.task_cancelled_exception import TaskCancelledError
 from crewai.utilities.token_counter_callback import TokenCalcHandler
 from crewai.utilities.training_handler import CrewTrainingHandler
 
@@ -137,6 +140,24 @@ class Agent(BaseAgent):
             self.set_cache_handler(self.cache_handler)
         return self
 
+    def fork(self) -> "Agent":
+        """Create a lightweight copy of the agent for a single run.
+
+        The LLM is shallow-copied so the fork's token usage is counted against its
+        own token process rather than this agent's.
+        """
+        forked = super().fork()
+        forked.tools_results = []
+        forked._times_executed = 0
+        if hasattr(self.llm, "model_name"):
+            forked.llm = shallow_copy(self.llm)
+            forked.llm.callbacks = [
+                handler
+                for handler in (self.llm.callbacks or [])
+                if not isinstance(handler, TokenCalcHandler)
+            ] + [TokenCalcHandler(self.llm.model_name, forked._token_process)]
+        return forked
+
     def execute_task(
         self,
         task: Any,
@@ -153,6 +174,67 @@ class Agent(BaseAgent):
         Returns:
             Output of the agent
         """
+        task_prompt = self._prepare_task_execution(task, context, tools)
+
+        try:
+            result = self.agent_executor.invoke(self._executor_inputs(task_prompt))[
+                "output"
+            ]
+        except TaskCancelledError:
+            raise
+        except Exception as e:
+            self._times_executed += 1
+            if self._times_executed > self.max_retry_limit:
+                raise e
+            result = self.execute_task(task, context, tools)
+
+        return self._finish_task_execution(result)
+
+    async def aexecute_task(
+        self,
+        task: Any,
+        context: Optional[str] = None,
+        tools: Optional[List[Any]] = None,
+    ) -> str:
+        """Execute a task with the agent, awaiting the LLM instead of blocking a thread.
+
+        Args:
+            task: Task to execute.
+            context: Context to execute the task in.
+            tools: Tools to use for the task.
+
+        Returns:
+            Output of the agent
+        """
+        if self.crew and self.crew.memory:
+            # Memory lookups hit the embedder and vector stores synchronously
+            task_prompt = await asyncio.to_thread(
+                self._prepare_task_execution, task, context, tools
+            )
+        else:
+            task_prompt = self._prepare_task_execution(task, context, tools)
+
+        try:
+            result = (
+                await self.agent_executor.ainvoke(self._executor_inputs(task_prompt))
+            )["output"]
+        except TaskCancelledError:
+            raise
+        except Exception as e:
+            self._times_executed += 1
+            if self._times_executed > self.max_retry_limit:
+                raise e
+            result = await self.aexecute_task(task, context, tools)
+
+        return self._finish_task_execution(result)
+
+    def _prepare_task_execution(
+        self,
+        task: Any,
+        context: Optional[str],
+        tools: Optional[List[Any]],
+    ) -> str:
+        """Build the task prompt and point the agent executor at the task and its tools."""
         if self.tools_handler:
             self.tools_handler.last_used_tool = {}  # type: ignore # Incompatible types in assignment (expression has type "dict[Never, Never]", variable has type "ToolCalling")
 
@@ -189,20 +271,16 @@ class Agent(BaseAgent):
         else:
             task_prompt = self._use_trained_data(task_prompt=task_prompt)
 
-        try:
-            result = self.agent_executor.invoke(
-                {
-                    "input": task_prompt,
-                    "tool_names": self.agent_executor.tools_names,
-                    "tools": self.agent_executor.tools_description,
-                }
-            )["output"]
-        except Exception as e:
-            self._times_executed += 1
-            if self._times_executed > self.max_retry_limit:
-                raise e
-            result = self.execute_task(task, context, tools)
+        return task_prompt
+
+    def _executor_inputs(self, task_prompt: str) -> Dict[str, Any]:
+        return {
+            "input": task_prompt,
+            "tool_names": self.agent_executor.tools_names,
+            "tools": self.agent_executor.tools_description,
+        }
 
+    def _finish_task_execution(self, result: str) -> str:
         if self.max_rpm:
             self._rpm_controller.stop_rpm_counter()
 
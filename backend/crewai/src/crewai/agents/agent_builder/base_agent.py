@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 from abc import ABC, abstractmethod
 from copy import copy as shallow_copy
@@ -67,6 +68,8 @@ class BaseAgent(ABC, BaseModel):
             Increment formatting errors.
         copy() -> "BaseAgent":
             Create a copy of the agent.
+        fork() -> "BaseAgent":
+            Create a lightweight copy of the agent for a single run.
         set_rpm_controller(rpm_controller: RPMController) -> None:
             Set the rpm controller for the agent.
         set_private_attrs() -> "BaseAgent":
@@ -181,6 +184,19 @@ class BaseAgent(ABC, BaseModel):
     ) -> str:
         pass
 
+    async def aexecute_task(
+        self,
+        task: Any,
+        context: Optional[str] = None,
+        tools: Optional[List[Any]] = None,
+    ) -> str:
+        """Execute a task without blocking the event loop.
+
+        Agents with an async-capable executor should override this; the default
+        runs `execute_task` in a worker thread.
+        """
+        return await asyncio.to_thread(self.execute_task, task, context, tools)
+
     @abstractmethod
     def create_agent_executor(self, tools=None) -> None:
         pass
@@ -226,6 +242,29 @@ class BaseAgent(ABC, BaseModel):
 
         return copied_agent
 
+    def fork(self: T) -> T:
+        """Create a lightweight copy of the agent for a single run.
+
+        Unlike `copy`, nothing is re-validated and no executor is built: the fork
+        shares the definition, LLM, tools, cache handler and RPM controller with this
+        agent, and only gets fresh per-run state (interpolated prompts, executor,
+        tools handler, token usage and counters).
+        """
+        forked = self.model_copy(
+            update={
+                "id": uuid.uuid4(),
+                "agent_executor": None,
+                "crew": None,
+                "tools": list(self.tools or []),
+                "tools_handler": ToolsHandler(cache=self.tools_handler.cache)
+                if self.tools_handler
+                else None,
+                "formatting_errors": 0,
+            }
+        )
+        forked._token_process = TokenProcess()
+        return forked
+
     def interpolate_inputs(self, inputs: Dict[str, Any]) -> None:
         """Interpolate inputs into the agent description and backstory."""
         if self._original_role is None:
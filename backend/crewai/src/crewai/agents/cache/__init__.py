@@ -1 +1,2 @@
+from .cache_backend import CacheBackend, InMemoryCacheBackend, SQLiteCacheBackend
 from .cache_handler import CacheHandler
@@ -0,0 +1,192 @@
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import closing
+from typing import Any, Optional
+
+from crewai.utilities import Printer
+from crewai.utilities.paths import db_storage_path
+
+
+class CacheBackend(ABC):
+    """Storage for tool results keyed by `cache_key`; a miss reads as None.
+
+    Implementations must be safe to share between threads.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Return the stored value, or None on a miss or an expired entry."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None:
+        """Store a value, evicting entries beyond the backend's bound."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of stored entries."""
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """Per-process LRU cache with an entry bound and an optional TTL."""
+
+    def __init__(
+        self, max_entries: Optional[int] = 1024, ttl_seconds: Optional[float] = None
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        expires_at = (
+            time.monotonic() + self.ttl_seconds if self.ttl_seconds is not None else None
+        )
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            if self.max_entries is not None:
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """On-disk LRU cache that survives restarts and can be shared by several processes.
+
+    Values are stored as JSON, so outputs that are not JSON types come back as strings.
+    Errors are reported and treated as misses so a broken cache never fails a tool call.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        max_entries: Optional[int] = 10000,
+        ttl_seconds: Optional[float] = None,
+    ):
+        self.db_path = db_path or f"{db_storage_path()}/tool_cache.db"
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._printer: Printer = Printer()
+        self._initialize_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        # Writers from other processes hold the lock briefly; wait rather than fail
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _initialize_db(self) -> None:
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS tool_cache (
+                        key TEXT PRIMARY KEY,
+                        value TEXT NOT NULL,
+                        created_at REAL NOT NULL,
+                        accessed_at REAL NOT NULL
+                    )
+                """
+                )
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS tool_cache_accessed_at ON tool_cache (accessed_at)"
+                )
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"CACHE ERROR: An error occurred during database initialization: {e}",
+                color="red",
+            )
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        try:
+            with closing(self._connect()) as conn, conn:
+                row = conn.execute(
+                    "SELECT value, created_at FROM tool_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                value, created_at = row
+                if self.ttl_seconds is not None and created_at + self.ttl_seconds <= now:
+                    conn.execute("DELETE FROM tool_cache WHERE key = ?", (key,))
+                    return None
+                conn.execute(
+                    "UPDATE tool_cache SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+                return json.loads(value)
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"CACHE ERROR: An error occurred while reading the tool cache: {e}",
+                color="red",
+            )
+        return None
+
+    def set(self, key: str, value: Any) -> None:
+        now = time.time()
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO tool_cache (key, value, created_at, accessed_at)
+                    VALUES (?, ?, ?, ?)
+                """,
+                    (key, json.dumps(value, default=str), now, now),
+                )
+                if self.max_entries is not None:
+                    conn.execute(
+                        """
+                        DELETE FROM tool_cache WHERE key IN (
+                            SELECT key FROM tool_cache
+                            ORDER BY accessed_at DESC
+                            LIMIT -1 OFFSET ?
+                        )
+                    """,
+                        (self.max_entries,),
+                    )
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"CACHE ERROR: An error occurred while writing to the tool cache: {e}",
+                color="red",
+            )
+
+    def clear(self) -> None:
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute("DELETE FROM tool_cache")
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"CACHE ERROR: An error occurred while clearing the tool cache: {e}",
+                color="red",
+            )
+
+    def __len__(self) -> int:
+        try:
+            with closing(self._connect()) as conn:
+                return conn.execute("SELECT COUNT(*) FROM tool_cache").fetchone()[0]
+        except sqlite3.Error:
+            return 0
@@ -1,16 +1,55 @@
-from typing import Optional
+import ast
+import hashlib
+import json
+import threading
+from typing import Any, Dict, Optional
 
+from .cache_backend import CacheBackend, InMemoryCacheBackend
+
+
+def cache_key(tool: str, input: Any) -> str:
+    """Hash of a tool name and its arguments that does not depend on argument order."""
+    if isinstance(input, str):
+        # The Hit Cache tool passes arguments as the repr of the dict the tool was called with
+        try:
+            input = ast.literal_eval(input)
+        except (ValueError, SyntaxError, RecursionError):
+            pass
+    payload = json.dumps(
+        [tool, input], sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
 
-class CacheHandler:
-    """Callback handler for tool usage."""
 
-    _cache: dict = {}
+class CacheHandler:
+    """Tool result cache with a pluggable backend and hit/miss statistics."""
 
-    def __init__(self):
-        self._cache = {}
+    def __init__(self, backend: Optional[CacheBackend] = None):
+        self.backend = backend if backend is not None else InMemoryCacheBackend()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
 
     def add(self, tool, input, output):
-        self._cache[f"{tool}-{input}"] = output
+        self.backend.set(cache_key(tool, input), output)
 
     def read(self, tool, input) -> Optional[str]:
-        return self._cache.get(f"{tool}-{input}")
+        output = self.backend.get(cache_key(tool, input))
+        with self._lock:
+            if output is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return output
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.backend),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
@@ -1,12 +1,26 @@
+import asyncio
 import threading
 import time
-from typing import Any, Dict, Iterator, List, Literal, Optional, Tuple, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
 import click
 
 
 from langchain.agents import AgentExecutor
 from langchain.agents.agent import ExceptionTool
-from langchain.callbacks.manager import CallbackManagerForChainRun
+from langchain.callbacks.manager import (
+    AsyncCallbackManagerForChainRun,
+    CallbackManagerForChainRun,
+)
 from langchain_core.agents import AgentAction, AgentFinish, AgentStep
 from langchain_core.exceptions import OutputParserException
 from langchain_core.tools import BaseTool
@@ -26,6 +40,7 @@ from crewai.utilities.constants import TRAINING_DATA_FILE
 from crewai.utilities.exceptions.context_window_exceeding_exception import (
     LLMContextLengthExceededException,
 )
+from crewai.utilities.exceptions.task_cancelled_exception import TaskCancelledError
 from crewai.utilities.training_handler import CrewTrainingHandler
 from crewai.utilities.logger import Logger
 
@@ -79,6 +94,7 @@ class CrewAgentExecutor(AgentExecutor, CrewAgentExecutorMixin):
 
         # We now enter the agent loop (until it returns something).
         while self._should_continue(self.iterations, time_elapsed):
+            self._raise_if_cancelled()
             if not self.request_within_rpm_limit or self.request_within_rpm_limit():
                 next_step_output = self._take_next_step(
                     name_to_tool_map,
@@ -121,6 +137,10 @@ class CrewAgentExecutor(AgentExecutor, CrewAgentExecutorMixin):
 
         return self._return(output, intermediate_steps, run_manager=run_manager)
 
+    def _raise_if_cancelled(self) -> None:
+        if self.crew is not None and self.crew.cancelled:
+            raise TaskCancelledError(self.task.description)
+
     def _iter_next_step(
         self,
         name_to_tool_map: Dict[str, BaseTool],
@@ -135,10 +155,7 @@ class CrewAgentExecutor(AgentExecutor, CrewAgentExecutorMixin):
         """
         try:
             if self._should_force_answer():
-                error = self._i18n.errors("force_final_answer")
-                output = AgentAction("_Exception", error, error)
-                self.have_forced_answer = True
-                yield AgentStep(action=output, observation=error)
+                yield self._force_answer_step()
                 return
 
             intermediate_steps = self._prepare_intermediate_steps(intermediate_steps)
@@ -151,59 +168,129 @@ class CrewAgentExecutor(AgentExecutor, CrewAgentExecutorMixin):
             )
 
         except OutputParserException as e:
-            if isinstance(self.handle_parsing_errors, bool):
-                raise_error = not self.handle_parsing_errors
-            else:
-                raise_error = False
-            if raise_error:
-                raise ValueError(
-                    "An output parsing error occurred. "
-                    "In order to pass this error back to the agent and have it try "
-                    "again, pass `handle_parsing_errors=True` to the AgentExecutor. "
-                    f"This is the error: {str(e)}"
+            yield self._handle_output_parser_exception(e, run_manager)
+            return
+
+        except Exception as e:
+            if LLMContextLengthExceededException(str(e))._is_context_limit_error(
+                str(e)
+            ):
+                output = self._handle_context_length_error(
+                    intermediate_steps, run_manager, inputs
                 )
-            str(e)
-            if isinstance(self.handle_parsing_errors, bool):
-                if e.send_to_llm:
-                    observation = f"\n{str(e.observation)}"
-                    str(e.llm_output)
-                else:
-                    observation = ""
-            elif isinstance(self.handle_parsing_errors, str):
-                observation = f"\n{self.handle_parsing_errors}"
-            elif callable(self.handle_parsing_errors):
-                observation = f"\n{self.handle_parsing_errors(e)}"
-            else:
-                raise ValueError("Got unexpected type of `handle_parsing_errors`")
-            output = AgentAction("_Exception", observation, "")
 
-            if run_manager:
-                run_manager.on_agent_action(output, color="green")
+                if isinstance(output, AgentFinish):
+                    yield output
+                elif isinstance(output, list):
+                    for step in output:
+                        yield step
+                return
 
-            tool_run_kwargs = self.agent.tool_run_logging_kwargs()
-            observation = ExceptionTool().run(
-                output.tool_input,
-                verbose=False,
-                color=None,
-                callbacks=run_manager.get_child() if run_manager else None,
-                **tool_run_kwargs,
-            )
+            yield self._exception_step(e)
+            return
+
+        yield from self._process_agent_output(output, name_to_tool_map, run_manager)
+
+    async def _acall(
+        self,
+        inputs: Dict[str, str],
+        run_manager: Optional[AsyncCallbackManagerForChainRun] = None,
+    ) -> Dict[str, Any]:
+        """Async counterpart of `_call`: LLM calls are awaited, blocking work runs in worker threads."""
+        name_to_tool_map = {tool.name: tool for tool in self.tools}
+        color_mapping = get_color_mapping(
+            [tool.name.casefold() for tool in self.tools],
+            excluded_colors=["green", "red"],
+        )
+        intermediate_steps: List[Tuple[AgentAction, str]] = []
+        if self.task.human_input:
+            self.should_ask_for_human_input = True
+
+        self.iterations = 0
+        time_elapsed = 0.0
+        start_time = time.time()
+
+        while self._should_continue(self.iterations, time_elapsed):
+            self._raise_if_cancelled()
+            # The RPM controller sleeps until the next window, so keep it off the event loop
+            if not self.request_within_rpm_limit or await asyncio.to_thread(
+                self.request_within_rpm_limit
+            ):
+                next_step_output = await self._atake_next_step(
+                    name_to_tool_map,
+                    color_mapping,
+                    inputs,
+                    intermediate_steps,
+                    run_manager=run_manager,
+                )
+
+                if self.step_callback:
+                    self.step_callback(next_step_output)
+
+                if isinstance(next_step_output, AgentFinish):
+                    create_long_term_memory = threading.Thread(
+                        target=self._create_long_term_memory, args=(next_step_output,)
+                    )
+                    create_long_term_memory.start()
 
+                    return await self._areturn(
+                        next_step_output, intermediate_steps, run_manager=run_manager
+                    )
+
+                intermediate_steps.extend(next_step_output)
+
+                if len(next_step_output) == 1:
+                    next_step_action = next_step_output[0]
+                    tool_return = self._get_tool_return(next_step_action)
+                    if tool_return is not None:
+                        return await self._areturn(
+                            tool_return, intermediate_steps, run_manager=run_manager
+                        )
+
+                self.iterations += 1
+                time_elapsed = time.time() - start_time
+        output = self.agent.return_stopped_response(
+            self.early_stopping_method, intermediate_steps, **inputs
+        )
+
+        return await self._areturn(output, intermediate_steps, run_manager=run_manager)
+
+    async def _aiter_next_step(
+        self,
+        name_to_tool_map: Dict[str, BaseTool],
+        color_mapping: Dict[str, str],
+        inputs: Dict[str, str],
+        intermediate_steps: List[Tuple[AgentAction, str]],
+        run_manager: Optional[AsyncCallbackManagerForChainRun] = None,
+    ) -> AsyncIterator[Union[AgentFinish, AgentAction, AgentStep]]:
+        """Async counterpart of `_iter_next_step` built on `aplan`."""
+        try:
             if self._should_force_answer():
-                error = self._i18n.errors("force_final_answer")
-                output = AgentAction("_Exception", error, error)
-                yield AgentStep(action=output, observation=error)
+                yield self._force_answer_step()
                 return
 
-            yield AgentStep(action=output, observation=observation)
+            intermediate_steps = self._prepare_intermediate_steps(intermediate_steps)
+
+            output = await self.agent.aplan(
+                intermediate_steps,
+                callbacks=run_manager.get_child() if run_manager else None,
+                **inputs,
+            )
+
+        except OutputParserException as e:
+            yield self._handle_output_parser_exception(e, run_manager)
             return
 
         except Exception as e:
             if LLMContextLengthExceededException(str(e))._is_context_limit_error(
                 str(e)
             ):
-                output = self._handle_context_length_error(
-                    intermediate_steps, run_manager, inputs
+                # Prompts the user and summarizes synchronously
+                output = await asyncio.to_thread(
+                    self._handle_context_length_error,
+                    intermediate_steps,
+                    None,
+                    inputs,
                 )
 
                 if isinstance(output, AgentFinish):
@@ -213,12 +300,95 @@ class CrewAgentExecutor(AgentExecutor, CrewAgentExecutorMixin):
                         yield step
                 return
 
-            yield AgentStep(
-                action=AgentAction("_Exception", str(e), str(e)),
-                observation=str(e),
-            )
+            yield self._exception_step(e)
             return
 
+        if isinstance(output, AgentFinish) and not (
+            self.should_ask_for_human_input or (self.crew and self.crew._train)
+        ):
+            yield output
+            return
+
+        # Human input, memory writes and tools are blocking; run them in a worker thread
+        steps = await asyncio.to_thread(
+            lambda: list(self._process_agent_output(output, name_to_tool_map, None))
+        )
+        for step in steps:
+            yield step
+
+    def _force_answer_step(self) -> AgentStep:
+        error = self._i18n.errors("force_final_answer")
+        output = AgentAction("_Exception", error, error)
+        self.have_forced_answer = True
+        return AgentStep(action=output, observation=error)
+
+    def _exception_step(self, e: Exception) -> AgentStep:
+        return AgentStep(
+            action=AgentAction("_Exception", str(e), str(e)),
+            observation=str(e),
+        )
+
+    def _handle_output_parser_exception(
+        self,
+        e: OutputParserException,
+        run_manager: Optional[Any] = None,
+    ) -> AgentStep:
+        if isinstance(self.handle_parsing_errors, bool):
+            raise_error = not self.handle_parsing_errors
+        else:
+            raise_error = False
+        if raise_error:
+            raise ValueError(
+                "An output parsing error occurred. "
+                "In order to pass this error back to the agent and have it try "
+                "again, pass `handle_parsing_errors=True` to the AgentExecutor. "
+                f"This is the error: {str(e)}"
+            )
+        str(e)
+        if isinstance(self.handle_parsing_errors, bool):
+            if e.send_to_llm:
+                observation = f"\n{str(e.observation)}"
+                str(e.llm_output)
+            else:
+                observation = ""
+        elif isinstance(self.handle_parsing_errors, str):
+            observation = f"\n{self.handle_parsing_errors}"
+        elif callable(self.handle_parsing_errors):
+            observation = f"\n{self.handle_parsing_errors(e)}"
+        else:
+            raise ValueError("Got unexpected type of `handle_parsing_errors`")
+        output = AgentAction("_Exception", observation, "")
+
+        # Async callback managers cannot drive the synchronous ExceptionTool run
+        sync_run_manager = (
+            run_manager if isinstance(run_manager, CallbackManagerForChainRun) else None
+        )
+        if sync_run_manager:
+            sync_run_manager.on_agent_action(output, color="green")
+
+        tool_run_kwargs = self.agent.tool_run_logging_kwargs()
+        observation = ExceptionTool().run(
+            output.tool_input,
+            verbose=False,
+            color=None,
+            callbacks=sync_run_manager.get_child() if sync_run_manager else None,
+            **tool_run_kwargs,
+        )
+
+        if self._should_force_answer():
+            error = self._i18n.errors("force_final_answer")
+            output = AgentAction("_Exception", error, error)
+            return AgentStep(action=output, observation=error)
+
+        return AgentStep(action=output, observation=observation)
+
+    def _process_agent_output(
+        self,
+        output: Union[AgentAction, List[AgentAction], AgentFinish],
+        name_to_tool_map: Dict[str, BaseTool],
+        run_manager: Optional[CallbackManagerForChainRun] = None,
+    ) -> Iterator[Union[AgentFinish, AgentAction, AgentStep]]:
+        """Act on what the LLM planned: finish (after human review if requested) or run the tools."""
         # If the tool chosen is the finishing tool, then we end and return.
         if isinstance(output, AgentFinish):
             if self.should_ask_for_human_input:
@@ -1,9 +1,22 @@
 import asyncio
 import json
+import threading
 import uuid
-from concurrent.futures import Future
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from hashlib import md5
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from langchain_core.callbacks import BaseCallbackHandler
 from pydantic import (
@@ -44,6 +57,7 @@ from crewai.utilities.formatter import (
     aggregate_raw_outputs_from_tasks,
 )
 from crewai.utilities.planning_handler import CrewPlanner
+from crewai.utilities.task_graph import TaskGraph
 from crewai.utilities.task_output_storage_handler import TaskOutputStorageHandler
 from crewai.utilities.training_handler import CrewTrainingHandler
 
@@ -65,6 +79,7 @@ class Crew(BaseModel):
         memory: Whether the crew should use memory to store memories of it's execution.
         manager_callbacks: The callback handlers to be executed by the manager agent when hierarchical process is used
         cache: Whether the crew should use a cache to store the results of the tools execution.
+        cache_handler: Tool result cache shared by the crew's agents; an in-memory one is created if unset.
         function_calling_llm: The language model that will run the tool calling for all the agents.
         process: The process flow that the crew will follow (e.g., sequential, hierarchical).
         verbose: Indicates the verbosity level for logging during execution.
@@ -76,6 +91,10 @@ class Crew(BaseModel):
         step_callback: Callback to be executed after each step for every agents execution.
         share_crew: Whether you want to share the complete crew information and execution with crewAI to make the library better, and allow us to train models.
         planning: Plan the crew execution and add the plan to the crew.
+        dag_scheduling: Start each task as soon as the tasks it depends on have finished instead of following list order.
+        max_parallel_tasks: Size of the crew's task thread pool, which also caps tasks running at once under dag_scheduling.
+        task_timeout: Seconds to wait on a task running off the calling thread before cancelling the run.
+        task_queue_metrics: Seconds each task of the last run spent waiting for a worker in the task pool.
     """
 
     __hash__ = object.__hash__  # type: ignore
@@ -83,7 +102,7 @@ class Crew(BaseModel):
     _rpm_controller: RPMController = PrivateAttr()
     _logger: Logger = PrivateAttr()
     _file_handler: FileHandler = PrivateAttr()
-    _cache_handler: InstanceOf[CacheHandler] = PrivateAttr(default=CacheHandler())
+    _cache_handler: InstanceOf[CacheHandler] = PrivateAttr(default_factory=CacheHandler)
     _short_term_memory: Optional[InstanceOf[ShortTermMemory]] = PrivateAttr()
     _long_term_memory: Optional[InstanceOf[LongTermMemory]] = PrivateAttr()
     _entity_memory: Optional[InstanceOf[EntityMemory]] = PrivateAttr()
@@ -96,8 +115,16 @@ class Crew(BaseModel):
     _task_output_handler: TaskOutputStorageHandler = PrivateAttr(
         default_factory=TaskOutputStorageHandler
     )
+    _task_executor: Optional[ThreadPoolExecutor] = PrivateAttr(default=None)
+    _owns_task_executor: bool = PrivateAttr(default=True)
+    _task_futures: Set[Future] = PrivateAttr(default_factory=set)
+    _cancel_event: threading.Event = PrivateAttr(default_factory=threading.Event)
 
     cache: bool = Field(default=True)
+    cache_handler: Optional[InstanceOf[CacheHandler]] = Field(
+        default=None,
+        description="Tool result cache shared by the crew's agents, e.g. one backed by SQLiteCacheBackend to reuse results across runs.",
+    )
     model_config = ConfigDict(arbitrary_types_allowed=True)
     tasks: List[Task] = Field(default_factory=list)
     agents: List[BaseAgent] = Field(default_factory=list)
@@ -159,6 +186,24 @@ class Crew(BaseModel):
         default=None,
         description="Language model that will run the AgentPlanner if planning is True.",
     )
+    dag_scheduling: bool = Field(
+        default=False,
+        description="Start each task as soon as the tasks it depends on (its context, or the previous task when no context is set) have finished. An empty context means no dependencies.",
+    )
+    max_parallel_tasks: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Size of the thread pool that runs async tasks and dag_scheduling tasks, and the cap on tasks running at once under dag_scheduling. Defaults to the ThreadPoolExecutor default.",
+    )
+    task_timeout: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Seconds to wait on a task running off the calling thread (async_execution or dag_scheduling) before cancelling the run with a TimeoutError.",
+    )
+    task_queue_metrics: Optional[Dict[str, float]] = Field(
+        default=None,
+        description="Seconds each task of the last run waited for a worker in the crew's task pool, keyed by task id.",
+    )
     task_execution_output_json_files: Optional[List[str]] = Field(
         default=None,
         description="List of file paths for task execution JSON files.",
@@ -195,7 +240,7 @@ class Crew(BaseModel):
     @model_validator(mode="after")
     def set_private_attrs(self) -> "Crew":
         """Set private attributes."""
-        self._cache_handler = CacheHandler()
+        self._cache_handler = self.cache_handler or CacheHandler()
         self._logger = Logger(verbose=self.verbose)
         if self.output_log_file:
             self._file_handler = FileHandler(self.output_log_file)
@@ -423,9 +468,34 @@ class Crew(BaseModel):
         inputs: Optional[Dict[str, Any]] = None,
     ) -> CrewOutput:
         """Starts the crew to work on its assigned tasks."""
+        self._prepare_kickoff(inputs)
+
+        try:
+            if self.planning:
+                self._handle_crew_planning()
+
+            if self.process == Process.sequential:
+                result = self._run_sequential_process()
+            elif self.process == Process.hierarchical:
+                result = self._run_hierarchical_process()
+            else:
+                raise NotImplementedError(
+                    f"The process '{self.process}' is not implemented yet."
+                )
+        finally:
+            self._release_task_executor()
+
+        self._set_usage_metrics()
+        return result
+
+    def _prepare_kickoff(self, inputs: Optional[Dict[str, Any]]) -> None:
+        """Reset per-run state, interpolate inputs and build the agent executors."""
         self._execution_span = self._telemetry.crew_execution_span(self, inputs)
         self._task_output_handler.reset()
         self._logging_color = "bold_purple"
+        self._cancel_event.clear()
+        for task in self.tasks:
+            task._queue_wait_time = None
 
         if inputs is not None:
             self._inputs = inputs
@@ -450,26 +520,88 @@ class Crew(BaseModel):
 
             agent.create_agent_executor()
 
-        if self.planning:
-            self._handle_crew_planning()
-
-        metrics = []
-
-        if self.process == Process.sequential:
-            result = self._run_sequential_process()
-        elif self.process == Process.hierarchical:
-            result = self._run_hierarchical_process()
-        else:
-            raise NotImplementedError(
-                f"The process '{self.process}' is not implemented yet."
-            )
-        metrics += [agent._token_process.get_summary() for agent in self.agents]
+    def _set_usage_metrics(self) -> None:
+        metrics = [agent._token_process.get_summary() for agent in self.agents]
 
         self.usage_metrics = {
             key: sum([m[key] for m in metrics if m is not None]) for key in metrics[0]
         }
+        self.task_queue_metrics = {
+            str(task.id): task._queue_wait_time
+            for task in self.tasks
+            if task._queue_wait_time is not None
+        }
 
-        return result
+    def cancel(self) -> None:
+        """Cancel the current run.
+
+        Tasks still queued on the crew's task pool are dropped, and running agents
+        raise TaskCancelledError before their next step. The next kickoff starts
+        from a clean state.
+        """
+        self._cancel_event.set()
+        for future in list(self._task_futures):
+            future.cancel()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the crew's task pool.
+
+        A fork or copy only lets go of the pool it borrowed from the crew it was made
+        from; the next pool it needs is its own.
+        """
+        executor, self._task_executor = self._task_executor, None
+        if executor is not None and self._owns_task_executor:
+            executor.shutdown(wait=wait, cancel_futures=True)
+        self._owns_task_executor = True
+
+    def _release_task_executor(self) -> None:
+        """Stop the task pool at the end of a run, unless it is borrowed.
+
+        Forks and copies share the pool of the crew they were made from, which
+        stops it when its own run (e.g. kickoff_for_each) ends; a copy that runs
+        after that starts a pool of its own.
+        """
+        if self._owns_task_executor:
+            self.shutdown(wait=False)
+
+    def _get_task_executor(self) -> ThreadPoolExecutor:
+        if (
+            self._task_executor is not None
+            and not self._owns_task_executor
+            and self._task_executor._shutdown
+        ):
+            # The crew this one was made from stopped the shared pool when its run ended
+            self._task_executor = None
+        if self._task_executor is None:
+            self._task_executor = ThreadPoolExecutor(
+                max_workers=self.max_parallel_tasks, thread_name_prefix="crewai-task"
+            )
+            self._owns_task_executor = True
+        return self._task_executor
+
+    def _submit_task(
+        self, task: Task, agent: BaseAgent, context: Optional[str]
+    ) -> Future[TaskOutput]:
+        future = task.execute_async(
+            agent=agent,
+            context=context,
+            tools=agent.tools,
+            executor=self._get_task_executor(),
+        )
+        self._task_futures.add(future)
+        future.add_done_callback(self._task_futures.discard)
+        return future
+
+    def _task_timed_out(self, tasks: List[Task]) -> TimeoutError:
+        self.cancel()
+        descriptions = ", ".join(f"'{task.description}'" for task in tasks)
+        return TimeoutError(
+            f"Task {descriptions} did not finish within {self.task_timeout} seconds."
+        )
 
     def kickoff_for_each(self, inputs: List[Dict[str, Any]]) -> List[CrewOutput]:
         """Executes the Crew's workflow for each input in the list and aggregates results."""
@@ -483,69 +615,133 @@ class Crew(BaseModel):
             "successful_requests": 0,
         }
 
-        for input_data in inputs:
-            crew = self.copy()
+        try:
+            for input_data in inputs:
+                crew = self.fork()
 
-            output = crew.kickoff(inputs=input_data)
+                output = crew.kickoff(inputs=input_data)
 
-            if crew.usage_metrics:
-                for key in total_usage_metrics:
-                    total_usage_metrics[key] += crew.usage_metrics.get(key, 0)
+                if crew.usage_metrics:
+                    for key in total_usage_metrics:
+                        total_usage_metrics[key] += crew.usage_metrics.get(key, 0)
 
-            results.append(output)
+                results.append(output)
+        finally:
+            self._release_task_executor()
 
         self.usage_metrics = total_usage_metrics
         self._task_output_handler.reset()
         return results
 
     async def kickoff_async(self, inputs: Optional[Dict[str, Any]] = {}) -> CrewOutput:
-        """Asynchronous kickoff method to start the crew execution."""
-        return await asyncio.to_thread(self.kickoff, inputs)
+        """Asynchronous kickoff method to start the crew execution.
 
-    async def kickoff_for_each_async(self, inputs: List[Dict]) -> List[CrewOutput]:
-        crew_copies = [self.copy() for _ in inputs]
+        Runs on the caller's event loop: agents await their LLM calls through
+        `ainvoke`/`aplan` instead of each crew holding an OS thread, so many crews
+        can run concurrently on one loop. Tools, human input and other blocking
+        steps are handed to worker threads.
+        """
+        self._prepare_kickoff(inputs)
 
-        async def run_crew(crew, input_data):
-            return await crew.kickoff_async(inputs=input_data)
+        try:
+            if self.planning:
+                await asyncio.to_thread(self._handle_crew_planning)
 
-        tasks = [
-            asyncio.create_task(run_crew(crew_copies[i], inputs[i]))
-            for i in range(len(inputs))
-        ]
-        tasks = [
-            asyncio.create_task(run_crew(crew_copies[i], inputs[i]))
-            for i in range(len(inputs))
-        ]
+            if self.process == Process.sequential:
+                result = await self._aexecute_tasks(self.tasks)
+            elif self.process == Process.hierarchical:
+                self._create_manager_agent()
+                result = await self._aexecute_tasks(self.tasks)
+            else:
+                raise NotImplementedError(
+                    f"The process '{self.process}' is not implemented yet."
+                )
+        finally:
+            self._release_task_executor()
 
-        results = await asyncio.gather(*tasks)
+        self._set_usage_metrics()
+        return result
 
-        total_usage_metrics = {
+    async def kickoff_for_each_async(self, inputs: List[Dict]) -> List[CrewOutput]:
+        """Runs the crew for every input concurrently and returns the outputs in input order."""
+        results: List[Any] = [None] * len(inputs)
+        async for index, output in self.kickoff_for_each_stream(
+            inputs, max_concurrency=max(len(inputs), 1)
+        ):
+            results[index] = output
+        return results
+
+    async def kickoff_for_each_stream(
+        self,
+        inputs: Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]],
+        max_concurrency: int = 8,
+        return_exceptions: bool = False,
+    ) -> AsyncIterator[Tuple[int, Union[CrewOutput, BaseException]]]:
+        """Runs the crew once per input, yielding `(input index, output)` as each run finishes.
+
+        Inputs may be any iterable or async iterable and are pulled lazily, so at most
+        `max_concurrency` forks of the crew exist at a time however many inputs there
+        are. `usage_metrics` is updated as each run finishes. A failed run cancels the
+        rest of the batch and raises, unless `return_exceptions` is set, in which case
+        its exception is yielded in place of the output.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+
+        async_inputs = inputs.__aiter__() if isinstance(inputs, AsyncIterable) else None
+        sync_inputs = iter(inputs) if async_inputs is None else None  # type: ignore[arg-type]
+        exhausted = False
+        next_index = 0
+        running: Dict["asyncio.Future[CrewOutput]", Tuple[int, Crew]] = {}
+        self.usage_metrics = {
             "total_tokens": 0,
             "prompt_tokens": 0,
             "completion_tokens": 0,
             "successful_requests": 0,
         }
-        for crew in crew_copies:
-            if crew.usage_metrics:
-                for key in total_usage_metrics:
-                    total_usage_metrics[key] += crew.usage_metrics.get(key, 0)
 
-        self.usage_metrics = total_usage_metrics
+        try:
+            while True:
+                while not exhausted and len(running) < max_concurrency:
+                    try:
+                        input_data = (
+                            await async_inputs.__anext__()
+                            if async_inputs is not None
+                            else next(sync_inputs)  # type: ignore[arg-type]
+                        )
+                    except (StopIteration, StopAsyncIteration):
+                        exhausted = True
+                        break
+                    if not isinstance(input_data, dict):
+                        raise TypeError(
+                            f"Input {next_index} must be a dict, got {type(input_data).__name__}."
+                        )
+                    crew = self.fork()
+                    future = asyncio.ensure_future(crew.kickoff_async(inputs=input_data))
+                    running[future] = (next_index, crew)
+                    next_index += 1
 
-        total_usage_metrics = {
-            "total_tokens": 0,
-            "prompt_tokens": 0,
-            "completion_tokens": 0,
-            "successful_requests": 0,
-        }
-        for crew in crew_copies:
-            if crew.usage_metrics:
-                for key in total_usage_metrics:
-                    total_usage_metrics[key] += crew.usage_metrics.get(key, 0)
+                if not running:
+                    break
 
-        self.usage_metrics = total_usage_metrics
-        self._task_output_handler.reset()
-        return results
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    index, crew = running.pop(future)
+                    # A failed run never sets usage_metrics but still spent tokens
+                    usage = crew.usage_metrics or crew.calculate_usage_metrics()
+                    for key in self.usage_metrics:
+                        self.usage_metrics[key] += usage.get(key, 0)
+                    error = future.exception()
+                    if error is not None and not return_exceptions:
+                        raise error
+                    yield index, error if error is not None else future.result()
+        finally:
+            for future in running:
+                future.cancel()
+            self._release_task_executor()
+            self._task_output_handler.reset()
 
     def _handle_crew_planning(self):
         """Handles the Crew planning."""
@@ -629,6 +825,8 @@ class Crew(BaseModel):
         Returns:
             CrewOutput: Final output of the crew
         """
+        if self.dag_scheduling:
+            return self._execute_task_graph(tasks, start_index, was_replayed)
 
         task_outputs: List[TaskOutput] = []
         futures: List[Tuple[Task, Future[TaskOutput], int]] = []
@@ -664,11 +862,7 @@ class Crew(BaseModel):
                 context = self._get_context(
                     task, [last_sync_output] if last_sync_output else []
                 )
-                future = task.execute_async(
-                    agent=agent_to_use,
-                    context=context,
-                    tools=agent_to_use.tools,
-                )
+                future = self._submit_task(task, agent_to_use, context)
                 futures.append((task, future, task_index))
             else:
                 if futures:
@@ -690,6 +884,309 @@ class Crew(BaseModel):
 
         return self._create_crew_output(task_outputs)
 
+    async def _aexecute_tasks(
+        self,
+        tasks: List[Task],
+        start_index: Optional[int] = 0,
+        was_replayed: bool = False,
+    ) -> CrewOutput:
+        """Async counterpart of `_execute_tasks`.
+
+        Async tasks run as asyncio tasks on the current loop instead of threads;
+        ordering and context rules are the same as in `_execute_tasks`.
+        """
+        if self.dag_scheduling:
+            return await self._aexecute_task_graph(tasks, start_index, was_replayed)
+
+        task_outputs: List[TaskOutput] = []
+        pending: List[Tuple[Task, "asyncio.Future[TaskOutput]", int]] = []
+        last_sync_output: Optional[TaskOutput] = None
+
+        try:
+            for task_index, task in enumerate(tasks):
+                if start_index is not None and task_index < start_index:
+                    if task.output:
+                        if task.async_execution:
+                            task_outputs.append(task.output)
+                        else:
+                            task_outputs = [task.output]
+                            last_sync_output = task.output
+                    continue
+
+                agent_to_use = self._get_agent_to_use(task)
+                if agent_to_use is None:
+                    raise ValueError(
+                        f"No agent available for task: {task.description}. Ensure that either the task has an assigned agent or a manager agent is provided."
+                    )
+
+                self._prepare_agent_tools(task)
+                self._log_task_start(task, agent_to_use.role)
+
+                if isinstance(task, ConditionalTask):
+                    if pending:
+                        task_outputs = await self._aprocess_async_tasks(
+                            pending, was_replayed
+                        )
+                        pending.clear()
+                    skipped_task_output = self._handle_conditional_task(
+                        task, task_outputs, [], task_index, was_replayed
+                    )
+                    if skipped_task_output:
+                        continue
+
+                if task.async_execution:
+                    context = self._get_context(
+                        task, [last_sync_output] if last_sync_output else []
+                    )
+                    future = asyncio.ensure_future(
+                        task.aexecute(
+                            agent=agent_to_use,
+                            context=context,
+                            tools=agent_to_use.tools,
+                        )
+                    )
+                    pending.append((task, future, task_index))
+                else:
+                    if pending:
+                        task_outputs = await self._aprocess_async_tasks(
+                            pending, was_replayed
+                        )
+                        pending.clear()
+
+                    context = self._get_context(task, task_outputs)
+                    task_output = await task.aexecute(
+                        agent=agent_to_use,
+                        context=context,
+                        tools=agent_to_use.tools,
+                    )
+                    task_outputs = [task_output]
+                    self._process_task_result(task, task_output)
+                    self._store_execution_log(
+                        task, task_output, task_index, was_replayed
+                    )
+
+            if pending:
+                task_outputs = await self._aprocess_async_tasks(pending, was_replayed)
+                pending.clear()
+        finally:
+            # Do not leave sibling tasks running when one fails or the caller is cancelled
+            for _, future, _ in pending:
+                future.cancel()
+
+        return self._create_crew_output(task_outputs)
+
+    async def _aprocess_async_tasks(
+        self,
+        pending: List[Tuple[Task, "asyncio.Future[TaskOutput]", int]],
+        was_replayed: bool = False,
+    ) -> List[TaskOutput]:
+        try:
+            results = await asyncio.wait_for(
+                asyncio.gather(*(future for _, future, _ in pending)),
+                self.task_timeout,
+            )
+        except asyncio.TimeoutError:
+            raise self._task_timed_out([task for task, _, _ in pending]) from None
+        task_outputs: List[TaskOutput] = []
+        for (future_task, _, task_index), task_output in zip(pending, results):
+            task_outputs.append(task_output)
+            self._process_task_result(future_task, task_output)
+            self._store_execution_log(
+                future_task, task_output, task_index, was_replayed
+            )
+        return task_outputs
+
+    def _execute_task_graph(
+        self,
+        tasks: List[Task],
+        start_index: Optional[int] = 0,
+        was_replayed: bool = False,
+    ) -> CrewOutput:
+        """Executes tasks in dependency order and returns the final output.
+
+        Each task starts as soon as the tasks in its `TaskGraph` dependencies have
+        finished, with at most `max_parallel_tasks` running at once. Tasks sharing
+        an agent never overlap, since the agent's executor holds per-task state.
+        """
+        graph = TaskGraph(tasks)
+        outputs = self._replayed_graph_outputs(graph, start_index)
+        running: Dict[int, BaseAgent] = {}
+        futures: Dict[Future[TaskOutput], int] = {}
+
+        try:
+            while len(outputs) < len(tasks):
+                for index, agent, context in self._start_graph_tasks(
+                    graph, outputs, running, was_replayed
+                ):
+                    futures[self._submit_task(tasks[index], agent, context)] = index
+
+                if not futures:
+                    continue  # Only skipped conditional tasks were resolved
+
+                done, _ = wait(
+                    futures, timeout=self.task_timeout, return_when=FIRST_COMPLETED
+                )
+                if not done:
+                    raise self._task_timed_out([tasks[i] for i in futures.values()])
+                for future in done:
+                    index = futures.pop(future)
+                    del running[index]
+                    self._record_graph_output(
+                        graph, outputs, index, future.result(), was_replayed
+                    )
+        except BaseException:
+            if futures:
+                self.cancel()
+            raise
+
+        return self._create_crew_output(graph.final_outputs(outputs))
+
+    async def _aexecute_task_graph(
+        self,
+        tasks: List[Task],
+        start_index: Optional[int] = 0,
+        was_replayed: bool = False,
+    ) -> CrewOutput:
+        """Async counterpart of `_execute_task_graph`, running tasks as asyncio tasks."""
+        graph = TaskGraph(tasks)
+        outputs = self._replayed_graph_outputs(graph, start_index)
+        running: Dict[int, BaseAgent] = {}
+        pending: Dict["asyncio.Future[TaskOutput]", int] = {}
+
+        try:
+            while len(outputs) < len(tasks):
+                for index, agent, context in self._start_graph_tasks(
+                    graph, outputs, running, was_replayed
+                ):
+                    future = asyncio.ensure_future(
+                        tasks[index].aexecute(
+                            agent=agent,
+                            context=context,
+                            tools=agent.tools,
+                        )
+                    )
+                    pending[future] = index
+
+                if not pending:
+                    continue  # Only skipped conditional tasks were resolved
+
+                done, _ = await asyncio.wait(
+                    pending,
+                    timeout=self.task_timeout,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    raise self._task_timed_out([tasks[i] for i in pending.values()])
+                for future in done:
+                    index = pending.pop(future)
+                    del running[index]
+                    self._record_graph_output(
+                        graph, outputs, index, future.result(), was_replayed
+                    )
+        finally:
+            for future in pending:
+                future.cancel()
+
+        return self._create_crew_output(graph.final_outputs(outputs))
+
+    def _replayed_graph_outputs(
+        self, graph: TaskGraph, start_index: Optional[int]
+    ) -> Dict[int, List[TaskOutput]]:
+        outputs: Dict[int, List[TaskOutput]] = {}
+        for index in range(start_index or 0):
+            task = graph.tasks[index]
+            outputs[index] = (
+                [task.output] if task.output else graph.implicit_outputs(index, outputs)
+            )
+        return outputs
+
+    def _start_graph_tasks(
+        self,
+        graph: TaskGraph,
+        outputs: Dict[int, List[TaskOutput]],
+        running: Dict[int, BaseAgent],
+        was_replayed: bool,
+    ) -> List[Tuple[int, BaseAgent, str]]:
+        """Claims the ready tasks that can start now and returns them with their context.
+
+        Skipped conditional tasks are resolved on the spot, which may unblock more tasks.
+        """
+        limit = self.max_parallel_tasks or len(graph.tasks)
+        started: List[Tuple[int, BaseAgent, str]] = []
+        progressed = True
+
+        while progressed:
+            progressed = False
+            for index in graph.ready(outputs, running):
+                if len(running) >= limit:
+                    break
+
+                task = graph.tasks[index]
+                agent_to_use = self._get_agent_to_use(task)
+                if agent_to_use is None:
+                    raise ValueError(
+                        f"No agent available for task: {task.description}. Ensure that either the task has an assigned agent or a manager agent is provided."
+                    )
+                if any(agent is agent_to_use for agent in running.values()):
+                    continue
+
+                self._prepare_agent_tools(task)
+                self._log_task_start(task, agent_to_use.role)
+
+                if isinstance(task, ConditionalTask) and self._skip_graph_task(
+                    graph, outputs, index, was_replayed
+                ):
+                    progressed = True
+                    break
+
+                implicit_outputs = (
+                    graph.implicit_outputs(index, outputs)
+                    if task.context is None
+                    else []
+                )
+                running[index] = agent_to_use
+                started.append(
+                    (index, agent_to_use, self._get_context(task, implicit_outputs))
+                )
+
+        return started
+
+    def _skip_graph_task(
+        self,
+        graph: TaskGraph,
+        outputs: Dict[int, List[TaskOutput]],
+        index: int,
+        was_replayed: bool,
+    ) -> bool:
+        task = graph.tasks[index]
+        previous_outputs = outputs.get(index - 1)
+        previous_output = previous_outputs[-1] if previous_outputs else None
+        if previous_output is None or task.should_execute(previous_output):
+            return False
+
+        self._logger.log(
+            "debug",
+            f"Skipping conditional task: {task.description}",
+            color="yellow",
+        )
+        if not was_replayed:
+            self._store_execution_log(task, task.get_skipped_task_output(), index)
+        # Tasks relying on implicit context see through the skipped task
+        outputs[index] = graph.implicit_outputs(index, outputs)
+        return True
+
+    def _record_graph_output(
+        self,
+        graph: TaskGraph,
+        outputs: Dict[int, List[TaskOutput]],
+        index: int,
+        task_output: TaskOutput,
+        was_replayed: bool,
+    ) -> None:
+        outputs[index] = [task_output]
+        self._process_task_result(graph.tasks[index], task_output)
+        self._store_execution_log(graph.tasks[index], task_output, index, was_replayed)
+
     def _handle_conditional_task(
         self,
         task: ConditionalTask,
@@ -811,7 +1308,14 @@ class Crew(BaseModel):
     ) -> List[TaskOutput]:
         task_outputs: List[TaskOutput] = []
         for future_task, future, task_index in futures:
-            task_output = future.result()
+            try:
+                task_output = future.result(timeout=self.task_timeout)
+            except FutureTimeoutError:
+                raise self._task_timed_out([future_task]) from None
+            except BaseException:
+                # The run is failing; stop sibling tasks instead of leaving them running
+                self.cancel()
+                raise
             task_outputs.append(task_output)
             self._process_task_result(future_task, task_output)
             self._store_execution_log(
@@ -900,9 +1404,50 @@ class Crew(BaseModel):
         copied_data.pop("tasks", None)
 
         copied_crew = Crew(**copied_data, agents=cloned_agents, tasks=cloned_tasks)
+        copied_crew._task_executor = self._get_task_executor()
+        copied_crew._owns_task_executor = False
 
         return copied_crew
 
+    def fork(self) -> "Crew":
+        """Create a lightweight copy of the crew for a single run, using this crew as a template.
+
+        Unlike `copy`, nothing is re-validated or rebuilt. Agents and tasks are forked,
+        so the copy shares their definitions, LLM clients and tools with this crew,
+        along with its memory, tool cache, RPM controller, telemetry and task pool.
+        Only per-run state (interpolated prompts, outputs, executors, usage metrics)
+        belongs to the fork.
+        """
+        agents = {id(agent): agent.fork() for agent in self.agents}
+        if self.manager_agent is not None and id(self.manager_agent) not in agents:
+            manager = self.manager_agent.fork()
+            # Delegation tools point at the template's agents; each run rebuilds them
+            manager.tools = []
+            agents[id(self.manager_agent)] = manager
+
+        tasks: Dict[int, Task] = {}
+        for task in self.tasks:
+            tasks[id(task)] = task.fork(agents, tasks)
+
+        forked = self.model_copy(
+            update={
+                "id": uuid.uuid4(),
+                "agents": [agents[id(agent)] for agent in self.agents],
+                "tasks": [tasks[id(task)] for task in self.tasks],
+                "manager_agent": agents.get(id(self.manager_agent)),
+                "usage_metrics": None,
+                "task_queue_metrics": None,
+                "execution_logs": [],
+            }
+        )
+        forked._execution_span = None
+        forked._inputs = None
+        forked._task_executor = self._get_task_executor()
+        forked._owns_task_executor = False
+        forked._task_futures = set()
+        forked._cancel_event = threading.Event()
+        return forked
+
     def _set_tasks_callbacks(self) -> None:
         """Sets callback for every task suing task_callback"""
         for task in self.tasks:
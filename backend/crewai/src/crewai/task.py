@@ -1,9 +1,11 @@
+import asyncio
 import datetime
 import json
 import os
 import threading
+import time
 import uuid
-from concurrent.futures import Future
+from concurrent.futures import Executor, Future
 from copy import copy
 from hashlib import md5
 from typing import Any, Dict, List, Optional, Tuple, Type, Union
@@ -109,6 +111,7 @@ class Task(BaseModel):
     _original_expected_output: str | None = None
     _thread: threading.Thread | None = None
     _execution_time: float | None = None
+    _queue_wait_time: float | None = None
 
     def __init__(__pydantic_self__, **data):
         config = data.pop("config", {})
@@ -191,12 +194,32 @@ class Task(BaseModel):
         agent: BaseAgent | None = None,
         context: Optional[str] = None,
         tools: Optional[List[Any]] = None,
+        executor: Optional[Executor] = None,
     ) -> Future[TaskOutput]:
-        """Execute the task asynchronously."""
+        """Execute the task asynchronously.
+
+        Runs on `executor` when given (crews pass their shared task pool), otherwise
+        on a thread of its own. Errors are set on the returned future.
+        """
+        submitted_at = time.monotonic()
+        if executor is not None:
+            return executor.submit(
+                self._execute_task_async, agent, context, tools, submitted_at
+            )
+
         future: Future[TaskOutput] = Future()
-        threading.Thread(
-            target=self._execute_task_async, args=(agent, context, tools, future)
-        ).start()
+
+        def run() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(
+                    self._execute_task_async(agent, context, tools, submitted_at)
+                )
+            except BaseException as e:
+                future.set_exception(e)
+
+        threading.Thread(target=run).start()
         return future
 
     def _execute_task_async(
@@ -204,11 +227,34 @@ class Task(BaseModel):
         agent: Optional[BaseAgent],
         context: Optional[str],
         tools: Optional[List[Any]],
-        future: Future[TaskOutput],
-    ) -> None:
+        submitted_at: float,
+    ) -> TaskOutput:
         """Execute the task asynchronously with context handling."""
-        result = self._execute_core(agent, context, tools)
-        future.set_result(result)
+        self._queue_wait_time = time.monotonic() - submitted_at
+        return self._execute_core(agent, context, tools)
+
+    async def aexecute(
+        self,
+        agent: Optional[BaseAgent] = None,
+        context: Optional[str] = None,
+        tools: Optional[List[Any]] = None,
+    ) -> TaskOutput:
+        """Execute the task on the running event loop, awaiting the agent's LLM calls."""
+        agent, tools, start_time = self._start_execution(agent, context, tools)
+
+        result = await agent.aexecute_task(
+            task=self,
+            context=context,
+            tools=tools,
+        )
+
+        if self.output_pydantic or self.output_json:
+            # The converter may call the LLM again, synchronously
+            exported_output = await asyncio.to_thread(self._export_output, result)
+        else:
+            exported_output = (None, None)
+
+        return self._complete_execution(agent, result, exported_output, start_time)
 
     def _execute_core(
         self,
@@ -217,6 +263,24 @@ class Task(BaseModel):
         tools: Optional[List[Any]],
     ) -> TaskOutput:
         """Run the core execution logic of the task."""
+        agent, tools, start_time = self._start_execution(agent, context, tools)
+
+        result = agent.execute_task(
+            task=self,
+            context=context,
+            tools=tools,
+        )
+
+        return self._complete_execution(
+            agent, result, self._export_output(result), start_time
+        )
+
+    def _start_execution(
+        self,
+        agent: Optional[BaseAgent],
+        context: Optional[str],
+        tools: Optional[List[Any]],
+    ) -> Tuple[BaseAgent, List[Any], float]:
         agent = agent or self.agent
         self.agent = agent
         if not agent:
@@ -229,14 +293,16 @@ class Task(BaseModel):
 
         self.prompt_context = context
         tools = tools or self.tools or []
+        return agent, tools, start_time
 
-        result = agent.execute_task(
-            task=self,
-            context=context,
-            tools=tools,
-        )
-
-        pydantic_output, json_output = self._export_output(result)
+    def _complete_execution(
+        self,
+        agent: BaseAgent,
+        result: str,
+        exported_output: Tuple[Optional[BaseModel], Optional[Dict[str, Any]]],
+        start_time: float,
+    ) -> TaskOutput:
+        pydantic_output, json_output = exported_output
 
         task_output = TaskOutput(
             description=self.description,
@@ -301,6 +367,39 @@ class Task(BaseModel):
         """Increment the delegations counter."""
         self.delegations += 1
 
+    def fork(
+        self, agents: Dict[int, "BaseAgent"], tasks: Dict[int, "Task"]
+    ) -> "Task":
+        """Create a lightweight copy of the task for a single run.
+
+        Nothing is re-validated. `agents` and `tasks` map the `id()` of this task's
+        agent and context tasks to their forks, so the copy's agent and context point
+        into the same run; anything not in the maps is shared as is.
+        """
+        forked = self.model_copy(
+            update={
+                "id": uuid.uuid4(),
+                "agent": agents.get(id(self.agent), self.agent),
+                "context": [
+                    tasks.get(id(context_task), context_task)
+                    for context_task in self.context
+                ]
+                if self.context is not None
+                else None,
+                "tools": list(self.tools or []),
+                "output": None,
+                "prompt_context": None,
+                "used_tools": 0,
+                "tools_errors": 0,
+                "delegations": 0,
+            }
+        )
+        forked._execution_span = None
+        forked._thread = None
+        forked._execution_time = None
+        forked._queue_wait_time = None
+        return forked
+
     def copy(self, agents: List["BaseAgent"]) -> "Task":
         """Create a deep copy of the Task."""
         exclude = {
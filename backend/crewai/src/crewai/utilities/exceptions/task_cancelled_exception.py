@@ -0,0 +1,6 @@
+class TaskCancelledError(Exception):
+    """Raised inside a running agent once its crew has been cancelled."""
+
+    def __init__(self, task_description: str):
+        self.task_description = task_description
+        super().__init__(f"Task '{task_description}' was cancelled.")
@@ -0,0 +1,83 @@
+from typing import Collection, Dict, List, Optional
+
+from crewai.task import Task
+from crewai.tasks.conditional_task import ConditionalTask
+from crewai.tasks.task_output import TaskOutput
+
+
+class TaskGraph:
+    """Dependency graph of a crew's tasks, built from `Task.context`.
+
+    A task with an explicit context depends on the context tasks that belong to the
+    crew; `context=[]` marks a task with no dependencies at all. A task without a
+    context depends on whatever list-order execution would have handed it as
+    implicit context: the previous synchronous task, or the run of async tasks
+    since then. A ConditionalTask additionally waits for the task right
+    before it, whose output decides whether it runs.
+    """
+
+    def __init__(self, tasks: List[Task]):
+        self.tasks = tasks
+        self.implicit_dependencies: List[List[int]] = []
+        self.dependencies: List[List[int]] = []
+
+        indices = {id(task): index for index, task in enumerate(tasks)}
+        last_sync: Optional[int] = None
+        async_since_sync: List[int] = []
+
+        for index, task in enumerate(tasks):
+            if task.async_execution:
+                implicit = [last_sync] if last_sync is not None else []
+            else:
+                implicit = async_since_sync or (
+                    [last_sync] if last_sync is not None else []
+                )
+            self.implicit_dependencies.append(implicit)
+
+            if task.context is not None:
+                dependencies = [
+                    indices[id(context_task)]
+                    for context_task in task.context
+                    if id(context_task) in indices
+                ]
+            else:
+                dependencies = list(implicit)
+            if isinstance(task, ConditionalTask) and index > 0:
+                dependencies.append(index - 1)
+            self.dependencies.append(sorted(set(dependencies)))
+
+            if task.async_execution:
+                async_since_sync.append(index)
+            else:
+                last_sync = index
+                async_since_sync = []
+
+        # The tasks whose outputs list-order execution would end up returning
+        self.final_tasks: List[int] = async_since_sync or (
+            [last_sync] if last_sync is not None else []
+        )
+
+    def ready(
+        self, outputs: Dict[int, List[TaskOutput]], running: Collection[int]
+    ) -> List[int]:
+        """Indices of tasks not yet started whose dependencies have all finished."""
+        return [
+            index
+            for index in range(len(self.tasks))
+            if index not in outputs
+            and index not in running
+            and all(dependency in outputs for dependency in self.dependencies[index])
+        ]
+
+    def implicit_outputs(
+        self, index: int, outputs: Dict[int, List[TaskOutput]]
+    ) -> List[TaskOutput]:
+        """Outputs list-order execution would hand the task as implicit context."""
+        return [
+            output
+            for dependency in self.implicit_dependencies[index]
+            for output in outputs.get(dependency, [])
+        ]
+
+    def final_outputs(self, outputs: Dict[int, List[TaskOutput]]) -> List[TaskOutput]:
+        return [output for index in self.final_tasks for output in outputs[index]]
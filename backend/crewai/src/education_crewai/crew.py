@@ -1,11 +1,14 @@
 from .config.agents import researcher, compiler
 from .config.tasks import research_task, compilation_task
 from crewai import Crew, Process
+from crewai.agents.cache import CacheHandler, SQLiteCacheBackend
 
-# Define the crew
-education_crew = Crew(
-    agents=[researcher, compiler],
-    tasks=[research_task, compilation_task],
-    process=Process.sequential,
-)
-  ## ya
\ No newline at end of file
+def create_education_crew() -> Crew:
+    """Define the crew; called at kickoff so importing this module opens no cache database"""
+    return Crew(
+        agents=[researcher, compiler],
+        tasks=[research_task, compilation_task],
+        process=Process.sequential,
+        # Reuse Serper search results across runs for a day
+        cache_handler=CacheHandler(SQLiteCacheBackend(ttl_seconds=24 * 60 * 60)),
+    )
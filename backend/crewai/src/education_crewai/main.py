@@ -1,6 +1,6 @@
 from dotenv import load_dotenv
 import os
-from src.education_crewai.crew import education_crew  # This import should be here
+from src.education_crewai.crew import create_education_crew  # This import should be here
 
 # Load environment variables from .env file
 load_dotenv()
@@ -11,6 +11,7 @@ assert os.getenv("SERPER_API_KEY") is not None, "SERPER_API_KEY is not set"
 
 if __name__ == "__main__":
     # Kickoff the crew with inputs
+    education_crew = create_education_crew()
     result = education_crew.kickoff(inputs={"grade_level": "5th Grade"})
     print(result)
 
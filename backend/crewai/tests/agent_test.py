@@ -158,10 +158,9 @@ def test_cache_hitting():
 
     output = agent.execute_task(task1)
     output = agent.execute_task(task2)
-    assert cache_handler._cache == {
-        "multiplier-{'first_number': 2, 'second_number': 6}": 12,
-        "multiplier-{'first_number': 3, 'second_number': 3}": 9,
-    }
+    assert cache_handler.read("multiplier", {"first_number": 2, "second_number": 6}) == 12
+    assert cache_handler.read("multiplier", {"first_number": 3, "second_number": 3}) == 9
+    assert cache_handler.stats()["entries"] == 2
 
     task = Task(
         description="What is 2 times 6 times 3? Return only the number",
@@ -171,11 +170,8 @@ def test_cache_hitting():
     output = agent.execute_task(task)
     assert output == "36"
 
-    assert cache_handler._cache == {
-        "multiplier-{'first_number': 2, 'second_number': 6}": 12,
-        "multiplier-{'first_number': 3, 'second_number': 3}": 9,
-        "multiplier-{'first_number': 12, 'second_number': 3}": 36,
-    }
+    assert cache_handler.read("multiplier", {"first_number": 12, "second_number": 3}) == 36
+    assert cache_handler.stats()["entries"] == 3
 
     with patch.object(CacheHandler, "read") as read:
         read.return_value = "0"
@@ -224,10 +220,7 @@ def test_disabling_cache_for_agent():
 
     output = agent.execute_task(task1)
     output = agent.execute_task(task2)
-    assert cache_handler._cache != {
-        "multiplier-{'first_number': 2, 'second_number': 6}": 12,
-        "multiplier-{'first_number': 3, 'second_number': 3}": 9,
-    }
+    assert cache_handler.stats()["entries"] == 0
 
     task = Task(
         description="What is 2 times 6 times 3? Return only the number",
@@ -237,11 +230,7 @@ def test_disabling_cache_for_agent():
     output = agent.execute_task(task)
     assert output == "36"
 
-    assert cache_handler._cache != {
-        "multiplier-{'first_number': 2, 'second_number': 6}": 12,
-        "multiplier-{'first_number': 3, 'second_number': 3}": 9,
-        "multiplier-{'first_number': 12, 'second_number': 3}": 36,
-    }
+    assert cache_handler.stats()["entries"] == 0
 
     with patch.object(CacheHandler, "read") as read:
         read.return_value = "0"
@@ -0,0 +1,116 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from crewai.agents.cache import (
+    CacheBackend,
+    CacheHandler,
+    InMemoryCacheBackend,
+    SQLiteCacheBackend,
+)
+from crewai.agents.cache.cache_handler import cache_key
+from crewai.tools.cache_tools import CacheTools
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        return InMemoryCacheBackend(max_entries=2, ttl_seconds=60)
+    return SQLiteCacheBackend(str(tmp_path / "cache.db"), max_entries=2, ttl_seconds=60)
+
+
+def test_cache_backend_is_abstract():
+    with pytest.raises(TypeError):
+        CacheBackend()
+
+
+def test_cache_key_ignores_argument_order():
+    assert cache_key("search", {"q": "fractions", "n": 5}) == cache_key(
+        "search", {"n": 5, "q": "fractions"}
+    )
+    assert cache_key("search", {"q": "fractions"}) == cache_key(
+        "search", "{'q': 'fractions'}"
+    )
+    assert cache_key("search", {"q": "fractions"}) != cache_key(
+        "lookup", {"q": "fractions"}
+    )
+
+
+def test_read_add_and_stats(backend):
+    handler = CacheHandler(backend)
+
+    assert handler.read("multiplier", {"first_number": 2, "second_number": 6}) is None
+    handler.add("multiplier", {"first_number": 2, "second_number": 6}, 12)
+
+    assert handler.read("multiplier", {"second_number": 6, "first_number": 2}) == 12
+    assert handler.stats() == {
+        "entries": 1,
+        "hits": 1,
+        "misses": 1,
+        "hit_ratio": 0.5,
+    }
+
+    handler.clear()
+    assert handler.stats()["entries"] == 0
+
+
+def test_evicts_least_recently_used_entry(backend):
+    handler = CacheHandler(backend)
+    handler.add("tool", "a", "A")
+    handler.add("tool", "b", "B")
+    handler.read("tool", "a")
+    handler.add("tool", "c", "C")
+
+    assert handler.read("tool", "a") == "A"
+    assert handler.read("tool", "b") is None
+    assert handler.read("tool", "c") == "C"
+
+
+def test_expires_entries_after_ttl(backend):
+    handler = CacheHandler(backend)
+    with patch("crewai.agents.cache.cache_backend.time") as clock:
+        clock.time.return_value = clock.monotonic.return_value = 1000.0
+        handler.add("tool", "a", "A")
+
+        clock.time.return_value = clock.monotonic.return_value = 1059.0
+        assert handler.read("tool", "a") == "A"
+
+        clock.time.return_value = clock.monotonic.return_value = 1060.0
+        assert handler.read("tool", "a") is None
+
+
+def test_sqlite_cache_is_shared_between_instances(tmp_path):
+    db_path = str(tmp_path / "cache.db")
+    CacheHandler(SQLiteCacheBackend(db_path)).add("search", {"q": "fractions"}, "results")
+
+    assert CacheHandler(SQLiteCacheBackend(db_path)).read(
+        "search", {"q": "fractions"}
+    ) == "results"
+
+
+def test_cache_is_safe_to_share_between_threads(backend):
+    handler = CacheHandler(backend)
+
+    def hit(index):
+        handler.add("tool", index % 2, index % 2)
+        return handler.read("tool", index % 2)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(hit, range(200)))
+
+    assert results == [index % 2 for index in range(200)]
+    assert handler.stats()["hits"] == 200
+
+
+def test_hit_cache_tool_reads_by_canonical_key():
+    handler = CacheHandler()
+    handler.add("multiplier", {"first_number": 2, "second_number": 6}, 12)
+
+    tool = CacheTools(cache_handler=handler)
+    assert (
+        tool.hit_cache(
+            "tool:multiplier|input:{'second_number': 6, 'first_number': 2}"
+        )
+        == 12
+    )
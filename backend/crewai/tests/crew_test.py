@@ -1,10 +1,11 @@
 """Test Agent creation and execution basic functionality."""
 
+import asyncio
 import hashlib
 import json
-from concurrent.futures import Future
+from concurrent.futures import Future, ThreadPoolExecutor
 from unittest import mock
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pydantic_core
 import pytest
@@ -738,6 +739,325 @@ async def test_crew_async_kickoff():
             assert result.token_usage[key] > 0
 
 
+def _branching_research_crew(**crew_kwargs):
+    agents = [
+        Agent(role=f"Researcher {name}", goal="Research", backstory="Researcher")
+        for name in ("A", "B", "C")
+    ]
+    research_a = Task(
+        description="Research A.", expected_output="A.", agent=agents[0], context=[]
+    )
+    research_b = Task(
+        description="Research B.", expected_output="B.", agent=agents[1], context=[]
+    )
+    summary_a = Task(
+        description="Summarize A.",
+        expected_output="A.",
+        agent=agents[0],
+        context=[research_a],
+    )
+    summary_b = Task(
+        description="Summarize B.",
+        expected_output="B.",
+        agent=agents[1],
+        context=[research_b],
+    )
+    report = Task(
+        description="Write the report.",
+        expected_output="Report.",
+        agent=agents[2],
+        context=[summary_a, summary_b],
+    )
+    return Crew(
+        agents=agents,
+        tasks=[research_a, summary_a, research_b, summary_b, report],
+        dag_scheduling=True,
+        **crew_kwargs,
+    )
+
+
+class _TaskRecorder:
+    """Stands in for Task._execute_core, tracking overlap and the contexts handed in."""
+
+    def __init__(self, delay=0.05):
+        import threading
+
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+        self.started = []
+        self.contexts = {}
+
+    def __call__(self, task, agent=None, context=None, tools=None):
+        import time
+
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+            self.started.append(task.description)
+            self.contexts[task.description] = context
+        time.sleep(self.delay)
+        with self.lock:
+            self.running -= 1
+        task.output = TaskOutput(
+            description=task.description, raw=task.description, agent=agent.role
+        )
+        return task.output
+
+
+def test_dag_scheduling_runs_independent_branches_in_parallel():
+    crew = _branching_research_crew()
+    recorder = _TaskRecorder()
+
+    with patch.object(Task, "_execute_core", autospec=True, side_effect=recorder):
+        result = crew.kickoff()
+
+    assert recorder.peak == 2
+    # Summarize A does not wait for Research B even though it comes first in the list
+    assert recorder.started.index("Summarize A.") < recorder.started.index(
+        "Summarize B."
+    )
+    assert recorder.started[-1] == "Write the report."
+    assert recorder.contexts["Research B."] == ""
+    assert recorder.contexts["Summarize A."] == "Research A."
+    assert recorder.contexts["Write the report."] == (
+        "Summarize A.\n\n----------\n\nSummarize B."
+    )
+    assert result.raw == "Write the report."
+    assert len(result.tasks_output) == 5
+
+
+def test_dag_scheduling_respects_max_parallel_tasks():
+    crew = _branching_research_crew(max_parallel_tasks=1)
+    recorder = _TaskRecorder(delay=0.01)
+
+    with patch.object(Task, "_execute_core", autospec=True, side_effect=recorder):
+        crew.kickoff()
+
+    assert recorder.peak == 1
+    assert len(recorder.started) == 5
+
+
+def test_dag_scheduling_does_not_overlap_tasks_of_the_same_agent():
+    agent = Agent(role="Researcher", goal="Research", backstory="Researcher")
+    tasks = [
+        Task(description=f"Research {n}.", expected_output="-", agent=agent, context=[])
+        for n in range(3)
+    ]
+    crew = Crew(agents=[agent], tasks=tasks, dag_scheduling=True)
+    recorder = _TaskRecorder(delay=0.01)
+
+    with patch.object(Task, "_execute_core", autospec=True, side_effect=recorder):
+        crew.kickoff()
+
+    assert recorder.peak == 1
+
+
+def test_dag_scheduling_keeps_list_order_implicit_context():
+    from crewai.utilities.task_graph import TaskGraph
+
+    agent = Agent(role="Researcher", goal="Research", backstory="Researcher")
+    first = Task(description="1", expected_output="-", agent=agent)
+    second = Task(
+        description="2", expected_output="-", agent=agent, async_execution=True
+    )
+    third = Task(
+        description="3", expected_output="-", agent=agent, async_execution=True
+    )
+    fourth = Task(description="4", expected_output="-", agent=agent)
+    fifth = Task(description="5", expected_output="-", agent=agent, context=[first])
+
+    graph = TaskGraph([first, second, third, fourth, fifth])
+
+    assert graph.dependencies == [[], [0], [0], [1, 2], [0]]
+    assert graph.final_tasks == [4]
+
+
+def test_dag_scheduling_propagates_task_errors():
+    crew = _branching_research_crew()
+
+    def failing_execute_core(task, agent=None, context=None, tools=None):
+        raise RuntimeError(f"{task.description} failed")
+
+    with patch.object(Task, "_execute_core", failing_execute_core):
+        with pytest.raises(RuntimeError, match="failed"):
+            crew.kickoff()
+
+
+def test_future_context_is_still_rejected_with_dag_scheduling():
+    agent = Agent(role="Researcher", goal="Research", backstory="Researcher")
+    later = Task(description="Later.", expected_output="-", agent=agent)
+    earlier = Task(
+        description="Earlier.", expected_output="-", agent=agent, context=[later]
+    )
+
+    with pytest.raises(pydantic_core._pydantic_core.ValidationError):
+        Crew(agents=[agent], tasks=[earlier, later], dag_scheduling=True)
+
+
+@pytest.mark.asyncio
+async def test_kickoff_async_with_dag_scheduling():
+    crew = _branching_research_crew()
+    running = 0
+    peak = 0
+
+    async def fake_aexecute(self, agent=None, context=None, tools=None):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        self.output = TaskOutput(
+            description=self.description, raw=self.description, agent=agent.role
+        )
+        return self.output
+
+    with patch.object(Task, "aexecute", fake_aexecute):
+        result = await crew.kickoff_async()
+
+    assert peak == 2
+    assert result.raw == "Write the report."
+
+
+def _async_research_crew(**crew_kwargs):
+    agents = [
+        Agent(role=f"Researcher {n}", goal="Research", backstory="Researcher")
+        for n in range(3)
+    ]
+    tasks = [
+        Task(
+            description=f"Research {n}.",
+            expected_output="-",
+            agent=agents[n],
+            async_execution=True,
+        )
+        for n in range(2)
+    ]
+    tasks.append(
+        Task(
+            description="Write the report.",
+            expected_output="-",
+            agent=agents[2],
+            context=tasks[:],
+        )
+    )
+    return Crew(agents=agents, tasks=tasks, **crew_kwargs)
+
+
+def test_async_tasks_run_on_the_crew_task_pool():
+    crew = _async_research_crew(max_parallel_tasks=1)
+    recorder = _TaskRecorder()
+
+    with patch.object(Task, "_execute_core", autospec=True, side_effect=recorder):
+        crew.kickoff()
+
+    assert recorder.peak == 1
+    # The second async task queued behind the first on the single worker
+    waits = crew.task_queue_metrics
+    assert waits[str(crew.tasks[1].id)] > waits[str(crew.tasks[0].id)]
+    assert str(crew.tasks[2].id) not in waits
+    # The crew owns its pool, so the end of the run stops it
+    assert crew._task_executor is None
+
+
+def test_kickoff_for_each_runs_every_fork_on_one_pool_and_stops_it():
+    crew = _async_research_crew(max_parallel_tasks=2)
+    recorder = _TaskRecorder(delay=0.01)
+    pools = []
+
+    def make_pool(*args, **kwargs):
+        pools.append(ThreadPoolExecutor(*args, **kwargs))
+        return pools[-1]
+
+    with patch.object(Task, "_execute_core", autospec=True, side_effect=recorder):
+        with patch("crewai.crew.ThreadPoolExecutor", side_effect=make_pool):
+            crew.kickoff_for_each([{}, {}, {}])
+
+    assert len(pools) == 1
+    assert pools[0]._shutdown
+    assert crew._task_executor is None
+
+
+def test_forks_leave_the_shared_pool_to_its_owner():
+    crew = _async_research_crew()
+    forked = crew.fork()
+    pool = crew._task_executor
+
+    with patch.object(Task, "_execute_core", autospec=True, side_effect=_TaskRecorder(delay=0)):
+        forked.kickoff()
+
+    assert forked._task_executor is pool
+    forked.shutdown()
+    assert forked._task_executor is None
+    assert not pool._shutdown
+
+    crew.shutdown()
+    assert pool._shutdown
+
+
+def test_copies_run_after_the_owner_stopped_the_shared_pool():
+    crew = _async_research_crew()
+    copied = crew.copy()
+    forked = crew.fork()
+    recorder = _TaskRecorder(delay=0)
+
+    with patch.object(Task, "_execute_core", autospec=True, side_effect=recorder):
+        crew.kickoff()
+        assert copied._task_executor._shutdown
+
+        copied.kickoff()
+        forked.kickoff()
+
+    assert len(recorder.started) == 9
+    # Each copy started, owned and stopped a pool of its own
+    assert copied._task_executor is None
+    assert forked._task_executor is None
+
+
+def test_async_task_errors_propagate_to_kickoff():
+    crew = _async_research_crew()
+
+    def execute_core(task, agent=None, context=None, tools=None):
+        raise RuntimeError(f"{task.description} failed")
+
+    with patch.object(Task, "_execute_core", autospec=True, side_effect=execute_core):
+        with pytest.raises(RuntimeError, match="Research 0. failed"):
+            crew.kickoff()
+
+
+def test_task_timeout_cancels_the_run():
+    crew = _async_research_crew(task_timeout=0.05)
+    recorder = _TaskRecorder(delay=0.5)
+
+    with patch.object(Task, "_execute_core", autospec=True, side_effect=recorder):
+        with pytest.raises(TimeoutError, match="Research 0."):
+            crew.kickoff()
+
+    assert crew.cancelled
+    crew.shutdown()
+
+
+def test_cancelled_crew_stops_agents_before_their_next_step():
+    from crewai.agents.executor import CrewAgentExecutor
+    from crewai.utilities.exceptions.task_cancelled_exception import (
+        TaskCancelledError,
+    )
+
+    crew = _async_research_crew()
+    agent = crew.agents[0]
+    agent.crew = crew
+    agent.create_agent_executor()
+    crew.cancel()
+
+    with patch.object(CrewAgentExecutor, "_take_next_step") as take_next_step:
+        with pytest.raises(TaskCancelledError):
+            agent.execute_task(crew.tasks[0])
+
+    take_next_step.assert_not_called()
+    assert agent._times_executed == 0
+
+
 @pytest.mark.vcr(filter_headers=["authorization"])
 def test_async_task_execution_call_count():
     from unittest.mock import MagicMock, patch
@@ -923,6 +1243,77 @@ def test_kickoff_for_each_error_handling():
             crew.kickoff_for_each(inputs=inputs)
 
 
+def test_fork_shares_definitions_and_separates_run_state():
+    from crewai.utilities.token_counter_callback import TokenCalcHandler
+
+    crew = _branching_research_crew(cache=True)
+    condition = ConditionalTask(
+        description="Double-check the report.",
+        expected_output="-",
+        agent=crew.agents[2],
+        condition=lambda output: True,
+    )
+    crew.tasks.append(condition)
+
+    forked = crew.fork()
+
+    assert forked.id != crew.id
+    assert forked._cache_handler is crew._cache_handler
+    assert forked._task_executor is crew._task_executor
+    for agent, forked_agent in zip(crew.agents, forked.agents):
+        assert forked_agent is not agent
+        assert forked_agent.id != agent.id
+        assert forked_agent.tools == agent.tools
+        assert forked_agent.tools is not agent.tools
+        assert forked_agent.cache_handler is agent.cache_handler
+        assert forked_agent._token_process is not agent._token_process
+        assert forked_agent.agent_executor is None
+        token_handlers = [
+            handler
+            for handler in forked_agent.llm.callbacks
+            if isinstance(handler, TokenCalcHandler)
+        ]
+        assert [handler.token_cost_process for handler in token_handlers] == [
+            forked_agent._token_process
+        ]
+
+    forked_tasks = {task.description: task for task in forked.tasks}
+    assert forked_tasks["Summarize A."].context == [forked_tasks["Research A."]]
+    assert forked_tasks["Summarize A."].agent is forked.agents[0]
+    assert forked_tasks["Research A."].context == []
+    assert isinstance(forked_tasks["Double-check the report."], ConditionalTask)
+    assert forked_tasks["Double-check the report."].context is None
+
+
+def test_kickoff_for_each_runs_forks_without_touching_the_template():
+    agent = Agent(
+        role="{topic} Researcher",
+        goal="Express hot takes on {topic}.",
+        backstory="You have a lot of experience with {topic}.",
+    )
+    task = Task(
+        description="Give me an analysis around {topic}.",
+        expected_output="1 bullet point about {topic} that's under 15 words.",
+        agent=agent,
+    )
+    crew = Crew(agents=[agent], tasks=[task])
+    recorder = _TaskRecorder(delay=0)
+
+    with patch.object(Crew, "copy") as copy, patch.object(
+        Task, "_execute_core", autospec=True, side_effect=recorder
+    ):
+        results = crew.kickoff_for_each(inputs=[{"topic": "dog"}, {"topic": "cat"}])
+
+    copy.assert_not_called()
+    assert [result.raw for result in results] == [
+        "Give me an analysis around dog.",
+        "Give me an analysis around cat.",
+    ]
+    assert task.description == "Give me an analysis around {topic}."
+    assert task.output is None
+    assert agent.role == "{topic} Researcher"
+
+
 @pytest.mark.vcr(filter_headers=["authorization"])
 @pytest.mark.asyncio
 async def test_kickoff_async_basic_functionality_and_output():
@@ -950,12 +1341,77 @@ async def test_kickoff_async_basic_functionality_and_output():
     )
 
     expected_output = "This is a sample output from kickoff."
-    with patch.object(Crew, "kickoff", return_value=expected_output) as mock_kickoff:
+    with patch.object(Crew, "kickoff") as mock_kickoff, patch.object(
+        Crew, "_aexecute_tasks", new_callable=AsyncMock, return_value=expected_output
+    ) as mock_aexecute_tasks:
         result = await crew.kickoff_async(inputs)
 
         assert isinstance(result, str), "Result should be a string"
         assert result == expected_output, "Result should match expected output"
-        mock_kickoff.assert_called_once_with(inputs)
+        mock_aexecute_tasks.assert_awaited_once_with(crew.tasks)
+        mock_kickoff.assert_not_called()
+        assert task.description == "Give me an analysis around dog."
+
+
+@pytest.mark.asyncio
+async def test_kickoff_async_runs_async_tasks_concurrently_on_the_loop():
+    from unittest.mock import patch
+
+    agent = Agent(
+        role="Researcher",
+        goal="Make the best research and analysis on content about AI and AI agents",
+        backstory="You're an expert researcher, specialized in technology",
+        allow_delegation=False,
+    )
+    first = Task(
+        description="Give me a list of 5 interesting ideas to explore.",
+        expected_output="Bullet point list of 5 important events.",
+        async_execution=True,
+        agent=agent,
+    )
+    second = Task(
+        description="Give me a list of 5 interesting ideas about AI.",
+        expected_output="Bullet point list of 5 important events.",
+        async_execution=True,
+        agent=agent,
+    )
+    summary = Task(
+        description="Summarize the ideas.",
+        expected_output="A summary.",
+        context=[first, second],
+        agent=agent,
+    )
+    crew = Crew(agents=[agent], tasks=[first, second, summary])
+
+    running = 0
+    peak = 0
+    contexts = {}
+
+    async def fake_aexecute(self, agent=None, context=None, tools=None):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        contexts[self.description] = context
+        self.output = TaskOutput(
+            description=self.description, raw=self.description, agent=agent.role
+        )
+        return self.output
+
+    with patch.object(Task, "aexecute", fake_aexecute), patch.object(
+        Task, "execute_sync"
+    ) as execute_sync:
+        result = await crew.kickoff_async()
+
+    execute_sync.assert_not_called()
+    assert peak == 2
+    assert result.raw == "Summarize the ideas."
+    assert contexts["Summarize the ideas."] == (
+        "Give me a list of 5 interesting ideas to explore."
+        "\n\n----------\n\n"
+        "Give me a list of 5 interesting ideas about AI."
+    )
 
 
 @pytest.mark.vcr(filter_headers=["authorization"])
@@ -1035,6 +1491,130 @@ async def test_async_kickoff_for_each_async_empty_input():
     assert results == [], "Result should be an empty list when input is empty"
 
 
+def _stream_crew():
+    agent = Agent(
+        role="{topic} Researcher",
+        goal="Express hot takes on {topic}.",
+        backstory="You have a lot of experience with {topic}.",
+    )
+    task = Task(
+        description="Give me an analysis around {topic}.",
+        expected_output="1 bullet point about {topic} that's under 15 words.",
+        agent=agent,
+    )
+    return Crew(agents=[agent], tasks=[task])
+
+
+@pytest.mark.asyncio
+async def test_kickoff_for_each_stream_bounds_concurrency_and_pulls_inputs_lazily():
+    crew = _stream_crew()
+    pulled = []
+    running = 0
+    peak = 0
+
+    async def topics():
+        for topic in ["dog", "cat", "apple", "pear", "fig"]:
+            pulled.append(topic)
+            yield {"topic": topic}
+
+    async def fake_kickoff_async(self, inputs):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return inputs["topic"]
+
+    with patch.object(Crew, "kickoff_async", autospec=True, side_effect=fake_kickoff_async):
+        stream = crew.kickoff_for_each_stream(topics(), max_concurrency=2)
+        first = await stream.__anext__()
+        assert len(pulled) == 2
+        results = [first] + [item async for item in stream]
+
+    assert peak == 2
+    assert sorted(results) == [(0, "dog"), (1, "cat"), (2, "apple"), (3, "pear"), (4, "fig")]
+
+
+@pytest.mark.asyncio
+async def test_kickoff_for_each_stream_yields_runs_as_they_finish():
+    crew = _stream_crew()
+    delays = {"dog": 0.05, "cat": 0.0}
+
+    async def fake_kickoff_async(self, inputs):
+        await asyncio.sleep(delays[inputs["topic"]])
+        self.usage_metrics = {"total_tokens": 10, "successful_requests": 1}
+        return inputs["topic"]
+
+    with patch.object(Crew, "kickoff_async", autospec=True, side_effect=fake_kickoff_async):
+        seen = []
+        async for index, output in crew.kickoff_for_each_stream(
+            [{"topic": "dog"}, {"topic": "cat"}]
+        ):
+            seen.append((index, output, crew.usage_metrics["total_tokens"]))
+
+    assert seen == [(1, "cat", 10), (0, "dog", 20)]
+    assert crew.usage_metrics["successful_requests"] == 2
+
+
+@pytest.mark.asyncio
+async def test_kickoff_for_each_stream_errors():
+    crew = _stream_crew()
+    cancelled = []
+
+    async def fake_kickoff_async(self, inputs):
+        if inputs["topic"] == "bad":
+            raise ValueError("boom")
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(inputs["topic"])
+            raise
+        return inputs["topic"]
+
+    inputs = [{"topic": "dog"}, {"topic": "bad"}]
+    with patch.object(Crew, "kickoff_async", autospec=True, side_effect=fake_kickoff_async):
+        with pytest.raises(ValueError, match="boom"):
+            async for _ in crew.kickoff_for_each_stream(inputs):
+                pass
+        await asyncio.sleep(0)
+        assert cancelled == ["dog"]
+
+        results = [
+            item
+            async for item in crew.kickoff_for_each_stream(
+                [{"topic": "bad"}], return_exceptions=True
+            )
+        ]
+        assert len(results) == 1 and isinstance(results[0][1], ValueError)
+
+        with pytest.raises(TypeError):
+            async for _ in crew.kickoff_for_each_stream("invalid input"):
+                pass
+
+
+@pytest.mark.asyncio
+async def test_kickoff_for_each_stream_resets_task_outputs_however_it_ends():
+    crew = _stream_crew()
+
+    async def fake_kickoff_async(self, inputs):
+        if inputs["topic"] == "bad":
+            raise ValueError("boom")
+        return inputs["topic"]
+
+    with patch.object(Crew, "kickoff_async", autospec=True, side_effect=fake_kickoff_async):
+        with patch.object(crew._task_output_handler, "reset") as reset:
+            with pytest.raises(ValueError):
+                async for _ in crew.kickoff_for_each_stream([{"topic": "bad"}]):
+                    pass
+            assert reset.call_count == 1
+
+            # A consumer that stops early closes the stream
+            stream = crew.kickoff_for_each_stream([{"topic": "dog"}, {"topic": "cat"}])
+            await stream.__anext__()
+            await stream.aclose()
+            assert reset.call_count == 2
+
+
 def test_set_agents_step_callback():
     from unittest.mock import patch
 
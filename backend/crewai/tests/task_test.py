@@ -2,6 +2,7 @@
 
 import hashlib
 import json
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -191,6 +192,58 @@ def test_async_execution():
         execute.assert_called_once_with(task=task, context=None, tools=[])
 
 
+def test_async_execution_sets_errors_on_the_future():
+    researcher = Agent(
+        role="Researcher",
+        goal="Make the best research and analysis on content about AI and AI agents",
+        backstory="You're an expert researcher, specialized in technology, software engineering, AI and startups. You work as a freelancer and is now working on doing research and analysis for a new customer.",
+        allow_delegation=False,
+    )
+
+    task = Task(
+        description="Give me a list of 5 interesting ideas to explore for na article, what makes them unique and interesting.",
+        expected_output="Bullet point list of 5 interesting ideas.",
+        async_execution=True,
+        agent=researcher,
+    )
+
+    with patch.object(Agent, "execute_task", side_effect=RuntimeError("LLM down")):
+        future = task.execute_async(agent=researcher)
+        with pytest.raises(RuntimeError, match="LLM down"):
+            future.result(timeout=5)
+
+
+def test_async_execution_on_executor_records_queue_wait():
+    from concurrent.futures import ThreadPoolExecutor
+
+    researcher = Agent(
+        role="Researcher",
+        goal="Make the best research and analysis on content about AI and AI agents",
+        backstory="You're an expert researcher, specialized in technology, software engineering, AI and startups. You work as a freelancer and is now working on doing research and analysis for a new customer.",
+        allow_delegation=False,
+    )
+
+    task = Task(
+        description="Give me a list of 5 interesting ideas to explore for na article, what makes them unique and interesting.",
+        expected_output="Bullet point list of 5 interesting ideas.",
+        async_execution=True,
+        agent=researcher,
+    )
+
+    with ThreadPoolExecutor(max_workers=1) as executor, patch.object(
+        Agent, "execute_task", return_value="ok"
+    ):
+        # Occupy the only worker so the task has to queue behind it
+        blocker = executor.submit(time.sleep, 0.1)
+        output = task.execute_async(agent=researcher, executor=executor).result(
+            timeout=5
+        )
+
+    assert blocker.done()
+    assert output.raw == "ok"
+    assert task._queue_wait_time >= 0.05
+
+
 def test_multiple_output_type_error():
     class Output(BaseModel):
         field: str
@@ -0,0 +1,63 @@
+"""
+Explain every repository query and flag any that would scan a whole collection.
+
+Only the query planner runs (explain at "queryPlanner" verbosity executes
+nothing), so this is safe to point at a production database. Exits non-zero if
+any plan contains a COLLSCAN.
+
+Keep REPOSITORY_QUERIES in step with the filters and sorts in db/repositories.
+
+Usage:
+    MONGODB_URI=mongodb://localhost:27017 python -m backend.db.check_query_plans
+"""
+from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import sys
+from bson import ObjectId
+from pymongo import ASCENDING, DESCENDING
+
+from .connection import MongoDB, get_database
+
+# (query, collection, filter, sort) with placeholder values of the right type
+REPOSITORY_QUERIES: List[Tuple[str, str, Dict[str, Any], Optional[List[Tuple[str, int]]]]] = [
+    ("UserRepository.get_user_by_firebase_uid", "users", {"firebase_uid": "plan-check"}, None),
+    ("UserRepository.create_user / get_or_create_profile / update_profile", "users", {"firebase_uid": "plan-check"}, None),
+    ("UserRepository.get_user_by_id / update_user / delete_user", "users", {"_id": ObjectId()}, None),
+    ("UserRepository.find_users", "users", {"_id": {"$gt": ObjectId()}}, [("_id", ASCENDING)]),
+    ("LearningStyleRepository.get_latest_learning_style", "learning_styles", {"user_id": "plan-check"}, [("timestamp", DESCENDING)])
+]
+
+def plan_stages(plan: Dict[str, Any]) -> List[str]:
+    """Flatten a winning plan into its stage names, outermost first"""
+    stages = [plan.get("stage", "?")]
+    for child in ("inputStage", "queryPlan"):
+        if child in plan:
+            stages += plan_stages(plan[child])
+    for child in plan.get("inputStages", []):
+        stages += plan_stages(child)
+    return stages
+
+async def explain_query(db, collection: str, query_filter: Dict[str, Any], sort) -> List[str]:
+    command: Dict[str, Any] = {"find": collection, "filter": query_filter}
+    if sort:
+        command["sort"] = dict(sort)
+    explanation = await db.command("explain", command, verbosity="queryPlanner")
+    return plan_stages(explanation["queryPlanner"]["winningPlan"])
+
+async def main() -> int:
+    db = get_database()
+    collscans = 0
+    for name, collection, query_filter, sort in REPOSITORY_QUERIES:
+        stages = await explain_query(db, collection, query_filter, sort)
+        flag = "COLLSCAN" in stages
+        collscans += flag
+        print(f"{'FAIL' if flag else 'ok  '} {name:<68} {' <- '.join(stages)}")
+    await MongoDB.close_database_connection()
+
+    if collscans:
+        print(f"\n{collscans} quer{'y' if collscans == 1 else 'ies'} would scan a whole collection")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -1,15 +1,35 @@
 from motor.motor_asyncio import AsyncIOMotorClient
 from ..config.settings import get_settings
-
-settings = get_settings()
+from .indexes import ensure_indexes
 
 class MongoDB:
     client: AsyncIOMotorClient = None
+    indexes_ensured: bool = False
+    
+    @classmethod
+    def create_client(cls) -> AsyncIOMotorClient:
+        """Create the shared Motor client with the configured connection pool."""
+        # Settings are read here rather than on import so importing a repository stays cheap
+        settings = get_settings()
+        return AsyncIOMotorClient(
+            settings.mongodb_uri,
+            maxPoolSize=settings.mongodb_max_pool_size,
+            minPoolSize=settings.mongodb_min_pool_size,
+            maxIdleTimeMS=settings.mongodb_max_idle_time_ms,
+            waitQueueTimeoutMS=settings.mongodb_wait_queue_timeout_ms,
+            serverSelectionTimeoutMS=settings.mongodb_server_selection_timeout_ms
+        )
     
     @classmethod
     async def connect_to_database(cls, app=None):
         """Create database connection."""
-        cls.client = AsyncIOMotorClient(settings.mongodb_uri)
+        settings = get_settings()
+        if cls.client is None:
+            cls.client = cls.create_client()
+        if settings.mongodb_ensure_indexes and not cls.indexes_ensured:
+            # Index migration: provision what the repositories' queries need before serving
+            await ensure_indexes(cls.client[settings.mongodb_name])
+            cls.indexes_ensured = True
         if app:
             app.state.mongodb_client = cls.client
             app.state.mongodb = cls.client[settings.mongodb_name]
@@ -19,10 +39,14 @@ class MongoDB:
         """Close database connection."""
         if cls.client:
             cls.client.close()
+            cls.client = None
             if app:
                 app.state.mongodb_client = None
                 app.state.mongodb = None
 
 def get_database():
     """Return database instance."""
-    return MongoDB.client[get_settings().mongodb_name]
\ No newline at end of file
+    if MongoDB.client is None:
+        # Routes mounted without the lifespan hook still share one pooled client
+        MongoDB.client = MongoDB.create_client()
+    return MongoDB.client[get_settings().mongodb_name]
@@ -0,0 +1,34 @@
+from typing import Dict, List
+import logging
+from pymongo import IndexModel, ASCENDING, DESCENDING
+from pymongo.errors import OperationFailure
+
+logger = logging.getLogger(__name__)
+
+# Indexes the repositories rely on, by collection. create_indexes is idempotent,
+# so declaring an index here is all it takes to provision it on the next startup.
+REQUIRED_INDEXES: Dict[str, List[IndexModel]] = {
+    "users": [
+        # Every authenticated request resolves its user by Firebase UID; unique also
+        # makes the concurrent first-login upsert in UserRepository.create_user safe
+        IndexModel([("firebase_uid", ASCENDING)], name="firebase_uid_unique", unique=True)
+    ],
+    "learning_styles": [
+        # Serves get_latest_learning_style's equality match and timestamp sort together
+        IndexModel([("user_id", ASCENDING), ("timestamp", DESCENDING)], name="user_id_timestamp_desc")
+    ]
+}
+
+async def ensure_indexes(db) -> Dict[str, List[str]]:
+    """
+    Create any missing required indexes and return the index names per collection.
+    A collection whose index cannot be built (e.g. duplicate UIDs) is logged and skipped
+    so one bad collection does not keep the API from starting.
+    """
+    created: Dict[str, List[str]] = {}
+    for collection, indexes in REQUIRED_INDEXES.items():
+        try:
+            created[collection] = await db[collection].create_indexes(indexes)
+        except OperationFailure as e:
+            logger.error("Could not create indexes on %s: %s", collection, e)
+    return created
@@ -0,0 +1,25 @@
+from typing import Dict, Any, List
+from pymongo.errors import BulkWriteError
+
+async def insert_many_unordered(collection, documents: List[Dict[str, Any]]) -> Dict[int, str]:
+    """
+    Insert documents in one round trip, continuing past failures.
+    Successful documents get their `_id` set in place; returns error messages by input index.
+    """
+    if not documents:
+        return {}
+    try:
+        await collection.insert_many(documents, ordered=False)
+    except BulkWriteError as e:
+        return {error["index"]: error["errmsg"] for error in e.details.get("writeErrors", [])}
+    return {}
+
+async def bulk_write_unordered(collection, operations: List[Any]) -> Dict[int, str]:
+    """Run write operations in one round trip and return error messages by operation index."""
+    if not operations:
+        return {}
+    try:
+        await collection.bulk_write(operations, ordered=False)
+    except BulkWriteError as e:
+        return {error["index"]: error["errmsg"] for error in e.details.get("writeErrors", [])}
+    return {}
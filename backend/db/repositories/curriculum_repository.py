@@ -0,0 +1,18 @@
+from typing import Dict, Any, List
+from ..connection import get_database
+from .bulk import insert_many_unordered
+
+class CurriculumRepository:
+    @staticmethod
+    async def create_curriculum(curriculum_doc: Dict[str, Any]) -> Dict[str, Any]:
+        """Store a generated curriculum."""
+        db = get_database()
+        result = await db.curriculums.insert_one(curriculum_doc)
+        curriculum_doc["_id"] = result.inserted_id
+        return curriculum_doc
+    
+    @staticmethod
+    async def create_curriculums(curriculum_docs: List[Dict[str, Any]]) -> Dict[int, str]:
+        """Store many curriculums in one round trip; returns error messages by index."""
+        db = get_database()
+        return await insert_many_unordered(db.curriculums, curriculum_docs)
@@ -0,0 +1,27 @@
+from typing import Optional, Dict, Any, List
+from ..connection import get_database
+from .bulk import insert_many_unordered
+
+class LearningStyleRepository:
+    @staticmethod
+    async def create_learning_style(style_doc: Dict[str, Any]) -> Dict[str, Any]:
+        """Store a learning style assessment result."""
+        db = get_database()
+        result = await db.learning_styles.insert_one(style_doc)
+        style_doc["_id"] = result.inserted_id
+        return style_doc
+    
+    @staticmethod
+    async def create_learning_styles(style_docs: List[Dict[str, Any]]) -> Dict[int, str]:
+        """Store many assessment results in one round trip; returns error messages by index."""
+        db = get_database()
+        return await insert_many_unordered(db.learning_styles, style_docs)
+    
+    @staticmethod
+    async def get_latest_learning_style(user_id: str) -> Optional[Dict[str, Any]]:
+        """Get a user's most recent learning style assessment."""
+        db = get_database()
+        return await db.learning_styles.find_one(
+            {"user_id": user_id},
+            sort=[("timestamp", -1)]
+        )
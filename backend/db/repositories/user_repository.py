@@ -2,17 +2,41 @@ from typing import List, Optional, Dict, Any
 from ..connection import get_database
 from ...models.user import UserModel
 from bson import ObjectId
+from pymongo import ReturnDocument, UpdateOne
+from .bulk import bulk_write_unordered
+from ...auth.token_cache import TTLCache
+
+# Short-lived cache of firebase_uid -> UserModel for get_current_user. Every write below
+# drops the users it touches, so role changes apply on the next request, not after the TTL
+USER_CACHE_TTL_SECONDS = 30
+user_cache = TTLCache()
+
+def invalidate_cached_user(firebase_uid: Optional[str]):
+    """Drop a user from the lookup cache after their document changes."""
+    if firebase_uid:
+        user_cache.invalidate(firebase_uid)
 
 class UserRepository:
     @staticmethod
     async def create_user(user_data: Dict[str, Any]) -> UserModel:
-        """Create a new user."""
+        """
+        Create a user, or return the existing user with the same Firebase UID.
+        Unlike a plain insert this never fails on a duplicate UID; the stored user wins and
+        `user_data` is ignored. Raises ValueError if `firebase_uid` is missing or empty.
+        """
+        firebase_uid = user_data.get("firebase_uid")
+        if not firebase_uid:
+            raise ValueError("firebase_uid is required to create a user")
         db = get_database()
-        user_dict = {k: v for k, v in user_data.items() if v is not None}
-        result = await db.users.insert_one(user_dict)
+        user_dict = {k: v for k, v in user_data.items() if v is not None and k != "firebase_uid"}
         
-        # Retrieve the newly created user
-        user = await db.users.find_one({"_id": result.inserted_id})
+        # Single round trip; concurrent first logins cannot create duplicates
+        user = await db.users.find_one_and_update(
+            {"firebase_uid": firebase_uid},
+            {"$setOnInsert": user_dict},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
         return UserModel(**user)
     
     @staticmethod
@@ -38,19 +62,83 @@ class UserRepository:
         """Update a user's information."""
         db = get_database()
         update_data = {k: v for k, v in update_data.items() if v is not None}
-        result = await db.users.update_one(
+        user = await db.users.find_one_and_update(
             {"_id": ObjectId(user_id)},
-            {"$set": update_data}
+            {"$set": update_data},
+            return_document=ReturnDocument.AFTER
         )
         
-        if result.modified_count:
-            user = await db.users.find_one({"_id": ObjectId(user_id)})
+        if user:
+            invalidate_cached_user(user.get("firebase_uid"))
             return UserModel(**user)
         return None
     
+    @staticmethod
+    async def get_or_create_profile(firebase_uid: str, defaults: Dict[str, Any]) -> Dict[str, Any]:
+        """Get a raw user profile document by Firebase UID, inserting `defaults` if it does not exist."""
+        db = get_database()
+        # Reads stay reads; only a missing profile pays for the upsert
+        user = await db.users.find_one({"firebase_uid": firebase_uid})
+        if user is not None:
+            return user
+        defaults = {k: v for k, v in defaults.items() if k != "firebase_uid"}
+        # $setOnInsert keeps a profile created concurrently since the read
+        return await db.users.find_one_and_update(
+            {"firebase_uid": firebase_uid},
+            {"$setOnInsert": defaults},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+    
+    @staticmethod
+    async def update_profile(firebase_uid: str, update_data: Dict[str, Any], upsert: bool = False) -> Optional[Dict[str, Any]]:
+        """Set fields on a user profile by Firebase UID and return the updated document."""
+        db = get_database()
+        user = await db.users.find_one_and_update(
+            {"firebase_uid": firebase_uid},
+            {"$set": update_data},
+            upsert=upsert,
+            return_document=ReturnDocument.AFTER
+        )
+        invalidate_cached_user(firebase_uid)
+        return user
+    
+    @staticmethod
+    async def update_profiles(updates: Dict[str, Dict[str, Any]]) -> Dict[str, str]:
+        """Set fields on many profiles, keyed by Firebase UID, in one round trip; returns errors by UID."""
+        db = get_database()
+        uids = list(updates)
+        errors = await bulk_write_unordered(
+            db.users,
+            [UpdateOne({"firebase_uid": uid}, {"$set": updates[uid]}) for uid in uids]
+        )
+        for uid in uids:
+            invalidate_cached_user(uid)
+        return {uids[index]: message for index, message in errors.items()}
+    
+    @staticmethod
+    def find_users(
+        after_id: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        batch_size: int = 500
+    ):
+        """Return a cursor over raw user documents in `_id` order, starting after `after_id`."""
+        db = get_database()
+        query = {"_id": {"$gt": ObjectId(after_id)}} if after_id else {}
+        projection = {field: 1 for field in fields} if fields else None
+        # Keyset on the _id index: each page costs the same however deep it is
+        cursor = db.users.find(query, projection).sort("_id", 1).batch_size(batch_size)
+        if limit:
+            cursor = cursor.limit(limit)
+        return cursor
+    
     @staticmethod
     async def delete_user(user_id: str) -> bool:
         """Delete a user."""
         db = get_database()
-        result = await db.users.delete_one({"_id": ObjectId(user_id)})
-        return result.deleted_count > 0
\ No newline at end of file
+        user = await db.users.find_one_and_delete({"_id": ObjectId(user_id)}, {"firebase_uid": 1})
+        if user is None:
+            return False
+        invalidate_cached_user(user.get("firebase_uid"))
+        return True
\ No newline at end of file
@@ -0,0 +1,216 @@
+"""
+Student storage shared by every worker process.
+
+IDs come from the backend (SQLite AUTOINCREMENT or an atomic Mongo counter)
+rather than from process state, so concurrent creates in different workers
+cannot collide.
+"""
+from abc import ABC, abstractmethod
+from typing import Dict, Any, List, Optional
+from datetime import datetime
+import asyncio
+import os
+import sqlite3
+
+MAX_PAGE_SIZE = 200
+# Relative to the working directory; the data directory is git-ignored
+DEFAULT_DB_PATH = os.path.join("data", "students.db")
+
+class StudentStore(ABC):
+    """
+    Interface for student backends.
+    Records are dicts with `id`, `name` and `created_at`; listing is keyset-paginated on `id`.
+    """
+
+    async def create(self, name: str) -> Dict[str, Any]:
+        return (await self.create_many([name]))[0]
+
+    @abstractmethod
+    async def create_many(self, names: List[str]) -> List[Dict[str, Any]]:
+        """Create students in one round trip and return them in input order"""
+
+    async def get(self, student_id: int) -> Optional[Dict[str, Any]]:
+        found = await self.get_many([student_id])
+        return found[0] if found else None
+
+    @abstractmethod
+    async def get_many(self, student_ids: List[int]) -> List[Dict[str, Any]]:
+        """Return the students that exist, in the order their IDs were given"""
+
+    @abstractmethod
+    async def update(self, student_id: int, name: str) -> Optional[Dict[str, Any]]:
+        """Rename a student and return the updated record, or None if it does not exist"""
+
+    @abstractmethod
+    async def delete(self, student_id: int) -> bool:
+        """Delete a student and report whether it existed"""
+
+    @abstractmethod
+    async def list(self, limit: int = 50, after_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return up to `limit` students with IDs greater than `after_id`, in ID order"""
+
+    def close(self) -> None:
+        """Release resources held by the store"""
+
+class SQLiteStudentStore(StudentStore):
+    """Student store backed by a SQLite file that several worker processes can share"""
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, busy_timeout: float = 5.0):
+        self.db_path = db_path
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        # Writers from other processes hold the lock briefly; wait for it instead of failing
+        self._conn = sqlite3.connect(db_path, timeout=busy_timeout, check_same_thread=False)
+        self._lock = asyncio.Lock()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # AUTOINCREMENT never reuses the ID of a deleted student
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS students (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                created_at TEXT NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    async def create_many(self, names):
+        return await self._run(self._create_many, names)
+
+    async def get_many(self, student_ids):
+        if not student_ids:
+            return []
+        return await self._run(self._get_many, student_ids)
+
+    async def update(self, student_id, name):
+        return await self._run(self._update, student_id, name)
+
+    async def delete(self, student_id):
+        return await self._run(self._delete, student_id)
+
+    async def list(self, limit=50, after_id=None):
+        return await self._run(self._list, min(limit, MAX_PAGE_SIZE), after_id or 0)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    async def _run(self, func, *args):
+        """Run a query off the event loop, serialised on the shared connection"""
+        async with self._lock:
+            return await asyncio.to_thread(func, *args)
+
+    def _create_many(self, names: List[str]) -> List[Dict[str, Any]]:
+        created_at = datetime.utcnow()
+        students = []
+        # One transaction for the whole batch
+        with self._conn:
+            for name in names:
+                cursor = self._conn.execute(
+                    "INSERT INTO students (name, created_at) VALUES (?, ?)",
+                    (name, created_at.isoformat())
+                )
+                students.append({"id": cursor.lastrowid, "name": name, "created_at": created_at})
+        return students
+
+    def _get_many(self, student_ids: List[int]) -> List[Dict[str, Any]]:
+        placeholders = ",".join("?" * len(student_ids))
+        rows = self._conn.execute(
+            f"SELECT id, name, created_at FROM students WHERE id IN ({placeholders})",
+            student_ids
+        ).fetchall()
+        by_id = {row[0]: self._to_record(row) for row in rows}
+        return [by_id[student_id] for student_id in student_ids if student_id in by_id]
+
+    def _update(self, student_id: int, name: str) -> Optional[Dict[str, Any]]:
+        with self._conn:
+            row = self._conn.execute(
+                "UPDATE students SET name = ? WHERE id = ? RETURNING id, name, created_at",
+                (name, student_id)
+            ).fetchone()
+        return self._to_record(row) if row else None
+
+    def _delete(self, student_id: int) -> bool:
+        with self._conn:
+            cursor = self._conn.execute("DELETE FROM students WHERE id = ?", (student_id,))
+        return cursor.rowcount > 0
+
+    def _list(self, limit: int, after_id: int) -> List[Dict[str, Any]]:
+        rows = self._conn.execute(
+            "SELECT id, name, created_at FROM students WHERE id > ? ORDER BY id LIMIT ?",
+            (after_id, limit)
+        ).fetchall()
+        return [self._to_record(row) for row in rows]
+
+    @staticmethod
+    def _to_record(row) -> Dict[str, Any]:
+        student_id, name, created_at = row
+        return {"id": student_id, "name": name, "created_at": datetime.fromisoformat(created_at)}
+
+class MongoStudentStore(StudentStore):
+    """
+    Student store backed by a Motor database.
+    Integer IDs are reserved in blocks from an atomic counter document, so a batch costs one extra round trip.
+    """
+
+    def __init__(self, database, collection: str = "students", counter_id: str = "students"):
+        from pymongo import ReturnDocument
+        self._return_after = ReturnDocument.AFTER
+        self.students = database[collection]
+        self.counters = database.counters
+        self.counter_id = counter_id
+
+    async def create_many(self, names):
+        if not names:
+            return []
+        counter = await self.counters.find_one_and_update(
+            {"_id": self.counter_id},
+            {"$inc": {"seq": len(names)}},
+            upsert=True,
+            return_document=self._return_after
+        )
+        first_id = counter["seq"] - len(names) + 1
+        created_at = datetime.utcnow()
+        documents = [
+            {"_id": first_id + offset, "name": name, "created_at": created_at}
+            for offset, name in enumerate(names)
+        ]
+        await self.students.insert_many(documents, ordered=False)
+        return [self._to_record(document) for document in documents]
+
+    async def get_many(self, student_ids):
+        if not student_ids:
+            return []
+        by_id = {
+            document["_id"]: self._to_record(document)
+            async for document in self.students.find({"_id": {"$in": list(student_ids)}})
+        }
+        return [by_id[student_id] for student_id in student_ids if student_id in by_id]
+
+    async def update(self, student_id, name):
+        document = await self.students.find_one_and_update(
+            {"_id": student_id},
+            {"$set": {"name": name}},
+            return_document=self._return_after
+        )
+        return self._to_record(document) if document else None
+
+    async def delete(self, student_id):
+        result = await self.students.delete_one({"_id": student_id})
+        return result.deleted_count > 0
+
+    async def list(self, limit=50, after_id=None):
+        cursor = self.students.find({"_id": {"$gt": after_id or 0}}).sort("_id", 1).limit(min(limit, MAX_PAGE_SIZE))
+        return [self._to_record(document) async for document in cursor]
+
+    @staticmethod
+    def _to_record(document: Dict[str, Any]) -> Dict[str, Any]:
+        return {"id": document["_id"], "name": document["name"], "created_at": document["created_at"]}
+
+def create_student_store(backend: str = "sqlite", **kwargs) -> StudentStore:
+    """Build a student store by backend name ("sqlite" or "mongo")"""
+    if backend == "sqlite":
+        return SQLiteStudentStore(**kwargs)
+    if backend == "mongo":
+        return MongoStudentStore(**kwargs)
+    raise ValueError(f"Unknown student store backend: {backend}")
@@ -1,12 +1,37 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from .db.connection import MongoDB
-from .routes import users, courses, assessments
+from .routes import users
+from .api import websockets
+from .api.routes import agent_routes
 from .config.settings import get_settings
-#     CORSMiddleware,
-#     allow_origins=["http://localhost:5173"],
-#     allow_credentials=True,
-#     allow_methods=["*"],
-#     allow_headers=["*"],
-# )
-# ...existing code...
+from .metrics import instrument_app
+from .auth.firebase import warm_up_firebase
+from .crewai.orchestrator.runtime import create_orchestrator, set_orchestrator, shutdown_orchestrator
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Clients are created here, once per worker, instead of when modules are imported
+    await MongoDB.connect_to_database(app)
+    await warm_up_firebase()
+    set_orchestrator(create_orchestrator())
+    yield
+    await shutdown_orchestrator()
+    await MongoDB.close_database_connection(app)
+
+app = FastAPI(lifespan=lifespan)
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["http://localhost:5173"],
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+app.include_router(users.router, prefix="/users", tags=["users"])
+app.include_router(agent_routes.router, tags=["tasks"])
+app.include_router(websockets.router, tags=["tasks"])
+
+instrument_app(app)
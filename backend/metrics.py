@@ -0,0 +1,142 @@
+"""
+In-process request metrics exposed in Prometheus text format.
+
+Counters are plain Python numbers updated on the event loop, so recording a
+request costs a bisect and a few additions; gauges that describe other
+components (WebSocket connections, orchestrator queue depth) are read from
+callbacks only when /metrics is scraped.
+"""
+from typing import Callable, Dict, List, Tuple
+from bisect import bisect_left
+import time
+
+from fastapi import Depends
+from fastapi.security import HTTPBearer
+from starlette.responses import Response
+
+# Seconds; the upper buckets cover LLM-backed routes such as /chat
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+# Label used for requests that matched no route, so 404 scans cannot blow up cardinality
+UNMATCHED_ROUTE = "<unmatched>"
+
+class Histogram:
+    """Fixed-bucket histogram; counts are per bucket and summed cumulatively at render time"""
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = buckets
+        # One extra slot for observations above the last bound (+Inf)
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+class MetricsRegistry:
+    def __init__(self, latency_buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        self.latency_buckets = latency_buckets
+        # (method, route, status) -> Histogram
+        self.request_latency: Dict[Tuple[str, str, str], Histogram] = {}
+        # method -> requests currently being served; the route is only known once routing has run
+        self.in_flight: Dict[str, int] = {}
+        # name -> (help text, callback)
+        self.gauges: Dict[str, Tuple[str, Callable[[], float]]] = {}
+
+    def register_gauge(self, name: str, help_text: str, read: Callable[[], float]):
+        """Register a gauge read at scrape time; registering a name again replaces its callback"""
+        self.gauges[name] = (help_text, read)
+
+    def request_started(self, method: str):
+        self.in_flight[method] = self.in_flight.get(method, 0) + 1
+
+    def request_finished(self, method: str, route: str, status: int, duration: float):
+        self.in_flight[method] -= 1
+        histogram_key = (method, route, str(status))
+        histogram = self.request_latency.get(histogram_key)
+        if histogram is None:
+            histogram = self.request_latency[histogram_key] = Histogram(self.latency_buckets)
+        histogram.observe(duration)
+
+    def render(self) -> str:
+        lines: List[str] = [
+            "# HELP http_request_duration_seconds Request latency by route template and status",
+            "# TYPE http_request_duration_seconds histogram"
+        ]
+        for (method, route, status), histogram in sorted(self.request_latency.items()):
+            labels = f'method="{method}",route="{_escape(route)}",status="{status}"'
+            cumulative = 0
+            for bound, count in zip(histogram.buckets, histogram.counts):
+                cumulative += count
+                lines.append(f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {histogram.count}')
+            lines.append(f"http_request_duration_seconds_sum{{{labels}}} {histogram.sum}")
+            lines.append(f"http_request_duration_seconds_count{{{labels}}} {histogram.count}")
+
+        lines.append("# HELP http_requests_in_flight Requests currently being served")
+        lines.append("# TYPE http_requests_in_flight gauge")
+        for method, value in sorted(self.in_flight.items()):
+            lines.append(f'http_requests_in_flight{{method="{method}"}} {value}')
+
+        for name, (help_text, read) in sorted(self.gauges.items()):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"{name} {read()}")
+        return "\n".join(lines) + "\n"
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+metrics = MetricsRegistry()
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware recording latency per route template and in-flight counts per method.
+    Requests are labelled by the matched route (e.g. /students/{student_id}), never the raw path.
+    """
+    def __init__(self, app, registry: MetricsRegistry = metrics):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+        start = time.perf_counter()
+        self.registry.request_started(method)
+
+        async def send_and_record(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_and_record)
+        finally:
+            # The router stores the matched route in the shared scope
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            self.registry.request_finished(method, route, status, time.perf_counter() - start)
+
+def instrument_app(app, registry: MetricsRegistry = metrics):
+    """
+    Add the metrics middleware and a /metrics route to a FastAPI app.
+    Like /chat/metrics, the route requires a bearer credential; scrapers send one via bearer_token.
+    """
+    async def serve_metrics() -> Response:
+        return Response(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+    app.add_middleware(MetricsMiddleware, registry=registry)
+    app.add_api_route(
+        "/metrics",
+        serve_metrics,
+        methods=["GET"],
+        include_in_schema=False,
+        dependencies=[Depends(HTTPBearer())]
+    )
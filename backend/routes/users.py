@@ -1,5 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from typing import List, Optional, Dict, Any
+from datetime import datetime
+from bson import ObjectId
+import json
 
 from ..auth.jwt_handler import get_current_user, get_admin_user
 from ..models.user import UserModel
@@ -7,7 +12,6 @@ from ..db.repositories.user_repository import UserRepository
 from ..schemas.user import (
     UserCreate, 
     UserUpdate, 
-    UserResponse, 
     UserWithLearningStyleResponse
 )
 
@@ -15,7 +19,10 @@ router = APIRouter()
 
 @router.get("/me", response_model=UserWithLearningStyleResponse)
 async def get_current_user_profile(current_user: UserModel = Depends(get_current_user)):
-    """Get the current logged-in user's profile."""
+    """
+    Get the current logged-in user's profile, creating it on first sign-in.
+    Repeated or concurrent first sign-ins return the same stored user rather than an error.
+    """
     return current_user
 
 @router.put("/me", response_model=UserWithLearningStyleResponse)
@@ -34,14 +41,88 @@ async def update_current_user_profile(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User update failed"
         )
-        
+    
     return updated_user
 
-@router.get("/", response_model=List[UserResponse])
-async def get_all_users(admin_user: UserModel = Depends(get_admin_user)):
-    """Get all users (admin only)."""
-    db = get_database()
-    users = []
-    async for user in db.users.find():
-        users.append(UserModel(**user))
-    return users
\ No newline at end of file
+# Fields an admin listing may return; anything else on the document stays server-side
+USER_LIST_FIELDS = (
+    "firebase_uid", "email", "display_name", "bio", "avatar_url",
+    "learning_style", "role", "created_at", "updated_at"
+)
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+class UserListItem(BaseModel):
+    """A user as listed to admins; only the requested fields are set"""
+    id: str
+    firebase_uid: Optional[str] = None
+    email: Optional[str] = None
+    display_name: Optional[str] = None
+    bio: Optional[str] = None
+    avatar_url: Optional[str] = None
+    learning_style: Optional[Dict[str, float]] = None
+    role: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+class UserPage(BaseModel):
+    items: List[UserListItem]
+    next_after: Optional[str] = None
+
+def _serialize_user(user: Dict[str, Any]) -> Dict[str, Any]:
+    user["id"] = str(user.pop("_id"))
+    return user
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+def _parse_fields(fields: Optional[str]) -> List[str]:
+    if not fields:
+        return list(USER_LIST_FIELDS)
+    requested = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = [field for field in requested if field not in USER_LIST_FIELDS]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}"
+        )
+    return requested
+
+@router.get("/", response_model=UserPage, response_model_exclude_unset=True)
+async def get_all_users(
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None, description="Return users after this id (the previous page's next_after)"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return"),
+    stream: bool = Query(False, description="Stream every matching user as NDJSON instead of one page"),
+    admin_user: UserModel = Depends(get_admin_user)
+):
+    """
+    List users in `_id` order (admin only).
+    Returns one page with a `next_after` cursor, or with `stream=true` an NDJSON export.
+    """
+    if after and not ObjectId.is_valid(after):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+    projection = _parse_fields(fields)
+    
+    if stream:
+        # Unbounded unless a limit is given; documents are encoded as the cursor yields them
+        cursor = UserRepository.find_users(after, projection, limit)
+        
+        async def export_users():
+            async for user in cursor:
+                yield json.dumps(_serialize_user(user), default=_json_default) + "\n"
+        
+        return StreamingResponse(export_users(), media_type="application/x-ndjson")
+    
+    page_size = limit or DEFAULT_PAGE_SIZE
+    cursor = UserRepository.find_users(after, projection, page_size, batch_size=page_size)
+    users = [_serialize_user(user) async for user in cursor]
+    return {
+        "items": users,
+        "next_after": users[-1]["id"] if len(users) == page_size else None
+    }
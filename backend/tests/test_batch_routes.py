@@ -0,0 +1,130 @@
+import pytest
+from bson import ObjectId
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pymongo.errors import BulkWriteError
+from ..api.dependencies import get_current_user
+from ..api.routes import user_routes
+from ..db.repositories import curriculum_repository, learning_style_repository, user_repository
+
+CURRICULUM = {
+    "title": "Fractions",
+    "subject": "math",
+    "grade_level": "4",
+    "learning_style": "visual",
+    "modules": []
+}
+
+def insert_many_failing_at(*failures):
+    """insert_many stand-in that assigns ids like the driver, then fails the given indexes"""
+    async def insert_many(documents, ordered=True):
+        for document in documents:
+            document.setdefault("_id", ObjectId())
+        if failures:
+            raise BulkWriteError({"writeErrors": [{"index": index, "errmsg": message} for index, message in failures]})
+    return AsyncMock(side_effect=insert_many)
+
+@pytest.fixture
+def db():
+    database = MagicMock()
+    database.learning_styles.insert_many = insert_many_failing_at()
+    database.curriculums.insert_many = insert_many_failing_at()
+    database.users.bulk_write = AsyncMock()
+    database.users.find_one = AsyncMock(return_value={"firebase_uid": "uid-1", "email": "student@example.com", "display_name": "Student", "role": "student"})
+    with patch.object(learning_style_repository, "get_database", return_value=database), \
+            patch.object(curriculum_repository, "get_database", return_value=database), \
+            patch.object(user_repository, "get_database", return_value=database):
+        yield database
+
+@pytest.fixture
+def client(db):
+    app = FastAPI()
+    app.include_router(user_routes.router)
+    app.dependency_overrides[get_current_user] = lambda: {"uid": "uid-1", "email": "student@example.com"}
+    return TestClient(app)
+
+def test_learning_style_batch_reports_each_item(client, db):
+    db.learning_styles.insert_many = insert_many_failing_at((1, "duplicate key"))
+    items = [
+        {"user_id": "uid-1", "style": "visual"},
+        {"user_id": "uid-2", "style": "auditory"},
+        {"user_id": "uid-1", "style": "reading"},
+        {"user_id": "uid-1", "style": "kinesthetic"}
+    ]
+
+    response = client.post("/learning-styles/batch", json={"items": items}).json()
+
+    # Another user's item never reaches the database; the insert saw three documents
+    stored = db.learning_styles.insert_many.call_args.args[0]
+    assert [document["style"] for document in stored] == ["visual", "reading", "kinesthetic"]
+    assert response["inserted"] == 2
+    assert response["failed"] == 2
+    assert response["results"] == [
+        {"index": 0, "id": str(stored[0]["_id"])},
+        {"index": 1, "error": "Not authorized to update this profile"},
+        {"index": 2, "error": "duplicate key"},
+        {"index": 3, "id": str(stored[2]["_id"])}
+    ]
+
+    # One profile update per user, pointing at their last stored result
+    [operation] = db.users.bulk_write.call_args.args[0]
+    assert operation._filter == {"firebase_uid": "uid-1"}
+    assert operation._doc["$set"]["learning_style"] == "kinesthetic"
+    assert operation._doc["$set"]["learning_style_id"] == stored[2]["_id"]
+
+def test_learning_style_batch_reports_profile_update_failures(client, db):
+    db.users.bulk_write.side_effect = BulkWriteError({"writeErrors": [{"index": 0, "errmsg": "profile locked"}]})
+
+    response = client.post("/learning-styles/batch", json={"items": [{"user_id": "uid-1", "style": "visual"}]}).json()
+
+    assert response["inserted"] == 1
+    assert response["results"][0]["profile_error"] == "profile locked"
+
+def test_curriculum_batch_reports_partial_failure(client, db):
+    db.curriculums.insert_many = insert_many_failing_at((0, "document too large"))
+    items = [{**CURRICULUM, "user_id": "uid-1"}, {**CURRICULUM, "user_id": "uid-1", "title": "Decimals"}]
+
+    response = client.post("/curriculums/batch", json={"items": items}).json()
+
+    stored = db.curriculums.insert_many.call_args.args[0]
+    assert response == {
+        "inserted": 1,
+        "failed": 1,
+        "results": [
+            {"index": 0, "error": "document too large"},
+            {"index": 1, "id": str(stored[1]["_id"])}
+        ]
+    }
+
+def test_token_claims_do_not_allow_writing_for_other_users(client):
+    client.app.dependency_overrides[get_current_user] = lambda: {"uid": "uid-1", "admin": True}
+
+    response = client.post("/curriculums/batch", json={"items": [{**CURRICULUM, "user_id": "uid-2"}]}).json()
+
+    assert response["failed"] == 1
+    assert response["results"] == [{"index": 0, "error": "Not authorized to update this profile"}]
+
+def test_admin_role_can_import_for_a_class(client, db):
+    db.users.find_one.return_value = {"firebase_uid": "uid-1", "email": "teacher@example.com", "display_name": "Teacher", "role": "admin"}
+    items = [{"user_id": "uid-2", "style": "visual"}, {"user_id": "uid-3", "style": "auditory"}]
+
+    response = client.post("/learning-styles/batch", json={"items": items}).json()
+
+    db.users.find_one.assert_awaited_once_with({"firebase_uid": "uid-1"})
+    assert response["inserted"] == 2
+    assert response["failed"] == 0
+    profiles = [operation._filter for operation in db.users.bulk_write.call_args.args[0]]
+    assert profiles == [{"firebase_uid": "uid-2"}, {"firebase_uid": "uid-3"}]
+
+def test_own_items_skip_the_role_lookup(client, db):
+    client.post("/learning-styles/batch", json={"items": [{"user_id": "uid-1", "style": "visual"}]})
+
+    db.users.find_one.assert_not_called()
+
+@pytest.mark.parametrize("count", [0, user_routes.BATCH_LIMIT + 1])
+def test_batch_size_is_bounded(client, db, count):
+    items = [{"user_id": "uid-1", "style": "visual"}] * count
+
+    assert client.post("/learning-styles/batch", json={"items": items}).status_code == 400
+    db.learning_styles.insert_many.assert_not_called()
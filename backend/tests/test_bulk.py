@@ -0,0 +1,43 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from pymongo.errors import BulkWriteError
+from ..db.repositories.bulk import insert_many_unordered, bulk_write_unordered
+
+def write_errors(*errors):
+    return BulkWriteError({"writeErrors": [{"index": index, "errmsg": message} for index, message in errors]})
+
+@pytest.fixture
+def collection():
+    collection = MagicMock()
+    collection.insert_many = AsyncMock()
+    collection.bulk_write = AsyncMock()
+    return collection
+
+@pytest.mark.asyncio
+async def test_insert_many_unordered_writes_everything_in_one_call(collection):
+    documents = [{"n": 1}, {"n": 2}]
+
+    assert await insert_many_unordered(collection, documents) == {}
+    collection.insert_many.assert_awaited_once_with(documents, ordered=False)
+
+@pytest.mark.asyncio
+async def test_insert_many_unordered_reports_failures_by_input_index(collection):
+    collection.insert_many.side_effect = write_errors((0, "duplicate key"), (2, "document too large"))
+
+    errors = await insert_many_unordered(collection, [{"n": 1}, {"n": 2}, {"n": 3}])
+
+    assert errors == {0: "duplicate key", 2: "document too large"}
+
+@pytest.mark.asyncio
+async def test_bulk_write_unordered_reports_failures_by_operation_index(collection):
+    collection.bulk_write.side_effect = write_errors((1, "invalid update"))
+
+    assert await bulk_write_unordered(collection, ["first", "second"]) == {1: "invalid update"}
+    collection.bulk_write.assert_awaited_once_with(["first", "second"], ordered=False)
+
+@pytest.mark.asyncio
+async def test_empty_batches_skip_the_round_trip(collection):
+    assert await insert_many_unordered(collection, []) == {}
+    assert await bulk_write_unordered(collection, []) == {}
+    collection.insert_many.assert_not_called()
+    collection.bulk_write.assert_not_called()
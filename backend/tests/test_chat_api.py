@@ -0,0 +1,126 @@
+import openai
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from fastapi.testclient import TestClient
+from .. import chat_api
+
+AUTH = {"Authorization": "Bearer test-token"}
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setenv("STUDENT_DB_PATH", str(tmp_path / "students.db"))
+    # TrustedHostMiddleware rejects the default "testserver" host
+    with TestClient(chat_api.app, base_url="http://localhost") as client:
+        yield client
+
+def chunk(content=None, usage=None):
+    choices = [SimpleNamespace(delta=SimpleNamespace(content=content))] if content is not None else []
+    return SimpleNamespace(choices=choices, usage=usage and SimpleNamespace(model_dump=lambda: usage))
+
+async def stream_of(*chunks, error=None):
+    for item in chunks:
+        yield item
+    if error is not None:
+        raise error
+
+@pytest.fixture
+def completions(client, monkeypatch):
+    """Stand-in for the Azure client's chat.completions, installed after the lifespan ran"""
+    monkeypatch.setattr(chat_api, "AZURE_OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(chat_api, "chat_metrics", chat_api.ChatLatencyMetrics())
+    monkeypatch.setattr(chat_api, "chat_cache", chat_api.InMemoryResponseCache())
+    completions = SimpleNamespace(create=AsyncMock())
+    monkeypatch.setattr(chat_api.app.state, "openai_client", SimpleNamespace(chat=SimpleNamespace(completions=completions)))
+    return completions
+
+def test_lifespan_owns_clients_and_student_store(tmp_path, monkeypatch):
+    monkeypatch.setenv("STUDENT_DB_PATH", str(tmp_path / "students.db"))
+    assert not (tmp_path / "students.db").exists()
+
+    with TestClient(chat_api.app, base_url="http://localhost"):
+        http_client = chat_api.app.state.http_client
+        assert not http_client.is_closed
+        assert chat_api.app.state.student_store.db_path == str(tmp_path / "students.db")
+
+    assert http_client.is_closed
+
+def test_student_routes_use_the_lifespan_store(client):
+    created = client.post("/students/batch", json={"students": [{"name": "Ada"}, {"name": "Grace"}]}).json()
+
+    assert client.get(f"/students/{created[1]['id']}").json()["name"] == "Grace"
+    page = client.get("/students", params={"limit": 1}).json()
+    assert [student["name"] for student in page["items"]] == ["Ada"]
+    assert page["next_after"] == created[0]["id"]
+
+def test_chat_streams_deltas_as_server_sent_events(client, completions):
+    # The empty chunk stands in for an Azure content-filter chunk
+    completions.create.return_value = stream_of(chunk("Hel"), chunk(), chunk("lo"))
+
+    response = client.post("/chat", json={"messages": [{"role": "user", "content": "Hi"}], "stream": True}, headers=AUTH)
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.text == 'data: {"delta": "Hel"}\n\ndata: {"delta": "lo"}\n\ndata: [DONE]\n\n'
+    assert completions.create.call_args.kwargs["stream"] is True
+    snapshot = chat_api.chat_metrics.snapshot()
+    assert snapshot["requests"] == 1
+    assert snapshot["errors"] == 0
+    assert 0 < snapshot["max_time_to_first_token_seconds"] <= snapshot["max_latency_seconds"]
+
+def test_chat_stream_reports_openai_errors_in_band(client, completions):
+    completions.create.return_value = stream_of(chunk("Hel"), error=openai.OpenAIError("upstream reset"))
+
+    response = client.post("/chat", json={"messages": [{"role": "user", "content": "Hi"}], "stream": True}, headers=AUTH)
+
+    assert response.text == 'data: {"delta": "Hel"}\n\ndata: {"error": "Service temporarily unavailable"}\n\n'
+    snapshot = chat_api.chat_metrics.snapshot()
+    assert snapshot["requests"] == 1
+    assert snapshot["errors"] == 1
+
+def test_chat_without_streaming_records_latency(client, completions):
+    completions.create.return_value = SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content="Hello"))],
+        usage=None
+    )
+
+    response = client.post("/chat", json={"messages": [{"role": "user", "content": "Hi"}]}, headers=AUTH)
+
+    assert response.json() == {"response": "Hello", "usage": None}
+    metrics = client.get("/chat/metrics", headers=AUTH).json()
+    assert metrics["requests"] == 1
+    assert metrics["avg_time_to_first_token_seconds"] == metrics["avg_latency_seconds"]
+
+def test_chat_metrics_require_credentials(client):
+    assert client.get("/chat/metrics").status_code in (401, 403)
+    assert client.get("/chat/metrics", headers=AUTH).status_code == 200
+
+def test_response_cache_is_abstract():
+    with pytest.raises(TypeError):
+        chat_api.ResponseCache()
+
+def test_chat_cache_key_is_partitioned_by_system_prompt():
+    messages = [{"role": "system", "content": "You are a tutor"}, {"role": "user", "content": "Hi"}]
+    other_prompt = [{"role": "system", "content": "You are a grader"}, {"role": "user", "content": "Hi"}]
+
+    assert chat_api.chat_cache_key(messages) == chat_api.chat_cache_key([dict(message) for message in messages])
+    assert chat_api.chat_cache_key(messages) != chat_api.chat_cache_key(other_prompt)
+
+def test_streamed_chat_is_cached_with_its_usage(client, completions):
+    usage = {"prompt_tokens": 5, "completion_tokens": 2, "total_tokens": 7}
+    completions.create.return_value = stream_of(chunk("Hel"), chunk("lo"), chunk(usage=usage))
+    request = {"messages": [{"role": "user", "content": "Hi"}], "stream": True, "cache": True}
+
+    client.post("/chat", json=request, headers=AUTH)
+    hit = client.post("/chat", json=request, headers=AUTH)
+
+    assert completions.create.call_count == 1
+    assert completions.create.call_args.kwargs["stream_options"] == {"include_usage": True}
+    assert hit.headers["X-Chat-Cache"] == "hit"
+    assert hit.text == 'data: {"delta": "Hello"}\n\ndata: [DONE]\n\n'
+    assert chat_api.chat_cache.stats()["tokens_saved"] == 7
+
+    # The key is the canonical payload, not the unverified bearer token
+    other = client.post("/chat", json=request, headers={"Authorization": "Bearer other-token"})
+
+    assert completions.create.call_count == 1
+    assert other.headers["X-Chat-Cache"] == "hit"
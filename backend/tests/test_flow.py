@@ -0,0 +1,53 @@
+import asyncio
+import pytest
+from ..crewai.orchestrator.flow import TaskFlow, FlowStage
+
+@pytest.mark.asyncio
+async def test_flow_runs_independent_stages_concurrently():
+    started = []
+    
+    async def slow(name):
+        started.append(name)
+        await asyncio.sleep(0.05)
+        return name
+    
+    flow = TaskFlow([
+        FlowStage("a", lambda outputs: slow("a")),
+        FlowStage("b", lambda outputs: slow("b")),
+        FlowStage("c", lambda outputs: slow(outputs["a"] + outputs["b"]), depends_on=("a", "b"))
+    ])
+    
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    outputs = await flow.run({"subject": "math"})
+    elapsed = loop.time() - start
+    
+    assert outputs["c"] == "ab"
+    assert outputs["input"] == {"subject": "math"}
+    assert started[:2] == ["a", "b"]
+    assert elapsed < 0.14  # Two levels of 50ms, not three
+
+@pytest.mark.asyncio
+async def test_flow_propagates_stage_errors():
+    async def fail(outputs):
+        raise RuntimeError("research failed")
+    
+    async def never(outputs):
+        raise AssertionError("dependent stage should not run")
+    
+    flow = TaskFlow([
+        FlowStage("research", fail),
+        FlowStage("teacher", never, depends_on=("research",))
+    ])
+    
+    with pytest.raises(RuntimeError):
+        await flow.run({})
+
+def test_flow_rejects_cycles_and_unknown_dependencies():
+    async def noop(outputs):
+        return None
+    
+    with pytest.raises(ValueError):
+        TaskFlow([FlowStage("a", noop, depends_on=("b",)), FlowStage("b", noop, depends_on=("a",))])
+    with pytest.raises(ValueError):
+        TaskFlow([FlowStage("a", noop, depends_on=("missing",))])
@@ -0,0 +1,62 @@
+import asyncio
+import pytest
+from ..crewai.orchestrator.job_queue import TaskJobQueue, QueueFullError
+
+@pytest.mark.asyncio
+async def test_job_queue_limits_concurrency():
+    job_queue = TaskJobQueue(worker_count=2, max_queue_size=10, per_user_limit=10)
+    release = asyncio.Event()
+    running = []
+    peak = 0
+    
+    async def job():
+        nonlocal peak
+        running.append(1)
+        peak = max(peak, len(running))
+        await release.wait()
+        running.pop()
+    
+    for i in range(5):
+        job_queue.submit(f"task-{i}", "user-1", job)
+    await asyncio.sleep(0.01)
+    
+    assert peak == 2
+    assert job_queue.stats()["running"] == 2
+    assert job_queue.stats()["queue_depth"] == 3
+    
+    release.set()
+    await asyncio.sleep(0.01)
+    assert job_queue.stats()["completed"] == 5
+    await job_queue.stop()
+
+@pytest.mark.asyncio
+async def test_job_queue_rejects_when_full():
+    job_queue = TaskJobQueue(worker_count=1, max_queue_size=1, per_user_limit=10)
+    release = asyncio.Event()
+    
+    assert job_queue.submit("task-1", "user-1", release.wait) == 1
+    await asyncio.sleep(0)  # Worker takes the first job
+    assert job_queue.submit("task-2", "user-2", release.wait) == 1
+    
+    with pytest.raises(QueueFullError):
+        job_queue.submit("task-3", "user-3", release.wait)
+    assert job_queue.stats()["rejected"] == 1
+    
+    release.set()
+    await job_queue.stop()
+
+@pytest.mark.asyncio
+async def test_job_queue_per_user_cap():
+    job_queue = TaskJobQueue(worker_count=1, max_queue_size=10, per_user_limit=1)
+    release = asyncio.Event()
+    
+    job_queue.submit("task-1", "user-1", release.wait)
+    with pytest.raises(QueueFullError):
+        job_queue.submit("task-2", "user-1", release.wait)
+    
+    # Other users are unaffected, and the cap frees up once the job finishes
+    job_queue.submit("task-3", "user-2", release.wait)
+    release.set()
+    await asyncio.sleep(0.01)
+    job_queue.submit("task-4", "user-1", release.wait)
+    await job_queue.stop()
@@ -0,0 +1,72 @@
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from ..metrics import MetricsRegistry, Histogram, instrument_app
+
+AUTH = {"Authorization": "Bearer scrape-token"}
+
+def build_client(registry: MetricsRegistry) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/students/{student_id}")
+    async def get_student(student_id: int):
+        if student_id == 0:
+            raise HTTPException(status_code=404, detail="Student not found")
+        return {"id": student_id}
+
+    instrument_app(app, registry)
+    return TestClient(app)
+
+def test_histogram_buckets_are_cumulative_in_output():
+    registry = MetricsRegistry(latency_buckets=(0.1, 1.0))
+    registry.request_started("GET")
+    registry.request_finished("GET", "/a", 200, 0.05)
+    registry.request_started("GET")
+    registry.request_finished("GET", "/a", 200, 0.5)
+    registry.request_started("GET")
+    registry.request_finished("GET", "/a", 200, 5.0)
+
+    output = registry.render()
+    assert 'http_request_duration_seconds_bucket{method="GET",route="/a",status="200",le="0.1"} 1' in output
+    assert 'http_request_duration_seconds_bucket{method="GET",route="/a",status="200",le="1.0"} 2' in output
+    assert 'http_request_duration_seconds_bucket{method="GET",route="/a",status="200",le="+Inf"} 3' in output
+    assert 'http_request_duration_seconds_count{method="GET",route="/a",status="200"} 3' in output
+    assert 'http_requests_in_flight{method="GET"} 0' in output
+
+def test_histogram_observe_places_bound_in_its_own_bucket():
+    histogram = Histogram((0.1, 1.0))
+    histogram.observe(0.1)
+    histogram.observe(2.0)
+    assert histogram.counts == [1, 0, 1]
+
+def test_requests_are_labelled_by_route_template():
+    registry = MetricsRegistry()
+    client = build_client(registry)
+
+    client.get("/students/1")
+    client.get("/students/2")
+    client.get("/students/0")
+    client.get("/nowhere")
+
+    output = client.get("/metrics", headers=AUTH).text
+    assert 'http_request_duration_seconds_count{method="GET",route="/students/{student_id}",status="200"} 2' in output
+    assert 'http_request_duration_seconds_count{method="GET",route="/students/{student_id}",status="404"} 1' in output
+    assert 'route="<unmatched>",status="404"} 1' in output
+    assert "/students/1" not in output
+
+def test_registered_gauges_are_read_at_scrape_time():
+    registry = MetricsRegistry()
+    depth = {"value": 3}
+    registry.register_gauge("orchestrator_queue_depth", "Queued tasks", lambda: depth["value"])
+    client = build_client(registry)
+
+    assert "orchestrator_queue_depth 3" in client.get("/metrics", headers=AUTH).text
+    depth["value"] = 7
+    response = client.get("/metrics", headers=AUTH)
+    assert "orchestrator_queue_depth 7" in response.text
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+
+def test_metrics_require_credentials():
+    client = build_client(MetricsRegistry())
+
+    assert client.get("/metrics").status_code in (401, 403)
+    assert client.get("/metrics", headers=AUTH).status_code == 200
@@ -0,0 +1,40 @@
+import pytest
+from types import SimpleNamespace
+from ..crewai.orchestrator import runtime
+from ..metrics import metrics
+
+class FakeOrchestrator:
+    def __init__(self, queue_depth=0, running=0):
+        self.shutdowns = 0
+        stats = {"queue_depth": queue_depth, "running": running}
+        self.job_queue = SimpleNamespace(stats=lambda: stats)
+
+    async def shutdown(self):
+        self.shutdowns += 1
+
+@pytest.mark.asyncio
+async def test_shutdown_orchestrator_stops_and_unbinds_the_active_orchestrator():
+    orchestrator = FakeOrchestrator()
+    runtime.set_orchestrator(orchestrator)
+    assert runtime.get_orchestrator() is orchestrator
+
+    await runtime.shutdown_orchestrator()
+    await runtime.shutdown_orchestrator()
+
+    assert orchestrator.shutdowns == 1
+    assert runtime.get_orchestrator() is None
+
+@pytest.mark.asyncio
+async def test_queue_gauges_follow_the_active_orchestrator():
+    assert "orchestrator_queue_depth 0" in metrics.render()
+
+    runtime.set_orchestrator(FakeOrchestrator(queue_depth=4, running=2))
+    output = metrics.render()
+    assert "orchestrator_queue_depth 4" in output
+    assert "orchestrator_jobs_running 2" in output
+
+    runtime.set_orchestrator(FakeOrchestrator(queue_depth=1))
+    assert "orchestrator_queue_depth 1" in metrics.render()
+
+    await runtime.shutdown_orchestrator()
+    assert "orchestrator_jobs_running 0" in metrics.render()
@@ -0,0 +1,70 @@
+import pytest
+from ..db.student_store import StudentStore, SQLiteStudentStore, create_student_store
+
+@pytest.fixture
+def student_store(tmp_path):
+    return SQLiteStudentStore(db_path=str(tmp_path / "students.db"))
+
+@pytest.mark.asyncio
+async def test_student_store_batch_create_and_get(student_store):
+    created = await student_store.create_many(["Ada", "Grace", "Alan"])
+
+    assert [student["name"] for student in created] == ["Ada", "Grace", "Alan"]
+    assert len({student["id"] for student in created}) == 3
+
+    ids = [created[2]["id"], 999, created[0]["id"]]
+    found = await student_store.get_many(ids)
+
+    assert [student["name"] for student in found] == ["Alan", "Ada"]
+
+@pytest.mark.asyncio
+async def test_student_store_ids_unique_across_connections(tmp_path):
+    # Two stores on one file stand in for two worker processes
+    path = str(tmp_path / "students.db")
+    first = SQLiteStudentStore(db_path=path)
+    second = SQLiteStudentStore(db_path=path)
+
+    a = await first.create("Ada")
+    b = await second.create("Grace")
+    await first.delete(b["id"])
+    c = await second.create("Alan")
+
+    assert len({a["id"], b["id"], c["id"]}) == 3
+    assert (await first.get(c["id"]))["name"] == "Alan"
+
+@pytest.mark.asyncio
+async def test_student_store_update_and_delete(student_store):
+    student = await student_store.create("Ada")
+
+    updated = await student_store.update(student["id"], "Ada Lovelace")
+
+    assert updated["name"] == "Ada Lovelace"
+    assert updated["created_at"] == student["created_at"]
+    assert await student_store.delete(student["id"]) is True
+    assert await student_store.delete(student["id"]) is False
+    assert await student_store.update(student["id"], "Nobody") is None
+
+@pytest.mark.asyncio
+async def test_student_store_paginates_by_id(student_store):
+    await student_store.create_many([f"student-{i}" for i in range(5)])
+
+    first_page = await student_store.list(limit=2)
+    second_page = await student_store.list(limit=2, after_id=first_page[-1]["id"])
+    last_page = await student_store.list(limit=2, after_id=second_page[-1]["id"])
+
+    names = [student["name"] for student in first_page + second_page + last_page]
+    assert names == [f"student-{i}" for i in range(5)]
+
+def test_create_student_store_unknown_backend():
+    with pytest.raises(ValueError):
+        create_student_store("redis")
+
+def test_student_store_is_abstract():
+    with pytest.raises(TypeError):
+        StudentStore()
+
+def test_sqlite_student_store_creates_its_directory(tmp_path):
+    path = tmp_path / "data" / "students.db"
+    SQLiteStudentStore(db_path=str(path)).close()
+
+    assert path.exists()
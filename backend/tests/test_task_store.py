@@ -0,0 +1,65 @@
+import pytest
+from types import SimpleNamespace
+from ..crewai.orchestrator import task_store as task_store_module
+from ..crewai.orchestrator.task_store import InMemoryTaskStore, SQLiteTaskStore, TaskStateStore, create_task_store
+
+@pytest.fixture(params=["memory", "sqlite"])
+def task_store(request, tmp_path):
+    if request.param == "memory":
+        return InMemoryTaskStore(ttl_seconds=60)
+    return SQLiteTaskStore(db_path=str(tmp_path / "task_state.db"), ttl_seconds=60)
+
+@pytest.mark.asyncio
+async def test_task_store_keeps_latest_status(task_store):
+    await task_store.set_status("task-1", "in_progress", "Task started")
+    await task_store.set_status("task-1", "completed", "done", result={"title": "Fractions"})
+    
+    record = await task_store.get("task-1")
+    
+    assert record["status"] == "completed"
+    assert record["details"] == "done"
+    assert record["result"] == {"title": "Fractions"}
+
+@pytest.mark.asyncio
+async def test_task_store_unknown_task(task_store):
+    assert await task_store.get("missing") is None
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(task_store_module, "time", SimpleNamespace(time=lambda: fake.now))
+    return fake
+
+@pytest.mark.asyncio
+async def test_task_store_expires_entries(task_store, clock):
+    await task_store.set_status("task-1", "in_progress", "Task started")
+    await task_store.set_status("task-2", "in_progress", "Task started")
+    clock.now = 1030.0
+    await task_store.set_status("task-3", "in_progress", "Task started")
+    
+    clock.now = 1060.0
+    assert await task_store.purge_expired() == 2
+    assert await task_store.purge_expired() == 0
+    assert await task_store.get("task-1") is None
+    assert await task_store.get("task-3") is not None
+    
+    clock.now = 1090.0
+    assert await task_store.purge_expired() == 1
+
+@pytest.mark.asyncio
+async def test_task_store_purge_counts_every_expired_entry(task_store, clock):
+    for index in range(3):
+        await task_store.set_status(f"task-{index}", "in_progress", "Task started")
+    
+    clock.now = 1059.0
+    assert await task_store.purge_expired() == 0
+    clock.now = 1060.0
+    assert await task_store.purge_expired() == 3
+
+def test_task_state_store_is_abstract():
+    with pytest.raises(TypeError):
+        TaskStateStore()
+
+def test_create_task_store_rejects_unknown_backend():
+    with pytest.raises(ValueError):
+        create_task_store("redis")
@@ -0,0 +1,39 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi.testclient import TestClient
+from .. import main
+from ..api.dependencies import get_current_user
+from ..crewai.orchestrator import runtime
+
+def fake_orchestrator():
+    orchestrator = MagicMock()
+    orchestrator.execute_async_task = AsyncMock(return_value={"task_id": "task-1", "status": "queued", "queue_position": 0})
+    orchestrator.shutdown = AsyncMock()
+    orchestrator.job_queue.stats.return_value = {"depth": 0, "running": 0}
+    return orchestrator
+
+def test_tasks_are_served_by_the_orchestrator_bound_at_startup():
+    orchestrator = fake_orchestrator()
+    main.app.dependency_overrides[get_current_user] = lambda: {"uid": "uid-1", "email": "student@example.com"}
+    try:
+        with patch.object(main.MongoDB, "connect_to_database", AsyncMock()), \
+                patch.object(main.MongoDB, "close_database_connection", AsyncMock()), \
+                patch.object(main, "warm_up_firebase", AsyncMock()), \
+                patch.object(main, "create_orchestrator", return_value=orchestrator):
+            with TestClient(main.app) as client:
+                response = client.post("/tasks", json={
+                    "task_type": "curriculum",
+                    "subject": "math",
+                    "grade_level": "4",
+                    "learning_style": "visual"
+                })
+
+                assert response.status_code == 200
+                assert response.json() == {"task_id": "task-1", "status": "queued", "queue_position": 0}
+                task_input = orchestrator.execute_async_task.call_args.args[0]
+                assert task_input["user_id"] == "uid-1"
+    finally:
+        main.app.dependency_overrides.clear()
+
+    # Leaving the lifespan stops the orchestrator and unbinds it
+    orchestrator.shutdown.assert_awaited_once()
+    assert runtime.get_orchestrator() is None
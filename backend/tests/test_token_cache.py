@@ -0,0 +1,52 @@
+import time
+import pytest
+from unittest.mock import patch
+from ..auth import token_cache
+from ..auth.token_cache import TTLCache, verify_firebase_token
+
+@pytest.fixture(autouse=True)
+def empty_token_cache():
+    token_cache.token_cache.clear()
+    yield
+    token_cache.token_cache.clear()
+
+@pytest.mark.asyncio
+async def test_verify_firebase_token_caches_until_expiry():
+    claims = {"uid": "test_user", "exp": time.time() + 3600}
+    
+    with patch.object(token_cache, "verify_id_token", return_value=claims) as mock_verify:
+        assert (await verify_firebase_token("token"))["uid"] == "test_user"
+        assert (await verify_firebase_token("token"))["uid"] == "test_user"
+    
+    mock_verify.assert_called_once_with("token")
+
+@pytest.mark.asyncio
+async def test_verify_firebase_token_rechecks_expired_tokens():
+    claims = {"uid": "test_user", "exp": time.time()}
+    
+    with patch.object(token_cache, "verify_id_token", return_value=claims) as mock_verify:
+        await verify_firebase_token("token")
+        await verify_firebase_token("token")
+    
+    assert mock_verify.call_count == 2
+
+@pytest.mark.asyncio
+async def test_verify_firebase_token_does_not_cache_failures():
+    with patch.object(token_cache, "verify_id_token", side_effect=ValueError("bad token")) as mock_verify:
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                await verify_firebase_token("token")
+    
+    assert mock_verify.call_count == 2
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(max_entries=2)
+    expires_at = time.time() + 60
+    cache.set("a", 1, expires_at)
+    cache.set("b", 2, expires_at)
+    cache.get("a")
+    cache.set("c", 3, expires_at)
+    
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
@@ -0,0 +1,98 @@
+import json
+from datetime import datetime
+import pytest
+from bson import ObjectId
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from ..auth.jwt_handler import get_admin_user
+from ..routes import users
+
+USERS = [
+    {
+        "_id": ObjectId(),
+        "firebase_uid": f"uid-{index}",
+        "email": f"user{index}@example.com",
+        "display_name": f"User {index}",
+        "role": "student",
+        "created_at": datetime(2024, 1, index + 1)
+    }
+    for index in range(5)
+]
+
+class FakeCursor:
+    def __init__(self, documents):
+        self.documents = documents
+
+    async def __aiter__(self):
+        for document in self.documents:
+            yield dict(document)
+
+def find_users(after_id=None, fields=None, limit=None, batch_size=500):
+    documents = [user for user in USERS if after_id is None or user["_id"] > ObjectId(after_id)]
+    if limit:
+        documents = documents[:limit]
+    return FakeCursor([
+        {"_id": user["_id"], **{field: user[field] for field in fields if field in user}}
+        for user in documents
+    ])
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(users.UserRepository, "find_users", staticmethod(find_users))
+    app = FastAPI()
+    app.include_router(users.router, prefix="/users")
+    app.dependency_overrides[get_admin_user] = lambda: None
+    return TestClient(app)
+
+def test_pages_follow_the_next_after_cursor(client):
+    names, after = [], None
+    pages = 0
+    while True:
+        params = {"limit": 2, **({"after": after} if after else {})}
+        page = client.get("/users/", params=params).json()
+        names += [user["display_name"] for user in page["items"]]
+        pages += 1
+        after = page["next_after"]
+        if after is None:
+            break
+
+    assert names == [f"User {index}" for index in range(5)]
+    assert pages == 3
+
+def test_page_returns_only_the_requested_fields(client):
+    page = client.get("/users/", params={"fields": "email", "limit": 2}).json()
+
+    assert page["items"] == [
+        {"id": str(USERS[0]["_id"]), "email": "user0@example.com"},
+        {"id": str(USERS[1]["_id"]), "email": "user1@example.com"}
+    ]
+    assert page["next_after"] == str(USERS[1]["_id"])
+
+def test_last_full_page_is_followed_by_an_empty_one(client):
+    page = client.get("/users/", params={"limit": 5}).json()
+    assert page["next_after"] == str(USERS[4]["_id"])
+
+    page = client.get("/users/", params={"limit": 5, "after": page["next_after"]}).json()
+    assert page == {"items": [], "next_after": None}
+
+@pytest.mark.parametrize("params", [{"after": "not-an-id"}, {"fields": "email,password_hash"}])
+def test_rejects_bad_cursor_and_unknown_fields(client, params):
+    assert client.get("/users/", params=params).status_code == 400
+
+def test_stream_exports_every_user_as_ndjson(client):
+    response = client.get("/users/", params={"stream": "true", "fields": "email,created_at"})
+
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["email"] for line in lines] == [user["email"] for user in USERS]
+    assert lines[0] == {
+        "id": str(USERS[0]["_id"]),
+        "email": "user0@example.com",
+        "created_at": "2024-01-01T00:00:00"
+    }
+
+def test_stream_honours_cursor_and_limit(client):
+    response = client.get("/users/", params={"stream": "true", "after": str(USERS[1]["_id"]), "limit": 2})
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["id"] for line in lines] == [str(USERS[2]["_id"]), str(USERS[3]["_id"])]
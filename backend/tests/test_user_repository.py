@@ -0,0 +1,92 @@
+import time
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from ..db.repositories import user_repository
+from ..db.repositories.user_repository import UserRepository, user_cache
+
+USER = {
+    "firebase_uid": "uid-1",
+    "email": "student@example.com",
+    "display_name": "Student",
+    "role": "student"
+}
+
+@pytest.fixture
+def db():
+    database = MagicMock()
+    database.users.find_one = AsyncMock()
+    database.users.find_one_and_update = AsyncMock()
+    database.users.find_one_and_delete = AsyncMock()
+    database.users.bulk_write = AsyncMock()
+    with patch.object(user_repository, "get_database", return_value=database):
+        yield database
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("firebase_uid", [None, ""])
+async def test_create_user_requires_firebase_uid(db, firebase_uid):
+    with pytest.raises(ValueError):
+        await UserRepository.create_user({**USER, "firebase_uid": firebase_uid})
+    db.users.find_one_and_update.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_create_user_returns_the_existing_user_for_a_known_uid(db):
+    db.users.find_one_and_update.return_value = {**USER, "display_name": "Stored Name"}
+    
+    user = await UserRepository.create_user({**USER, "display_name": "New Name"})
+    
+    # The stored user wins; the new data is only written when the UID is unknown
+    assert user.display_name == "Stored Name"
+    query, update = db.users.find_one_and_update.call_args.args
+    assert query == {"firebase_uid": "uid-1"}
+    assert update == {"$setOnInsert": {"email": "student@example.com", "display_name": "New Name", "role": "student"}}
+    assert db.users.find_one_and_update.call_args.kwargs["upsert"] is True
+
+@pytest.mark.asyncio
+async def test_get_or_create_profile_reads_existing_profiles_without_writing(db):
+    db.users.find_one.return_value = USER
+    
+    assert await UserRepository.get_or_create_profile("uid-1", {"role": "student"}) == USER
+    db.users.find_one_and_update.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_get_or_create_profile_upserts_missing_profiles(db):
+    db.users.find_one.return_value = None
+    db.users.find_one_and_update.return_value = USER
+    
+    assert await UserRepository.get_or_create_profile("uid-1", {"firebase_uid": "other", "role": "student"}) == USER
+    query, update = db.users.find_one_and_update.call_args.args
+    assert query == {"firebase_uid": "uid-1"}
+    assert update == {"$setOnInsert": {"role": "student"}}
+
+@pytest.fixture
+def cached_user():
+    user_cache.set("uid-1", object(), time.time() + 60)
+    yield
+    user_cache.clear()
+
+@pytest.mark.asyncio
+async def test_update_user_invalidates_the_cached_user(db, cached_user):
+    db.users.find_one_and_update.return_value = {**USER, "role": "admin"}
+    
+    await UserRepository.update_user("5f0000000000000000000000", {"role": "admin"})
+    
+    assert user_cache.get("uid-1") is None
+
+@pytest.mark.asyncio
+async def test_update_profile_invalidates_the_cached_user(db, cached_user):
+    await UserRepository.update_profile("uid-1", {"role": "teacher"})
+    
+    assert user_cache.get("uid-1") is None
+
+@pytest.mark.asyncio
+async def test_update_profiles_invalidates_every_cached_user(db, cached_user):
+    await UserRepository.update_profiles({"uid-1": {"role": "teacher"}, "uid-2": {"role": "student"}})
+    
+    assert user_cache.get("uid-1") is None
+
+@pytest.mark.asyncio
+async def test_delete_user_invalidates_the_cached_user(db, cached_user):
+    db.users.find_one_and_delete.return_value = {"_id": "5f0000000000000000000000", "firebase_uid": "uid-1"}
+    
+    assert await UserRepository.delete_user("5f0000000000000000000000") is True
+    assert user_cache.get("uid-1") is None
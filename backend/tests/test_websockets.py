@@ -4,7 +4,9 @@ from fastapi.websockets import WebSocket
 from unittest.mock import AsyncMock, patch, MagicMock
 import pytest
 import json
-from ..api.websockets import router, ConnectionManager, RateLimiter
+import asyncio
+from ..api.websockets import router, ConnectionManager, RateLimiter, TaskSubscriptions, monitor_task_status
+from ..crewai.orchestrator.status_bus import TaskStatusBus
 from datetime import datetime, timedelta
 
 @pytest.fixture
@@ -66,6 +68,138 @@ async def test_rate_limiter():
     # Should be allowed again
     assert rate_limiter.is_allowed(user_id) is True
 
+def test_rate_limiter_evicts_idle_users():
+    rate_limiter = RateLimiter(max_requests=2, window_seconds=1)
+    
+    with patch('time.monotonic', return_value=100.0):
+        assert rate_limiter.is_allowed("idle_user") is True
+        assert rate_limiter.is_allowed("idle_user") is True
+        assert rate_limiter.is_allowed("idle_user") is False
+    
+    with patch('time.monotonic', return_value=102.0):
+        assert rate_limiter.is_allowed("active_user") is True
+    
+    assert "idle_user" not in rate_limiter.buckets
+    assert rate_limiter.stats() == {"tracked_users": 1, "allowed": 3, "throttled": 1}
+
+@pytest.mark.asyncio
+async def test_connection_manager_separate_budgets():
+    manager = ConnectionManager()
+    websocket = AsyncMock(spec=WebSocket)
+    user_id = "test_user"
+    manager.inbound_limiter = RateLimiter(max_requests=1, window_seconds=60)
+    
+    await manager.connect(websocket, user_id)
+    assert manager.inbound_limiter.is_allowed(user_id) is True
+    assert manager.inbound_limiter.is_allowed(user_id) is False
+    
+    # Exhausting the inbound budget does not drop server pushes
+    await manager.send_status_update(user_id, {"type": "task_update"})
+    await asyncio.sleep(0)
+    websocket.send_text.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_exhausted_outbound_budget_still_delivers_final_messages():
+    manager = ConnectionManager()
+    websocket = AsyncMock(spec=WebSocket)
+    user_id = "test_user"
+    manager.outbound_limiter = RateLimiter(max_requests=1, window_seconds=60)
+    await manager.connect(websocket, user_id)
+    
+    messages = [
+        {"type": "task_update", "task_id": "a", "status": {"status": "queued"}},
+        # Over budget: this progress update is skipped
+        {"type": "task_update", "task_id": "a", "status": {"status": "in_progress"}},
+        {"type": "task_update", "task_id": "a", "status": {"status": "completed"}},
+        {"type": "task_result", "task_id": "a", "result": {"title": "Fractions"}}
+    ]
+    for message in messages:
+        await manager.send_status_update(user_id, message)
+    await asyncio.sleep(0.01)
+    
+    sent = [json.loads(call.args[0]) for call in websocket.send_text.call_args_list]
+    assert sent == [messages[0]] + messages[2:]
+    assert manager.outbound_limiter.stats()["throttled"] == 1
+
+@pytest.mark.asyncio
+async def test_send_status_update_isolates_slow_sockets():
+    manager = ConnectionManager(max_queue_size=8, send_timeout=0.05)
+    slow_socket = AsyncMock(spec=WebSocket)
+    fast_socket = AsyncMock(spec=WebSocket)
+    user_id = "test_user"
+    
+    async def stall(text):
+        await asyncio.sleep(1)
+    slow_socket.send_text.side_effect = stall
+    
+    await manager.connect(slow_socket, user_id)
+    await manager.connect(fast_socket, user_id)
+    
+    for i in range(3):
+        await manager.send_status_update(user_id, {"type": "task_update", "seq": i})
+    await asyncio.sleep(0.01)
+    
+    # The fast tab gets every update, serialised once, while the slow one is still stalled
+    assert fast_socket.send_text.call_count == 3
+    fast_socket.send_text.assert_called_with(json.dumps({"type": "task_update", "seq": 2}))
+    assert slow_socket in manager.active_connections[user_id]
+    
+    # The stalled socket times out and is dropped
+    await asyncio.sleep(0.1)
+    assert manager.active_connections[user_id] == [fast_socket]
+    assert slow_socket not in manager.senders
+
+async def connect_blocked_socket(manager, user_id):
+    """Connect a socket whose first send blocks until the returned event is set"""
+    websocket = AsyncMock(spec=WebSocket)
+    release = asyncio.Event()
+    sent = []
+    
+    async def send(text):
+        await release.wait()
+        sent.append(json.loads(text))
+    websocket.send_text.side_effect = send
+    
+    await manager.connect(websocket, user_id)
+    await manager.send_status_update(user_id, {"type": "task_update", "task_id": "a", "seq": 0})
+    await asyncio.sleep(0.01)  # The sender takes it and blocks
+    return websocket, release, sent
+
+@pytest.mark.asyncio
+async def test_full_sender_evicts_only_superseded_task_updates():
+    manager = ConnectionManager(max_queue_size=3)
+    user_id = "test_user"
+    websocket, release, sent = await connect_blocked_socket(manager, user_id)
+    
+    messages = [
+        {"type": "task_update", "task_id": "a", "seq": 1},
+        {"type": "task_result", "task_id": "b", "result": {"title": "Fractions"}},
+        {"type": "task_update", "task_id": "b", "seq": 1},
+        # The queue is full; this supersedes a/1, the only message that can go
+        {"type": "task_update", "task_id": "a", "seq": 2}
+    ]
+    for message in messages:
+        await manager.send_status_update(user_id, message)
+    release.set()
+    await asyncio.sleep(0.01)
+    
+    assert sent == [{"type": "task_update", "task_id": "a", "seq": 0}] + messages[1:]
+    assert manager.senders[websocket].dropped_count == 1
+
+@pytest.mark.asyncio
+async def test_full_sender_drops_connection_rather_than_a_task_result():
+    manager = ConnectionManager(max_queue_size=2)
+    user_id = "test_user"
+    websocket, release, sent = await connect_blocked_socket(manager, user_id)
+    
+    await manager.send_status_update(user_id, {"type": "task_update", "task_id": "a", "seq": 1})
+    await manager.send_status_update(user_id, {"type": "task_result", "task_id": "a", "result": {}})
+    # Nothing pending is superseded, so the result cannot be queued without losing a message
+    await manager.send_status_update(user_id, {"type": "task_result", "task_id": "b", "result": {}})
+    
+    assert websocket not in manager.senders
+    assert user_id not in manager.active_connections
+
 @pytest.mark.asyncio
 async def test_websocket_endpoint_invalid_token():
     websocket = AsyncMock(spec=WebSocket)
@@ -107,32 +241,106 @@ async def test_websocket_endpoint_subscribe_task():
 @pytest.mark.asyncio
 async def test_monitor_task_status():
     orchestrator = MagicMock()
-    user_id = "test_user"
+    orchestrator.status_bus = TaskStatusBus()
     task_id = "test_task"
     
-    # Mock orchestrator responses
-    orchestrator.get_task_status = AsyncMock(side_effect=[
-        {"status": "in_progress"},
-        {"status": "completed"}
-    ])
-    
-    orchestrator.cat_client.memory.recall_memories = AsyncMock(return_value=[
-        {"content": '{"result": "test result"}'}
-    ])
+    # Initial status read, later transitions are pushed through the bus
+    orchestrator.get_task_status = AsyncMock(return_value={"status": "in_progress"})
+    orchestrator.cat_client.memory.recall_memories = AsyncMock()
     
-    # Mock the manager's send_status_update
-    with patch('..api.websockets.manager.send_status_update') as mock_send_update:
-        await monitor_task_status(orchestrator, task_id, user_id)
+    # Mock the fan-out to subscribed connections
+    with patch('..api.websockets.subscriptions.publish') as mock_send_update:
+        monitor = asyncio.create_task(monitor_task_status(orchestrator, task_id))
+        await asyncio.sleep(0)
+        assert orchestrator.status_bus.subscriber_count(task_id) == 1
+        
+        orchestrator.status_bus.publish(task_id, {
+            "status": "completed",
+            "result": {"result": "test result"}
+        })
+        await asyncio.wait_for(monitor, timeout=1)
         
-        # Verify status updates were sent
-        assert mock_send_update.call_count == 2
-        mock_send_update.assert_any_call(user_id, {
+        # Verify status updates were sent without polling the orchestrator again
+        orchestrator.get_task_status.assert_called_once_with(task_id)
+        orchestrator.cat_client.memory.recall_memories.assert_not_called()
+        assert mock_send_update.call_count == 3
+        mock_send_update.assert_any_call(task_id, {
             "type": "task_update",
             "task_id": task_id,
             "status": {"status": "in_progress"}
         })
-        mock_send_update.assert_any_call(user_id, {
+        mock_send_update.assert_any_call(task_id, {
+            "type": "task_update",
+            "task_id": task_id,
+            "status": {"status": "completed"}
+        })
+        mock_send_update.assert_any_call(task_id, {
             "type": "task_result",
             "task_id": task_id,
             "result": {"result": "test result"}
-        })
\ No newline at end of file
+        })
+        assert orchestrator.status_bus.subscriber_count(task_id) == 0
+
+
+@pytest.mark.asyncio
+async def test_task_subscriptions_share_one_watcher():
+    manager = ConnectionManager()
+    subscriptions = TaskSubscriptions(manager)
+    orchestrator = MagicMock()
+    orchestrator.status_bus = TaskStatusBus()
+    orchestrator.get_task_status = AsyncMock(return_value={"status": "in_progress"})
+    tab_one, tab_two, other_user = (AsyncMock(spec=WebSocket) for _ in range(3))
+    task_id = "test_task"
+    
+    await manager.connect(tab_one, "user_1")
+    await manager.connect(tab_two, "user_1")
+    await manager.connect(other_user, "user_2")
+    
+    assert subscriptions.subscribe(orchestrator, task_id, tab_one) is True
+    assert subscriptions.subscribe(orchestrator, task_id, tab_two) is False
+    assert subscriptions.subscribe(orchestrator, task_id, other_user) is False
+    await asyncio.sleep(0.01)
+    
+    # One status read and one bus subscription serve all three connections
+    orchestrator.get_task_status.assert_called_once_with(task_id)
+    assert orchestrator.status_bus.subscriber_count(task_id) == 1
+    await subscriptions.publish(task_id, {"type": "task_update", "task_id": task_id})
+    await asyncio.sleep(0.01)
+    for websocket in (tab_one, tab_two, other_user):
+        assert websocket.send_text.call_count == 2
+    
+    # The watcher stops once the last subscriber leaves
+    watcher = subscriptions.watchers[task_id]
+    subscriptions.unsubscribe_all(tab_one)
+    subscriptions.unsubscribe_all(tab_two)
+    assert not watcher.cancelled()
+    subscriptions.unsubscribe_all(other_user)
+    await asyncio.sleep(0)
+    assert watcher.cancelled()
+    assert task_id not in subscriptions.watchers
+    assert orchestrator.status_bus.subscriber_count(task_id) == 0
+
+@pytest.mark.asyncio
+async def test_dropped_slow_consumer_gives_up_its_subscriptions():
+    manager = ConnectionManager(max_queue_size=1)
+    subscriptions = TaskSubscriptions(manager)
+    orchestrator = MagicMock()
+    orchestrator.status_bus = TaskStatusBus()
+    orchestrator.get_task_status = AsyncMock(return_value={"status": "in_progress"})
+    user_id = "test_user"
+    websocket, release, sent = await connect_blocked_socket(manager, user_id)
+    
+    subscriptions.subscribe(orchestrator, "a", websocket)
+    await asyncio.sleep(0.01)
+    watcher = subscriptions.watchers["a"]
+    
+    # Nothing queued can be superseded, so the result overflows the sender and the socket is dropped
+    await manager.send_status_update(user_id, {"type": "task_result", "task_id": "b", "result": {}})
+    await manager.send_status_update(user_id, {"type": "task_result", "task_id": "c", "result": {}})
+    await asyncio.sleep(0)
+    
+    assert websocket not in manager.senders
+    assert websocket not in subscriptions.tasks_by_connection
+    assert "a" not in subscriptions.subscribers
+    assert watcher.cancelled()
+    assert orchestrator.status_bus.subscriber_count("a") == 0
@@ -1,7 +1,10 @@
 
+# Run from the repository root, like the backend apps:
+#     uvicorn src.server.main:app    or    python -m src.server.main
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from routes.student_routes import router as student_router
+from backend.metrics import instrument_app
+from .routes.student_routes import router as student_router
 
 app = FastAPI()
 
@@ -15,6 +18,7 @@ app.add_middleware(
 )
 
 app.include_router(student_router, prefix="/api")
+instrument_app(app)
 
 if __name__ == "__main__":
     import uvicorn
@@ -1,7 +1,9 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
+from typing import List, Optional
 from datetime import datetime
-import time
+import os
+from backend.db.student_store import StudentStore, create_student_store, DEFAULT_DB_PATH, MAX_PAGE_SIZE
 
 router = APIRouter()
 
@@ -15,40 +17,85 @@ class Student(StudentCreate):
     id: int
     created_at: datetime
 
-students_db = {}
+class StudentBatchCreate(BaseModel):
+    students: List[StudentCreate]
+
+class StudentPage(BaseModel):
+    items: List[Student]
+    next_after: Optional[int] = None
+
+# Students live in a store shared by all workers; IDs are assigned by the store
+STUDENT_STORE_BACKEND = os.getenv("STUDENT_STORE_BACKEND", "sqlite")
+STUDENT_BATCH_LIMIT = 500
+
+student_store: Optional[StudentStore] = None
+
+def get_student_store() -> StudentStore:
+    """Build the student store on first use so importing the routes opens no database"""
+    global student_store
+    if student_store is None:
+        if STUDENT_STORE_BACKEND == "mongo":
+            from motor.motor_asyncio import AsyncIOMotorClient
+            mongo_client = AsyncIOMotorClient(os.environ["MONGODB_URI"])
+            student_store = create_student_store(
+                "mongo",
+                database=mongo_client[os.getenv("MONGODB_NAME", "geaux_academy")]
+            )
+        else:
+            student_store = create_student_store("sqlite", db_path=os.getenv("STUDENT_DB_PATH", DEFAULT_DB_PATH))
+    return student_store
 
 @router.post("/students", response_model=Student)
-async def create_student(student: StudentCreate):
+async def create_student(student: StudentCreate, student_store: StudentStore = Depends(get_student_store)):
     try:
-        new_student = Student(
-            id=int(time.time()),
-            name=student.name,
-            created_at=datetime.now()
-        )
-        students_db[new_student.id] = new_student
-        return new_student
-    except Exception as e:
+        return await student_store.create(student.name)
+    except Exception:
         raise HTTPException(status_code=500, detail="Failed to create student profile")
 
+@router.post("/students/batch", response_model=List[Student])
+async def create_students(batch: StudentBatchCreate, student_store: StudentStore = Depends(get_student_store)):
+    if len(batch.students) > STUDENT_BATCH_LIMIT:
+        raise HTTPException(status_code=400, detail=f"At most {STUDENT_BATCH_LIMIT} students per batch")
+    try:
+        return await student_store.create_many([student.name for student in batch.students])
+    except Exception:
+        raise HTTPException(status_code=500, detail="Failed to create student profiles")
+
+@router.get("/students/batch", response_model=List[Student])
+async def get_students(ids: List[int] = Query(...), student_store: StudentStore = Depends(get_student_store)):
+    if len(ids) > STUDENT_BATCH_LIMIT:
+        raise HTTPException(status_code=400, detail=f"At most {STUDENT_BATCH_LIMIT} IDs per batch")
+    return await student_store.get_many(ids)
+
+@router.get("/students", response_model=StudentPage)
+async def list_students(
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[int] = None,
+    student_store: StudentStore = Depends(get_student_store)
+):
+    items = await student_store.list(limit=limit, after_id=after)
+    return {"items": items, "next_after": items[-1]["id"] if len(items) == limit else None}
+
 @router.get("/students/{student_id}", response_model=Student)
-async def get_student(student_id: int):
-    student = students_db.get(student_id)
+async def get_student(student_id: int, student_store: StudentStore = Depends(get_student_store)):
+    student = await student_store.get(student_id)
     if not student:
         raise HTTPException(status_code=404, detail="Student not found")
     return student
 
 @router.put("/students/{student_id}", response_model=Student)
-async def update_student(student_id: int, student_update: StudentUpdate):
-    student = students_db.get(student_id)
+async def update_student(
+    student_id: int,
+    student_update: StudentUpdate,
+    student_store: StudentStore = Depends(get_student_store)
+):
+    student = await student_store.update(student_id, student_update.name)
     if not student:
         raise HTTPException(status_code=404, detail="Student not found")
-    updated_student = Student(id=student_id, name=student_update.name, created_at=student.created_at)
-    students_db[student_id] = updated_student
-    return updated_student
+    return student
 
 @router.delete("/students/{student_id}")
-async def delete_student(student_id: int):
-    student = students_db.pop(student_id, None)
-    if not student:
+async def delete_student(student_id: int, student_store: StudentStore = Depends(get_student_store)):
+    if not await student_store.delete(student_id):
         raise HTTPException(status_code=404, detail="Student not found")
     return {"detail": "Student deleted successfully"}